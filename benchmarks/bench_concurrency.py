@@ -0,0 +1,117 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrency benchmark for the MCP tools against a local fake gRPC server.
+
+Issues a burst of concurrent `list_cloud_controls` and `get_framework` tool
+calls and compares the wall time of the async client path with the previous
+behaviour, where each tool called a synchronous client and blocked the event
+loop for the whole round-trip.
+
+Run from the repository root with:
+    python benchmarks/bench_concurrency.py --calls 20 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import grpc
+from google.cloud.cloudsecuritycompliance_v1.services.config import ConfigClient
+from google.cloud.cloudsecuritycompliance_v1.services.config.transports import ConfigGrpcTransport
+from google.cloud.cloudsecuritycompliance_v1.types import GetFrameworkRequest, ListCloudControlsRequest
+from google.protobuf import json_format
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compliance_manager_mcp as server  # noqa: E402
+from fake_grpc_server import FakeComplianceBackend, FakeServerThread, make_clients  # noqa: E402
+
+ORGANIZATION_ID = "123456789012"
+
+
+def _tool_calls(count: int) -> list:
+    calls = []
+    for i in range(count):
+        if i % 2:
+            calls.append(("get_framework", {"organization_id": ORGANIZATION_ID, "framework_id": f"framework-{i % 10:03d}"}))
+        else:
+            calls.append(("list_cloud_controls", {"organization_id": ORGANIZATION_ID, "page_size": 100}))
+    return calls
+
+
+async def _run_async_tools(calls: list) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(server.mcp.call_tool(name, arguments) for name, arguments in calls))
+    return time.perf_counter() - start
+
+
+async def _run_blocking_tools(calls: list, address: str) -> float:
+    """Replays the calls the way the tools behaved with the synchronous client."""
+    client = ConfigClient(transport=ConfigGrpcTransport(channel=grpc.insecure_channel(address)))
+    parent = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+    async def blocking_tool(name: str, arguments: dict) -> None:
+        if name == "get_framework":
+            framework = client.get_framework(
+                request=GetFrameworkRequest(name=f"{parent}/frameworks/{arguments['framework_id']}")
+            )
+            json_format.MessageToDict(framework._pb)
+        else:
+            pager = client.list_cloud_controls(
+                request=ListCloudControlsRequest(parent=parent, page_size=arguments["page_size"])
+            )
+            [json_format.MessageToDict(control._pb) for control in pager]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(blocking_tool(name, arguments) for name, arguments in calls))
+    return time.perf_counter() - start
+
+
+async def main(calls: int, latency: float, cloud_controls: int) -> None:
+    backend = FakeComplianceBackend(organization_id=ORGANIZATION_ID, latency=latency, num_cloud_controls=cloud_controls)
+    fake_server = FakeServerThread(backend)
+    address = fake_server.start()
+    try:
+        config_client, deployment_client = make_clients(address)
+        server.clients.set("config", config_client)
+        server.clients.set("deployment", deployment_client)
+        tool_calls = _tool_calls(calls)
+
+        # Warm up channels so connection setup is not part of either measurement.
+        await _run_async_tools(tool_calls[:2])
+        await _run_blocking_tools(tool_calls[:2], address)
+
+        blocking = await _run_blocking_tools(tool_calls, address)
+        rpcs_before = backend.rpc_count
+        concurrent = await _run_async_tools(tool_calls)
+        rpcs = backend.rpc_count - rpcs_before
+
+        print(f"tool calls:         {calls} ({rpcs} RPCs, {latency * 1000:.0f} ms per RPC)")
+        print(f"blocking client:    {blocking:.3f} s")
+        print(f"async client:       {concurrent:.3f} s")
+        print(f"speedup:            {blocking / concurrent:.1f}x")
+    finally:
+        fake_server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20, help="Number of concurrent tool calls.")
+    parser.add_argument("--latency", type=float, default=0.2, help="Per-RPC latency of the fake server in seconds.")
+    parser.add_argument("--cloud-controls", type=int, default=200, help="Size of the fake cloud control catalog.")
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.latency, args.cloud_controls))
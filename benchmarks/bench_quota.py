@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Quota simulation harness for the client-side rate limiter and retry policy.
+
+Replaces the Config client with an in-process fake that enforces a per-second
+quota and fails a fraction of calls with UNAVAILABLE, then fires a burst of
+concurrent tool calls at it. Each scenario reports how many calls succeeded,
+the wall time, and the server's API call stats (retries, throttled time).
+Scenarios:
+
+  unprotected   no client-side limit and no retries (the previous behaviour)
+  retries       retries with backoff, but no client-side limit
+  limited       client-side rate limit at the quota, plus retries
+
+Run from the repository root with:
+    python benchmarks/bench_quota.py --calls 200 --quota 20 --unavailable 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+from google.api_core import exceptions as google_exceptions
+from google.cloud.cloudsecuritycompliance_v1.types import CloudControl, ListCloudControlsResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compliance_manager_mcp as server  # noqa: E402
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+
+class QuotaLimitedConfigClient:
+    """Fake Config client enforcing a per-method, per-second quota, like the real API's per-minute quotas."""
+
+    def __init__(self, quota_per_second: int, unavailable_rate: float, latency: float):
+        self.quota_per_second = quota_per_second
+        self.unavailable_rate = unavailable_rate
+        self.latency = latency
+        self.calls = 0
+        self.rejected = 0
+        self._windows = {}
+
+    async def _admit(self, method: str) -> None:
+        self.calls += 1
+        window, window_calls = self._windows.get(method, (0, 0))
+        if window != int(time.monotonic()):
+            window, window_calls = int(time.monotonic()), 0
+        self._windows[method] = (window, window_calls + 1)
+        if window_calls + 1 > self.quota_per_second:
+            self.rejected += 1
+            raise google_exceptions.ResourceExhausted("Quota exceeded for quota metric 'Read requests'.")
+        await asyncio.sleep(self.latency)
+        if random.random() < self.unavailable_rate:
+            self.rejected += 1
+            raise google_exceptions.ServiceUnavailable("The service is currently unavailable.")
+
+    async def get_cloud_control(self, request):
+        await self._admit("get_cloud_control")
+        return CloudControl(name=request.name, display_name=request.name.rsplit("/", 1)[-1])
+
+    async def list_cloud_controls(self, request):
+        await self._admit("list_cloud_controls")
+        controls = [CloudControl(name=f"{PARENT}/cloudControls/control-{i:05d}") for i in range(request.page_size)]
+        return ListCloudControlsResponse(cloud_controls=controls)
+
+
+async def run_scenario(name: str, policy: server.ApiCallPolicy, args: argparse.Namespace) -> None:
+    fake = QuotaLimitedConfigClient(args.quota, args.unavailable, args.latency)
+    server.api_policy = policy
+    server.clients.set("config", fake)
+    server.catalog_cache.invalidate("")
+
+    async def tool_call(i: int):
+        if i % 4 == 0:
+            return await server.list_cloud_controls(ORGANIZATION_ID, page_size=10, refresh=True)
+        return await server.get_cloud_control(ORGANIZATION_ID, f"control-{i:05d}", refresh=True)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(tool_call(i) for i in range(args.calls)))
+    elapsed = time.perf_counter() - start
+
+    succeeded = sum("error" not in result for result in results)
+    stats = policy.stats()
+    print(
+        f"{name:<12} {succeeded:>4}/{args.calls} ok  {elapsed:6.2f}s wall  {fake.calls:>4} RPCs"
+        f"  {fake.rejected:>4} rejected  {stats['retries']:>4} retries"
+        f"  {stats['throttled_seconds']:7.2f}s throttled  {stats['backoff_seconds']:7.2f}s backoff"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    unlimited = float(args.calls * 10)
+    scenarios = [
+        ("unprotected", server.ApiCallPolicy(default_rate=unlimited, max_retries=0)),
+        ("retries", server.ApiCallPolicy(default_rate=unlimited, max_retries=args.max_retries, initial_delay=0.5)),
+        (
+            "limited",
+            server.ApiCallPolicy(default_rate=args.quota * 0.9, max_retries=args.max_retries, initial_delay=0.5),
+        ),
+    ]
+    for name, policy in scenarios:
+        await run_scenario(name, policy, args)
+        await asyncio.sleep(1.0)  # Let the fake quota window reset between scenarios.
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="Concurrent tool calls per scenario.")
+    parser.add_argument("--quota", type=int, default=20, help="Fake API quota in calls per second per method.")
+    parser.add_argument("--unavailable", type=float, default=0.05, help="Fraction of calls failing with UNAVAILABLE.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fake API latency in seconds.")
+    parser.add_argument("--max-retries", type=int, default=8)
+    args = parser.parse_args()
+    logging.getLogger("compliance-manager-mcp").setLevel(logging.ERROR + 10)
+    asyncio.run(main(args))
@@ -0,0 +1,187 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark for proto-to-dict serialization.
+
+Converts realistic `CloudControl` and `FrameworkDeployment` payloads with
+`json_format.MessageToDict` (the previous path) and with the server's
+`proto_message_to_dict` in full, field-masked and compact modes, and checks
+that the full output is identical.
+
+Run from the repository root with:
+    python benchmarks/bench_serialization.py --items 2000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from google.cloud.cloudsecuritycompliance_v1.types import (
+    CELExpression,
+    CloudControl,
+    CloudControlDeploymentReference,
+    CloudControlDetails,
+    CloudControlMetadata,
+    DeploymentState,
+    EnforcementMode,
+    FrameworkDeployment,
+    FrameworkReference,
+    Parameter,
+    ParameterSpec,
+    ParamValue,
+    Rule,
+    Severity,
+    StringList,
+    TargetResourceConfig,
+)
+from google.protobuf import json_format, timestamp_pb2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import proto_serialization  # noqa: E402
+
+PARENT = "organizations/123456789012/locations/global"
+RESOURCE_TYPES = [
+    "storage.googleapis.com/Bucket",
+    "compute.googleapis.com/Instance",
+    "cloudsql.googleapis.com/Instance",
+    "iam.googleapis.com/ServiceAccountKey",
+]
+
+
+def make_cloud_control(i: int) -> CloudControl:
+    resource_type = RESOURCE_TYPES[i % len(RESOURCE_TYPES)]
+    return CloudControl(
+        name=f"{PARENT}/cloudControls/control-{i:05d}",
+        major_revision_id=3,
+        display_name=f"Require hardened configuration {i}",
+        description=f"Ensures that every {resource_type} resource follows hardening guideline {i}. " * 3,
+        supported_enforcement_modes=[EnforcementMode.PREVENTIVE, EnforcementMode.DETECTIVE],
+        parameter_spec=[
+            ParameterSpec(
+                name="allowed_regions",
+                display_name="Allowed regions",
+                description="Regions resources may be created in.",
+                is_required=True,
+                value_type=ParameterSpec.ValueType.STRINGLIST,
+                default_value=ParamValue(string_list_value=StringList(values=["us-central1", "europe-west1"])),
+            ),
+            ParameterSpec(
+                name="max_key_age_days",
+                display_name="Maximum key age",
+                value_type=ParameterSpec.ValueType.NUMBER,
+                default_value=ParamValue(number_value=90),
+            ),
+        ],
+        rules=[
+            Rule(
+                description="Resource must be compliant.",
+                cel_expression=CELExpression(
+                    expression=f"resource.location in params.allowed_regions && !resource.public_{i % 7}",
+                    resource_types_values=StringList(values=[resource_type]),
+                ),
+            )
+        ],
+        severity=Severity.HIGH if i % 3 else Severity.CRITICAL,
+        finding_category=f"HARDENING_{i % 11}",
+        supported_cloud_providers=[1],
+        related_frameworks=[f"{PARENT}/frameworks/cis-{i % 5}"],
+        remediation_steps="Update the resource configuration to follow the guideline. " * 2,
+        categories=[1, 2],
+        create_time=timestamp_pb2.Timestamp(seconds=1_700_000_000 + i),
+    )
+
+
+def make_framework_deployment(i: int, controls_per_deployment: int) -> FrameworkDeployment:
+    target = f"projects/project-{i:05d}"
+    return FrameworkDeployment(
+        name=f"{PARENT}/frameworkDeployments/deployment-{i:05d}",
+        target_resource_config=TargetResourceConfig(existing_target_resource=target),
+        computed_target_resource=target,
+        framework=FrameworkReference(framework=f"{PARENT}/frameworks/cis-{i % 5}", major_revision_id=2),
+        description="Baseline rollout",
+        cloud_control_metadata=[
+            CloudControlMetadata(
+                cloud_control_details=CloudControlDetails(
+                    name=f"{PARENT}/cloudControls/control-{j:05d}",
+                    major_revision_id=3,
+                    parameters=[
+                        Parameter(name="max_key_age_days", parameter_value=ParamValue(number_value=30 + j % 60))
+                    ],
+                ),
+                enforcement_mode=EnforcementMode.DETECTIVE,
+            )
+            for j in range(controls_per_deployment)
+        ],
+        deployment_state=DeploymentState.DEPLOYMENT_STATE_READY,
+        create_time=timestamp_pb2.Timestamp(seconds=1_700_000_000 + i),
+        update_time=timestamp_pb2.Timestamp(seconds=1_700_100_000 + i),
+        etag=f"etag-{i}",
+        target_resource_display_name=f"Project {i}",
+        cloud_control_deployment_references=[
+            CloudControlDeploymentReference(
+                cloud_control_deployment=f"{PARENT}/cloudControlDeployments/deployment-{i:05d}-{j:03d}"
+            )
+            for j in range(controls_per_deployment)
+        ],
+    )
+
+
+def _time(convert, messages: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in messages:
+            convert(message)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label: str, messages: list, fields: list, repeat: int) -> None:
+    mismatches = sum(
+        proto_serialization.proto_message_to_dict(message) != json_format.MessageToDict(message._pb)
+        for message in messages
+    )
+    baseline = _time(lambda message: json_format.MessageToDict(message._pb), messages, repeat)
+    cases = [
+        ("full", lambda message: proto_serialization.proto_message_to_dict(message)),
+        (f"fields={','.join(fields)}", lambda message: proto_serialization.proto_message_to_dict(message, fields)),
+        ("compact", lambda message: proto_serialization.proto_message_to_dict(message, compact=True)),
+    ]
+
+    print(f"\n{label}: {len(messages)} messages, best of {repeat}, {mismatches} mismatches with MessageToDict")
+    print(f"  {'MessageToDict':<40} {baseline * 1000:9.1f} ms")
+    for name, convert in cases:
+        elapsed = _time(convert, messages, repeat)
+        print(f"  {name:<40} {elapsed * 1000:9.1f} ms  {baseline / elapsed:5.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000, help="Number of cloud controls to serialize.")
+    parser.add_argument("--deployments", type=int, default=200, help="Number of framework deployments to serialize.")
+    parser.add_argument("--controls-per-deployment", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    controls = [make_cloud_control(i) for i in range(args.items)]
+    deployments = [make_framework_deployment(i, args.controls_per_deployment) for i in range(args.deployments)]
+
+    _report("CloudControl", controls, ["name", "displayName", "severity"], args.repeat)
+    _report("FrameworkDeployment", deployments, ["name", "deploymentState", "framework"], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Startup benchmark: time from process launch to the MCP `initialize` response.
+
+Launches the server over stdio the way Gemini CLI does, sends an `initialize`
+request and measures how long the response takes. With `--eager-imports` each
+run first imports the Google Cloud client libraries, approximating the old
+startup path where they were imported before the handshake.
+
+Run from the repository root with:
+    python benchmarks/bench_startup.py --runs 10 --eager-imports
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "compliance_manager_mcp.py")
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "1.0.0"},
+    },
+}
+
+EAGER_IMPORTS = (
+    "import runpy, sys;"
+    "import google.cloud.cloudsecuritycompliance_v1, google.cloud.resourcemanager_v3;"
+    "sys.argv = [sys.argv[1]];"
+    "runpy.run_path(sys.argv[0], run_name='__main__')"
+)
+
+
+def time_to_initialize(command: list) -> float:
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        process.stdin.write(json.dumps(INITIALIZE).encode() + b"\n")
+        process.stdin.flush()
+        response = json.loads(process.stdout.readline())
+        elapsed = time.perf_counter() - start
+        if response.get("id") != 1 or "result" not in response:
+            raise RuntimeError(f"Unexpected initialize response: {response}")
+        return elapsed
+    finally:
+        # Closing stdin ends the stdio session.
+        process.stdin.close()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def report(label: str, command: list, runs: int) -> None:
+    time_to_initialize(command)  # Warm the OS file cache and bytecode caches.
+    samples = sorted(time_to_initialize(command) for _ in range(runs))
+    print(
+        f"{label:<16} min {samples[0] * 1000:7.1f} ms   median {statistics.median(samples) * 1000:7.1f} ms"
+        f"   max {samples[-1] * 1000:7.1f} ms   ({runs} runs)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--eager-imports", action="store_true", help="Also measure startup with the client libraries imported up front."
+    )
+    args = parser.parse_args()
+
+    report("lazy (current)", [sys.executable, SERVER], args.runs)
+    if args.eager_imports:
+        report("eager imports", [sys.executable, "-c", EAGER_IMPORTS, SERVER], args.runs)
+
+
+if __name__ == "__main__":
+    main()
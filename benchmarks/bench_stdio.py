@@ -0,0 +1,329 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End-to-end benchmark: MCP tool calls over stdio against the local fake API.
+
+Starts the fake Compliance Manager API (fake_grpc_server.py) in-process, then
+launches the server the way an MCP client does, pointed at the fake through
+COMPLIANCE_MANAGER_EMULATOR_HOST, and drives each scenario's tool with
+concurrent `tools/call` requests. For every scenario it reports throughput,
+p50/p99 latency, failed calls and the server's resident memory high-water mark;
+startup is the time from process launch to the `initialize` response.
+
+Results can be written with `--json` and compared against an earlier run with
+`--baseline`, which exits non-zero when a number regresses by more than
+`--max-regression` or a scenario fails more calls than before, so changes can
+be gated on them. `--max-p99-ms`, `--min-throughput` and `--max-errors` gate
+every scenario on fixed thresholds instead, e.g. in CI without a baseline.
+
+Run from the repository root with:
+    python benchmarks/bench_stdio.py --calls 200 --concurrency 20 --latency 0.02
+    python benchmarks/bench_stdio.py --json before.json
+    python benchmarks/bench_stdio.py --baseline before.json --max-regression 0.2
+    python benchmarks/bench_stdio.py --max-p99-ms 250 --min-throughput 100 --max-errors 0
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import resource
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_grpc_server import FakeServerThread, add_backend_arguments, backend_from_arguments  # noqa: E402
+
+SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "compliance_manager_mcp.py")
+ORGANIZATION_ID = "123456789012"
+
+
+def scenarios(args: argparse.Namespace) -> Dict[str, Any]:
+    """Maps each scenario name to a function returning the tool name and arguments of its i-th call."""
+    controls, frameworks = max(args.cloud_controls, 1), max(args.frameworks, 1)
+    org = {"organization_id": ORGANIZATION_ID}
+    return {
+        "get_cloud_control": lambda i: ("get_cloud_control", {**org, "cloud_control_id": f"control-{i % controls:05d}"}),
+        "get_framework": lambda i: ("get_framework", {**org, "framework_id": f"framework-{i % frameworks:03d}"}),
+        "list_cloud_controls": lambda i: ("list_cloud_controls", {**org, "page_size": 100, "page_token": ""}),
+        "list_cloud_controls_all": lambda i: ("list_cloud_controls", {**org, "max_results": 0, "refresh": True}),
+        "search_cloud_controls": lambda i: ("search_cloud_controls", {**org, "query": f"configuration item {i % 97}"}),
+        "batch_get_cloud_controls": lambda i: (
+            "batch_get_cloud_controls",
+            {**org, "cloud_control_ids": [f"control-{(i * 25 + j) % controls:05d}" for j in range(25)]},
+        ),
+        "list_framework_deployments": lambda i: (
+            "list_framework_deployments",
+            {"parent": f"organizations/{ORGANIZATION_ID}", "max_results": 0},
+        ),
+        "detect_drift": lambda i: ("detect_drift", {"parent": f"organizations/{ORGANIZATION_ID}"}),
+    }
+
+
+DEFAULT_SCENARIOS = "get_cloud_control,get_framework,list_cloud_controls,search_cloud_controls,batch_get_cloud_controls"
+
+
+class StdioSession:
+    """Minimal MCP client speaking newline-delimited JSON-RPC to a server subprocess."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader = asyncio.create_task(self._read())
+
+    async def _read(self) -> None:
+        while line := await self.process.stdout.readline():
+            message = json.loads(line)
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        for future in self._pending.values():
+            future.set_exception(RuntimeError("The server closed its output."))
+
+    async def request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = next(self._ids)
+        future = self._pending[request_id] = asyncio.get_running_loop().create_future()
+        await self.notify(method, params, request_id)
+        return await future
+
+    async def notify(self, method: str, params: Dict[str, Any], request_id: Optional[int] = None) -> None:
+        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        if request_id is not None:
+            message["id"] = request_id
+        self.process.stdin.write(json.dumps(message).encode() + b"\n")
+        await self.process.stdin.drain()
+
+    async def close(self) -> None:
+        # Closing stdin ends the stdio session.
+        self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), 10)
+        except asyncio.TimeoutError:
+            self.process.kill()
+        self._reader.cancel()
+
+
+def memory_high_water_mb(pid: int) -> Optional[float]:
+    """Returns the peak resident set size of a running process, where /proc is available."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def is_error(response: Dict[str, Any]) -> bool:
+    """Tells whether a `tools/call` response failed, including tools returning an {"error": ...} result."""
+    result = response.get("result")
+    if result is None or result.get("isError"):
+        return True
+    structured = result.get("structuredContent") or {}
+    structured = structured.get("result", structured)  # Dictionary results are wrapped in {"result": ...}.
+    return isinstance(structured, dict) and "error" in structured
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    return samples[min(int(fraction * len(samples)), len(samples) - 1)] if samples else 0.0
+
+
+async def run_scenario(session: StdioSession, make_call, calls: int, concurrency: int) -> Dict[str, Any]:
+    name, arguments = make_call(0)
+    await session.request("tools/call", {"name": name, "arguments": arguments})  # Warm caches and channels.
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def call(i: int) -> None:
+        nonlocal errors
+        name, arguments = make_call(i)
+        async with semaphore:
+            start = time.perf_counter()
+            response = await session.request("tools/call", {"name": name, "arguments": arguments})
+            latencies.append(time.perf_counter() - start)
+        errors += is_error(response)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(calls)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "calls": calls,
+        "errors": errors,
+        "throughput_per_second": round(calls / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "memory_high_water_mb": memory_high_water_mb(session.process.pid),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    env = dict(
+        os.environ,
+        COMPLIANCE_MANAGER_EMULATOR_HOST=args.address,
+        COMPLIANCE_MANAGER_RATE_LIMIT_QPS=str(args.rate_limit_qps),
+    )
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        SERVER,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=env,
+        limit=1 << 28,
+    )
+    session = StdioSession(process)
+    results: Dict[str, Any] = {}
+    try:
+        initialize = await session.request(
+            "initialize",
+            {
+                "protocolVersion": "2025-03-26",
+                "capabilities": {},
+                "clientInfo": {"name": "bench-stdio", "version": "1.0.0"},
+            },
+        )
+        results["startup_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        if "result" not in initialize:
+            raise RuntimeError(f"Unexpected initialize response: {initialize}")
+        await session.notify("notifications/initialized", {})
+
+        available = scenarios(args)
+        results["scenarios"] = {}
+        for name in args.scenarios.split(","):
+            results["scenarios"][name] = await run_scenario(session, available[name], args.calls, args.concurrency)
+        results["memory_high_water_mb"] = memory_high_water_mb(process.pid)
+    finally:
+        await session.close()
+    if results.get("memory_high_water_mb") is None:
+        # Without /proc, fall back to the peak of all terminated children (kilobytes on Linux, bytes on macOS).
+        peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        results["memory_high_water_mb"] = peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return results
+
+
+# Numbers compared against a baseline; throughput regresses when it drops, the rest when they grow.
+GATED = {"throughput_per_second": -1, "p50_ms": 1, "p99_ms": 1}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Returns a description of every number that regressed by more than `max_regression` against the baseline."""
+    checks = [("startup_ms", results.get("startup_ms"), baseline.get("startup_ms"), 1)]
+    checks.append(("memory_high_water_mb", results.get("memory_high_water_mb"), baseline.get("memory_high_water_mb"), 1))
+    for scenario, numbers in results.get("scenarios", {}).items():
+        before = baseline.get("scenarios", {}).get(scenario, {})
+        for key, direction in GATED.items():
+            checks.append((f"{scenario}.{key}", numbers.get(key), before.get(key), direction))
+
+    regressions = []
+    for scenario, numbers in results.get("scenarios", {}).items():
+        before = baseline.get("scenarios", {}).get(scenario, {})
+        # Failed calls are gated on their count: any increase, including from zero, is a regression.
+        if "errors" in before and numbers.get("errors", 0) > before["errors"]:
+            regressions.append(f"{scenario}.errors: {before['errors']} -> {numbers['errors']}")
+    for label, now, then, direction in checks:
+        if not now or not then:
+            continue
+        change = (now - then) / then
+        if change * direction > max_regression:
+            regressions.append(f"{label}: {then} -> {now} ({change:+.0%})")
+    return regressions
+
+
+def check_thresholds(
+    results: Dict[str, Any],
+    max_p99_ms: Optional[float] = None,
+    min_throughput: Optional[float] = None,
+    max_errors: Optional[int] = None,
+) -> List[str]:
+    """Returns a description of every scenario number outside the given fixed thresholds."""
+    violations = []
+    for scenario, numbers in results.get("scenarios", {}).items():
+        if max_p99_ms is not None and numbers["p99_ms"] > max_p99_ms:
+            violations.append(f"{scenario}.p99_ms: {numbers['p99_ms']} > {max_p99_ms}")
+        if min_throughput is not None and numbers["throughput_per_second"] < min_throughput:
+            throughput = numbers["throughput_per_second"]
+            violations.append(f"{scenario}.throughput_per_second: {throughput} < {min_throughput}")
+        if max_errors is not None and numbers["errors"] > max_errors:
+            violations.append(f"{scenario}.errors: {numbers['errors']} > {max_errors}")
+    return violations
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    print(f"startup {results['startup_ms']:.1f} ms   memory high-water {results['memory_high_water_mb']:.1f} MB")
+    print(f"{'scenario':<28} {'calls/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7} {'HWM MB':>8}")
+    for name, numbers in results["scenarios"].items():
+        memory = numbers["memory_high_water_mb"]
+        print(
+            f"{name:<28} {numbers['throughput_per_second']:>9.1f} {numbers['p50_ms']:>9.1f} {numbers['p99_ms']:>9.1f}"
+            f" {numbers['errors']:>7} {memory if memory is not None else float('nan'):>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="Tool calls per scenario.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Tool calls in flight at once.")
+    parser.add_argument("--scenarios", default=DEFAULT_SCENARIOS, help="Comma-separated scenarios to run.")
+    parser.add_argument("--rate-limit-qps", type=float, default=1000, help="Server-side client rate limit per method.")
+    parser.add_argument("--json", default="", help="Write the results to this file.")
+    parser.add_argument("--baseline", default="", help="Compare against results written earlier with --json.")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed regression against the baseline.")
+    parser.add_argument(
+        "--max-p99-ms", type=float, default=None, help="Fail if any scenario's p99 latency exceeds this."
+    )
+    parser.add_argument(
+        "--min-throughput", type=float, default=None, help="Fail if any scenario's calls per second drop below this."
+    )
+    parser.add_argument("--max-errors", type=int, default=None, help="Fail if any scenario has more failed calls.")
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    unknown = set(args.scenarios.split(",")) - set(scenarios(args))
+    if unknown:
+        parser.error(f"unknown scenarios {sorted(unknown)}; choose from {sorted(scenarios(args))}")
+
+    backend = backend_from_arguments(args, organization_id=ORGANIZATION_ID)
+    fake_server = FakeServerThread(backend)
+    args.address = fake_server.start()
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        fake_server.stop()
+    results["fake_api"] = {"rpcs": backend.rpc_count, "injected_errors": backend.injected_errors}
+
+    print_results(results)
+    print(f"fake API served {backend.rpc_count} RPCs ({backend.injected_errors} injected errors)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump(results, out, indent=2)
+    regressions = check_thresholds(results, args.max_p99_ms, args.min_throughput, args.max_errors)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            regressions += compare(results, json.load(baseline_file), args.max_regression)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
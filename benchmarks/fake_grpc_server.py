@@ -0,0 +1,581 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local fake of the Compliance Manager and Resource Manager gRPC services.
+
+Serves an in-memory catalog of frameworks, cloud controls and deployments, and a
+folder and project hierarchy, over an insecure localhost channel, so the MCP
+tools can be exercised and benchmarked without a live Google Cloud organization.
+Per-RPC latency (with jitter), page size limits, catalog sizes and the rate of
+injected errors are configurable.
+
+Run standalone with:
+    python benchmarks/fake_grpc_server.py --port 50051 --latency 0.2 --error-rate 0.01
+
+and point the server at it with:
+    COMPLIANCE_MANAGER_EMULATOR_HOST=127.0.0.1:50051 python compliance_manager_mcp.py
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import threading
+from typing import Dict, Tuple
+
+import grpc
+from google.cloud.cloudsecuritycompliance_v1.services.config import ConfigAsyncClient
+from google.cloud.cloudsecuritycompliance_v1.services.config.transports import ConfigGrpcAsyncIOTransport
+from google.cloud.cloudsecuritycompliance_v1.services.deployment import DeploymentAsyncClient
+from google.cloud.cloudsecuritycompliance_v1.services.deployment.transports import DeploymentGrpcAsyncIOTransport
+from google.cloud.cloudsecuritycompliance_v1.types import (
+    CloudControl,
+    CloudControlDeployment,
+    CloudControlDetails,
+    CloudControlMetadata,
+    CreateCloudControlRequest,
+    CreateFrameworkDeploymentRequest,
+    CreateFrameworkRequest,
+    DeleteFrameworkDeploymentRequest,
+    DeploymentState,
+    EnforcementMode,
+    Framework,
+    FrameworkDeployment,
+    GetCloudControlDeploymentRequest,
+    GetCloudControlRequest,
+    GetFrameworkDeploymentRequest,
+    GetFrameworkRequest,
+    ListCloudControlDeploymentsRequest,
+    ListCloudControlDeploymentsResponse,
+    ListCloudControlsRequest,
+    ListCloudControlsResponse,
+    ListFrameworkDeploymentsRequest,
+    ListFrameworkDeploymentsResponse,
+    ListFrameworksRequest,
+    ListFrameworksResponse,
+    Rule,
+    CELExpression,
+    Severity,
+    UpdateCloudControlRequest,
+    UpdateFrameworkRequest,
+)
+from google.cloud.resourcemanager_v3.types import (
+    Folder,
+    ListFoldersRequest,
+    ListFoldersResponse,
+    ListProjectsRequest,
+    ListProjectsResponse,
+    Project,
+)
+from google.longrunning import operations_pb2
+
+CONFIG_SERVICE = "google.cloud.cloudsecuritycompliance.v1.Config"
+DEPLOYMENT_SERVICE = "google.cloud.cloudsecuritycompliance.v1.Deployment"
+OPERATIONS_SERVICE = "google.longrunning.Operations"
+FOLDERS_SERVICE = "google.cloud.resourcemanager.v3.Folders"
+PROJECTS_SERVICE = "google.cloud.resourcemanager.v3.Projects"
+
+RESOURCE_TYPES = [
+    "compute.googleapis.com/Instance",
+    "storage.googleapis.com/Bucket",
+    "sqladmin.googleapis.com/Instance",
+    "cloudkms.googleapis.com/CryptoKey",
+]
+SEVERITIES = [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]
+
+
+class FakeComplianceBackend:
+    """In-memory state and RPC handlers for the fake Compliance Manager API."""
+
+    def __init__(
+        self,
+        organization_id: str = "123456789012",
+        location: str = "global",
+        num_frameworks: int = 20,
+        num_cloud_controls: int = 500,
+        controls_per_framework: int = 40,
+        latency: float = 0.05,
+        operation_polls: int = 1,
+        latency_jitter: float = 0.0,
+        default_page_size: int = 50,
+        max_page_size: int = 0,
+        error_rate: float = 0.0,
+        error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        num_folders: int = 0,
+        projects_per_folder: int = 0,
+        num_framework_deployments: int = 0,
+        seed: int = 0,
+    ):
+        """Builds the catalog.
+
+        `latency_jitter` spreads each RPC's latency uniformly over
+        latency * (1 +/- jitter). `max_page_size` caps the page size of list
+        calls (0 for no cap), like the real API does. A fraction `error_rate` of
+        RPCs fail with `error_code` after their latency. `num_folders` folders
+        each holding `projects_per_folder` projects (plus as many directly under
+        the organization) make up the resource hierarchy, and
+        `num_framework_deployments` deployments of the frameworks onto those
+        projects are created up front.
+        """
+        self.organization = f"organizations/{organization_id}"
+        self.parent = f"{self.organization}/locations/{location}"
+        self.latency = latency
+        self.operation_polls = operation_polls
+        self.latency_jitter = latency_jitter
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.cloud_controls: Dict[str, CloudControl] = {}
+        self.frameworks: Dict[str, Framework] = {}
+        self.framework_deployments: Dict[str, FrameworkDeployment] = {}
+        self.cloud_control_deployments: Dict[str, CloudControlDeployment] = {}
+        self.operations: Dict[str, list] = {}
+        self.folders: Dict[str, Folder] = {}
+        self.projects: Dict[str, Project] = {}
+        self.rpc_count = 0
+        self.injected_errors = 0
+        self._operation_ids = itertools.count(1)
+        self._random = random.Random(seed)
+
+        for i in range(num_cloud_controls):
+            name = f"{self.parent}/cloudControls/control-{i:05d}"
+            resource_type = RESOURCE_TYPES[i % len(RESOURCE_TYPES)]
+            self.cloud_controls[name] = CloudControl(
+                name=name,
+                major_revision_id=1 + i % 3,
+                display_name=f"Control {i}",
+                description=f"Checks configuration item {i} on {resource_type}.",
+                severity=SEVERITIES[i % len(SEVERITIES)],
+                supported_enforcement_modes=[EnforcementMode.DETECTIVE],
+                categories=[],
+                rules=[
+                    Rule(
+                        cel_expression=CELExpression(
+                            expression=f"has(resource.data.setting{i}) && resource.data.setting{i}",
+                            resource_types_values={"values": [resource_type]},
+                        ),
+                        description=f"Rule for control {i}",
+                    )
+                ],
+            )
+
+        control_names = list(self.cloud_controls)
+        for i in range(num_frameworks):
+            name = f"{self.parent}/frameworks/framework-{i:03d}"
+            start = (i * controls_per_framework) % max(len(control_names), 1)
+            members = (control_names[start:] + control_names[:start])[:controls_per_framework]
+            self.frameworks[name] = Framework(
+                name=name,
+                major_revision_id=1,
+                type_=Framework.FrameworkType.BUILT_IN,
+                display_name=f"Framework {i}",
+                description=f"Fake framework {i}",
+                cloud_control_details=[
+                    CloudControlDetails(
+                        name=control,
+                        major_revision_id=self.cloud_controls[control].major_revision_id,
+                    )
+                    for control in members
+                ],
+            )
+
+        parents = [self.organization]
+        for i in range(num_folders):
+            name = f"folders/{100000 + i}"
+            self.folders[name] = Folder(
+                name=name, parent=self.organization, display_name=f"Folder {i}", state=Folder.State.ACTIVE
+            )
+            parents.append(name)
+        for parent in parents if projects_per_folder else []:
+            for _ in range(projects_per_folder):
+                number = 200000 + len(self.projects)
+                name = f"projects/{number}"
+                self.projects[name] = Project(
+                    name=name, parent=parent, project_id=f"project-{number}", state=Project.State.ACTIVE
+                )
+
+        framework_names = list(self.frameworks)
+        targets = list(self.projects) or [self.organization]
+        for i in range(num_framework_deployments if framework_names else 0):
+            framework = self.frameworks[framework_names[i % len(framework_names)]]
+            self._add_framework_deployment(
+                self.parent,
+                f"deployment-{i:05d}",
+                FrameworkDeployment(
+                    target_resource_config={"existing_target_resource": targets[i % len(targets)]},
+                    framework={"framework": framework.name, "major_revision_id": framework.major_revision_id},
+                    cloud_control_metadata=[
+                        CloudControlMetadata(cloud_control_details=details, enforcement_mode=EnforcementMode.DETECTIVE)
+                        for details in framework.cloud_control_details
+                    ],
+                ),
+            )
+
+    # --- Helpers ---
+
+    async def _simulate(self, context: grpc.aio.ServicerContext) -> None:
+        self.rpc_count += 1
+        if self.latency:
+            jitter = self._random.uniform(-self.latency_jitter, self.latency_jitter) if self.latency_jitter else 0.0
+            await asyncio.sleep(max(self.latency * (1 + jitter), 0.0))
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.injected_errors += 1
+            await context.abort(self.error_code, "Injected error from the fake Compliance Manager API.")
+
+    def _page(self, items: list, page_size: int, page_token: str) -> Tuple[list, str]:
+        start = int(page_token) if page_token else 0
+        page_size = page_size or self.default_page_size
+        if self.max_page_size:
+            page_size = min(page_size, self.max_page_size)
+        end = start + page_size
+        next_token = str(end) if end < len(items) else ""
+        return items[start:end], next_token
+
+    @staticmethod
+    def _parent_of(name: str, collection: str) -> str:
+        return name.split(f"/{collection}/")[0]
+
+    async def _get(self, store: dict, name: str, context: grpc.aio.ServicerContext):
+        await self._simulate(context)
+        if name not in store:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"Resource '{name}' was not found.")
+        return store[name]
+
+    def _add_framework_deployment(
+        self, parent: str, deployment_id: str, deployment: FrameworkDeployment
+    ) -> FrameworkDeployment:
+        deployment.name = f"{parent}/frameworkDeployments/{deployment_id}"
+        deployment.deployment_state = DeploymentState.DEPLOYMENT_STATE_READY
+        deployment.computed_target_resource = deployment.target_resource_config.existing_target_resource
+        self.framework_deployments[deployment.name] = deployment
+        for metadata in deployment.cloud_control_metadata:
+            control_id = metadata.cloud_control_details.name.rsplit("/", 1)[-1]
+            control_deployment_name = f"{parent}/cloudControlDeployments/{deployment_id}-{control_id}"
+            self.cloud_control_deployments[control_deployment_name] = CloudControlDeployment(
+                name=control_deployment_name,
+                target_resource=deployment.computed_target_resource,
+                cloud_control_metadata=CloudControlMetadata(metadata),
+                deployment_state=DeploymentState.DEPLOYMENT_STATE_READY,
+            )
+        return deployment
+
+    def _new_operation(self, target: str, response=None) -> operations_pb2.Operation:
+        name = f"{self.parent}/operations/operation-{next(self._operation_ids)}"
+        done = operations_pb2.Operation(name=name, done=True)
+        if response is not None:
+            done.response.Pack(type(response).pb(response))
+        pending = [operations_pb2.Operation(name=name, done=False)] * self.operation_polls
+        self.operations[name] = pending + [done]
+        return operations_pb2.Operation(name=name, done=False)
+
+    # --- Config service ---
+
+    async def list_frameworks(self, request: ListFrameworksRequest, context) -> ListFrameworksResponse:
+        await self._simulate(context)
+        items = [f for n, f in self.frameworks.items() if n.startswith(request.parent + "/")]
+        page, token = self._page(items, request.page_size, request.page_token)
+        return ListFrameworksResponse(frameworks=page, next_page_token=token)
+
+    async def get_framework(self, request: GetFrameworkRequest, context) -> Framework:
+        return await self._get(self.frameworks, request.name, context)
+
+    async def create_framework(self, request: CreateFrameworkRequest, context) -> Framework:
+        await self._simulate(context)
+        name = f"{request.parent}/frameworks/{request.framework_id}"
+        if name in self.frameworks:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, f"Framework '{name}' already exists.")
+        framework = Framework(request.framework)
+        framework.name = name
+        framework.major_revision_id = 1
+        framework.type_ = Framework.FrameworkType.CUSTOM
+        self.frameworks[name] = framework
+        return framework
+
+    async def update_framework(self, request: UpdateFrameworkRequest, context) -> Framework:
+        framework = await self._get(self.frameworks, request.framework.name, context)
+        updated = self._update(framework, request.framework, request.update_mask)
+        self.frameworks[updated.name] = updated
+        return updated
+
+    async def list_cloud_controls(self, request: ListCloudControlsRequest, context) -> ListCloudControlsResponse:
+        await self._simulate(context)
+        items = [c for n, c in self.cloud_controls.items() if n.startswith(request.parent + "/")]
+        page, token = self._page(items, request.page_size, request.page_token)
+        return ListCloudControlsResponse(cloud_controls=page, next_page_token=token)
+
+    async def get_cloud_control(self, request: GetCloudControlRequest, context) -> CloudControl:
+        return await self._get(self.cloud_controls, request.name, context)
+
+    async def create_cloud_control(self, request: CreateCloudControlRequest, context) -> CloudControl:
+        await self._simulate(context)
+        name = f"{request.parent}/cloudControls/{request.cloud_control_id}"
+        if name in self.cloud_controls:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, f"Cloud control '{name}' already exists.")
+        control = CloudControl(request.cloud_control)
+        control.name = name
+        control.major_revision_id = 1
+        self.cloud_controls[name] = control
+        return control
+
+    async def update_cloud_control(self, request: UpdateCloudControlRequest, context) -> CloudControl:
+        control = await self._get(self.cloud_controls, request.cloud_control.name, context)
+        updated = self._update(control, request.cloud_control, request.update_mask)
+        self.cloud_controls[updated.name] = updated
+        return updated
+
+    @staticmethod
+    def _update(current, patch, mask):
+        """Copies the masked fields of `patch` onto a copy of `current` and bumps its revision."""
+        updated = type(current).pb()()
+        updated.CopyFrom(type(current).pb(current))
+        mask.MergeMessage(type(patch).pb(patch), updated, replace_message_field=True, replace_repeated_field=True)
+        updated.major_revision_id += 1
+        return type(current).wrap(updated)
+
+    # --- Deployment service ---
+
+    async def list_framework_deployments(
+        self, request: ListFrameworkDeploymentsRequest, context
+    ) -> ListFrameworkDeploymentsResponse:
+        await self._simulate(context)
+        items = [d for n, d in self.framework_deployments.items() if n.startswith(request.parent + "/")]
+        page, token = self._page(items, request.page_size, request.page_token)
+        return ListFrameworkDeploymentsResponse(framework_deployments=page, next_page_token=token)
+
+    async def get_framework_deployment(self, request: GetFrameworkDeploymentRequest, context) -> FrameworkDeployment:
+        return await self._get(self.framework_deployments, request.name, context)
+
+    async def create_framework_deployment(
+        self, request: CreateFrameworkDeploymentRequest, context
+    ) -> operations_pb2.Operation:
+        await self._simulate(context)
+        name = f"{request.parent}/frameworkDeployments/{request.framework_deployment_id}"
+        if name in self.framework_deployments:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, f"Framework deployment '{name}' already exists.")
+        if request.framework_deployment.framework.framework not in self.frameworks:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "Framework was not found.")
+        deployment = self._add_framework_deployment(
+            request.parent, request.framework_deployment_id, FrameworkDeployment(request.framework_deployment)
+        )
+        return self._new_operation(name, deployment)
+
+    async def delete_framework_deployment(
+        self, request: DeleteFrameworkDeploymentRequest, context
+    ) -> operations_pb2.Operation:
+        deployment = await self._get(self.framework_deployments, request.name, context)
+        del self.framework_deployments[deployment.name]
+        prefix = deployment.name.replace("/frameworkDeployments/", "/cloudControlDeployments/") + "-"
+        for name in [n for n in self.cloud_control_deployments if n.startswith(prefix)]:
+            del self.cloud_control_deployments[name]
+        return self._new_operation(request.name)
+
+    async def list_cloud_control_deployments(
+        self, request: ListCloudControlDeploymentsRequest, context
+    ) -> ListCloudControlDeploymentsResponse:
+        await self._simulate(context)
+        items = [d for n, d in self.cloud_control_deployments.items() if n.startswith(request.parent + "/")]
+        page, token = self._page(items, request.page_size, request.page_token)
+        return ListCloudControlDeploymentsResponse(cloud_control_deployments=page, next_page_token=token)
+
+    async def get_cloud_control_deployment(
+        self, request: GetCloudControlDeploymentRequest, context
+    ) -> CloudControlDeployment:
+        return await self._get(self.cloud_control_deployments, request.name, context)
+
+    # --- Resource Manager services ---
+
+    async def list_folders(self, request: ListFoldersRequest, context) -> ListFoldersResponse:
+        await self._simulate(context)
+        items = [f for f in self.folders.values() if f.parent == request.parent]
+        page, token = self._page(items, request.page_size, request.page_token)
+        return ListFoldersResponse(folders=page, next_page_token=token)
+
+    async def list_projects(self, request: ListProjectsRequest, context) -> ListProjectsResponse:
+        await self._simulate(context)
+        items = [p for p in self.projects.values() if p.parent == request.parent]
+        page, token = self._page(items, request.page_size, request.page_token)
+        return ListProjectsResponse(projects=page, next_page_token=token)
+
+    # --- Operations service ---
+
+    async def get_operation(self, request: operations_pb2.GetOperationRequest, context) -> operations_pb2.Operation:
+        await self._simulate(context)
+        states = self.operations.get(request.name)
+        if not states:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"Operation '{request.name}' was not found.")
+        return states.pop(0) if len(states) > 1 else states[0]
+
+    # --- Wiring ---
+
+    def handlers(self) -> list:
+        def proto_plus(handler, request_type, response_type):
+            return grpc.unary_unary_rpc_method_handler(
+                handler,
+                request_deserializer=request_type.deserialize,
+                response_serializer=response_type.serialize,
+            )
+
+        def lro(handler, request_type):
+            return grpc.unary_unary_rpc_method_handler(
+                handler,
+                request_deserializer=request_type.deserialize,
+                response_serializer=operations_pb2.Operation.SerializeToString,
+            )
+
+        operations = {
+            "GetOperation": grpc.unary_unary_rpc_method_handler(
+                self.get_operation,
+                request_deserializer=operations_pb2.GetOperationRequest.FromString,
+                response_serializer=operations_pb2.Operation.SerializeToString,
+            ),
+        }
+        config = {
+            "ListFrameworks": proto_plus(self.list_frameworks, ListFrameworksRequest, ListFrameworksResponse),
+            "GetFramework": proto_plus(self.get_framework, GetFrameworkRequest, Framework),
+            "CreateFramework": proto_plus(self.create_framework, CreateFrameworkRequest, Framework),
+            "UpdateFramework": proto_plus(self.update_framework, UpdateFrameworkRequest, Framework),
+            "ListCloudControls": proto_plus(self.list_cloud_controls, ListCloudControlsRequest, ListCloudControlsResponse),
+            "GetCloudControl": proto_plus(self.get_cloud_control, GetCloudControlRequest, CloudControl),
+            "CreateCloudControl": proto_plus(self.create_cloud_control, CreateCloudControlRequest, CloudControl),
+            "UpdateCloudControl": proto_plus(self.update_cloud_control, UpdateCloudControlRequest, CloudControl),
+        }
+        deployment = {
+            "ListFrameworkDeployments": proto_plus(
+                self.list_framework_deployments, ListFrameworkDeploymentsRequest, ListFrameworkDeploymentsResponse
+            ),
+            "GetFrameworkDeployment": proto_plus(
+                self.get_framework_deployment, GetFrameworkDeploymentRequest, FrameworkDeployment
+            ),
+            "CreateFrameworkDeployment": lro(self.create_framework_deployment, CreateFrameworkDeploymentRequest),
+            "DeleteFrameworkDeployment": lro(self.delete_framework_deployment, DeleteFrameworkDeploymentRequest),
+            "ListCloudControlDeployments": proto_plus(
+                self.list_cloud_control_deployments,
+                ListCloudControlDeploymentsRequest,
+                ListCloudControlDeploymentsResponse,
+            ),
+            "GetCloudControlDeployment": proto_plus(
+                self.get_cloud_control_deployment, GetCloudControlDeploymentRequest, CloudControlDeployment
+            ),
+        }
+        folders = {"ListFolders": proto_plus(self.list_folders, ListFoldersRequest, ListFoldersResponse)}
+        projects = {"ListProjects": proto_plus(self.list_projects, ListProjectsRequest, ListProjectsResponse)}
+        return [
+            grpc.method_handlers_generic_handler(CONFIG_SERVICE, config),
+            grpc.method_handlers_generic_handler(DEPLOYMENT_SERVICE, deployment),
+            grpc.method_handlers_generic_handler(OPERATIONS_SERVICE, operations),
+            grpc.method_handlers_generic_handler(FOLDERS_SERVICE, folders),
+            grpc.method_handlers_generic_handler(PROJECTS_SERVICE, projects),
+        ]
+
+
+async def start_fake_server(backend: FakeComplianceBackend, port: int = 0) -> Tuple[grpc.aio.Server, str]:
+    """Starts the fake API on localhost and returns the server and its address."""
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers(backend.handlers())
+    bound_port = server.add_insecure_port(f"127.0.0.1:{port}")
+    await server.start()
+    return server, f"127.0.0.1:{bound_port}"
+
+
+class FakeServerThread:
+    """Runs the fake API on a dedicated event loop thread.
+
+    Keeping the server off the caller's loop means a client that blocks that
+    loop (for example a synchronous client called from a coroutine) still gets
+    its responses.
+    """
+
+    def __init__(self, backend: FakeComplianceBackend, port: int = 0):
+        self.backend = backend
+        self.port = port
+        self.address = ""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server = None
+
+    def start(self) -> str:
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(start_fake_server(self.backend, self.port), self._loop)
+        self._server, self.address = future.result()
+        return self.address
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._server.stop(None), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def make_clients(address: str) -> Tuple[ConfigAsyncClient, DeploymentAsyncClient]:
+    """Builds async API clients that talk to the fake server over an insecure channel."""
+    config_client = ConfigAsyncClient(
+        transport=ConfigGrpcAsyncIOTransport(channel=grpc.aio.insecure_channel(address))
+    )
+    deployment_client = DeploymentAsyncClient(
+        transport=DeploymentGrpcAsyncIOTransport(channel=grpc.aio.insecure_channel(address))
+    )
+    return config_client, deployment_client
+
+
+def add_backend_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the command line flags that configure a FakeComplianceBackend."""
+    group = parser.add_argument_group("fake API")
+    group.add_argument("--latency", type=float, default=0.05, help="Per-RPC latency in seconds.")
+    group.add_argument("--latency-jitter", type=float, default=0.0, help="Latency spread as a fraction, e.g. 0.5.")
+    group.add_argument("--cloud-controls", type=int, default=500)
+    group.add_argument("--frameworks", type=int, default=20)
+    group.add_argument("--controls-per-framework", type=int, default=40)
+    group.add_argument("--framework-deployments", type=int, default=0, help="Deployments created up front.")
+    group.add_argument("--folders", type=int, default=0)
+    group.add_argument("--projects-per-folder", type=int, default=0)
+    group.add_argument("--default-page-size", type=int, default=50)
+    group.add_argument("--max-page-size", type=int, default=0, help="Cap on list page sizes (0 for none).")
+    group.add_argument("--error-rate", type=float, default=0.0, help="Fraction of RPCs failing with --error-code.")
+    group.add_argument(
+        "--error-code", default="UNAVAILABLE", choices=[code.name for code in grpc.StatusCode if code.name != "OK"]
+    )
+    group.add_argument("--seed", type=int, default=0, help="Seed for latency jitter and error injection.")
+
+
+def backend_from_arguments(args: argparse.Namespace, organization_id: str = "123456789012") -> FakeComplianceBackend:
+    return FakeComplianceBackend(
+        organization_id=organization_id,
+        num_frameworks=args.frameworks,
+        num_cloud_controls=args.cloud_controls,
+        controls_per_framework=args.controls_per_framework,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        default_page_size=args.default_page_size,
+        max_page_size=args.max_page_size,
+        error_rate=args.error_rate,
+        error_code=grpc.StatusCode[args.error_code],
+        num_folders=args.folders,
+        projects_per_folder=args.projects_per_folder,
+        num_framework_deployments=args.framework_deployments,
+        seed=args.seed,
+    )
+
+
+async def _serve(port: int, backend: FakeComplianceBackend) -> None:
+    server, address = await start_fake_server(backend, port)
+    print(f"Fake Compliance Manager API listening on {address} (parent: {backend.parent})")
+    await server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=50051)
+    add_backend_arguments(parser)
+    args = parser.parse_args()
+    asyncio.run(_serve(args.port, backend_from_arguments(args)))
@@ -0,0 +1,189 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local evaluation of cloud control CEL expressions over Cloud Asset Inventory exports.
+
+dry_run_cloud_control evaluates a cloud control's CEL expression over a local
+export instead of deploying it and waiting for findings. The export is streamed
+from disk in chunks, so memory stays flat however many assets it holds, and
+chunks are evaluated by a pool of worker processes (CEL evaluation is pure
+Python and CPU-bound). The workers are spawned and only import this module, so
+they stay small. Each process compiles an expression once and keeps the program
+cached. The CEL engine (cel-python) is an optional dependency.
+"""
+
+import concurrent.futures
+import functools
+import json
+import multiprocessing
+import os
+from typing import Any, Dict, Iterator, Optional
+
+DRY_RUN_CHUNK_SIZE = 1000
+DRY_RUN_INLINE_BYTES = 16 * 1024 * 1024  # Smaller exports are evaluated in-process.
+DRY_RUN_MAX_WORKERS = 8
+
+
+def default_cel_workers() -> int:
+    """Returns the worker pool size: COMPLIANCE_MANAGER_CEL_WORKERS, or one process per usable CPU (at most 8)."""
+    configured = os.environ.get("COMPLIANCE_MANAGER_CEL_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    return min(cpus, DRY_RUN_MAX_WORKERS)
+
+
+# The pool is sized once, at import, and never resized: a dry run can still be
+# submitting chunks to it while another one starts.
+CEL_WORKERS = default_cel_workers()
+
+_cel_environment: Optional[Any] = None
+_cel_worker_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+@functools.lru_cache(maxsize=256)
+def compiled_cel_program(expression: str) -> Any:
+    """Compiles a CEL expression, caching the program. Raises celpy.CELParseError if it is invalid."""
+    global _cel_environment
+    import celpy
+
+    if _cel_environment is None:
+        _cel_environment = celpy.Environment()
+    return _cel_environment.program(_cel_environment.compile(expression))
+
+
+def get_cel_worker_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Returns the shared worker pool for CEL evaluation, creating it with CEL_WORKERS processes on first use."""
+    global _cel_worker_pool
+    if _cel_worker_pool is None:
+        # Spawned rather than forked: forking a process with live gRPC channels is unsafe.
+        _cel_worker_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=CEL_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _cel_worker_pool
+
+
+def iter_asset_export(path: str) -> Iterator[Any]:
+    """Streams the assets of a Cloud Asset Inventory export.
+
+    Reads either newline-delimited JSON (one asset per line, as exported to Cloud
+    Storage), yielding each line undecoded, or a JSON array of assets (as printed
+    by `gcloud asset list --format=json`), yielding each decoded asset.
+    """
+    with open(path, encoding="utf-8") as export:
+        first = export.read(1)
+        while first.isspace():
+            first = export.read(1)
+        if first != "[":
+            line = (first + export.readline()).strip()
+            if line:
+                yield line
+            for line in export:
+                line = line.strip()
+                if line:
+                    yield line
+            return
+
+        decoder = json.JSONDecoder()
+        buffer, position, exhausted = "", 0, False
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer) and buffer[position] == "]":
+                return
+            try:
+                if position == len(buffer):
+                    raise json.JSONDecodeError("Need more data", buffer, position)
+                asset, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if exhausted:
+                    if position == len(buffer):
+                        return
+                    raise ValueError(f"Malformed JSON array in {path} near character {position}.")
+                chunk = export.read(1 << 20)
+                exhausted = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            yield asset
+
+
+def read_asset_chunk(assets: Iterator[Any], resource_type: str, size: int) -> tuple[list, int]:
+    """Reads up to `size` assets of `resource_type` from the stream; returns them and how many assets were read.
+
+    Assets of other types are dropped here, before they are sent to a worker:
+    by their `asset_type` when decoded, or by a substring check when still a line.
+    """
+    chunk, scanned = [], 0
+    for asset in assets:
+        scanned += 1
+        if resource_type:
+            if isinstance(asset, str):
+                if resource_type not in asset:
+                    continue
+            elif (asset.get("asset_type") or asset.get("assetType")) != resource_type:
+                continue
+        chunk.append(asset)
+        if len(chunk) >= size:
+            break
+    return chunk, scanned
+
+
+def evaluate_asset_chunk(
+    expression: str, resource_type: str, assets: list, max_results: int, include_passing: bool
+) -> Dict[str, Any]:
+    """Evaluates a CEL expression on each asset of `resource_type`, with the asset's `resource` as `resource`.
+
+    Runs in the worker processes. Returns counts and up to `max_results` names
+    per outcome; an expression evaluating to false means the asset would get a
+    finding.
+    """
+    import celpy
+
+    program = compiled_cel_program(expression)
+    result = {"evaluated": 0, "passing": 0, "failing": 0, "errors": 0, "invalid": 0}
+    failing, passing, errors = [], [], []
+    for asset in assets:
+        if isinstance(asset, str):
+            try:
+                asset = json.loads(asset)
+            except ValueError:
+                result["invalid"] += 1
+                continue
+        if not isinstance(asset, dict):
+            result["invalid"] += 1
+            continue
+        if resource_type and (asset.get("asset_type") or asset.get("assetType")) != resource_type:
+            continue
+        result["evaluated"] += 1
+        name = asset.get("name", "")
+        try:
+            value = program.evaluate({"resource": celpy.json_to_cel(asset.get("resource") or {})})
+            if not isinstance(value, celpy.celtypes.BoolType):
+                raise TypeError(f"expression returned {type(value).__name__}, not a boolean")
+        except Exception as e:
+            result["errors"] += 1
+            if len(errors) < max_results:
+                details = e.args[0] if isinstance(e, celpy.CELEvalError) and e.args else str(e)
+                errors.append({"name": name, "error": str(details)})
+            continue
+        if value:
+            result["passing"] += 1
+            if include_passing and len(passing) < max_results:
+                passing.append(name)
+        else:
+            result["failing"] += 1
+            if len(failing) < max_results:
+                failing.append(name)
+    result.update(failing_resources=failing, passing_resources=passing, evaluation_errors=errors)
+    return result
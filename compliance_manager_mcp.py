@@ -12,47 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import atexit
+import bisect
+from collections import OrderedDict
+import contextlib
+import contextvars
+import datetime
+import functools
+import importlib
+import inspect
+import json
 import logging
+import os
+import random
+import re
+import sqlite3
 from typing import Any, Dict, List, Optional
-import time
 import sys
+import time
+import urllib.parse
 
 from google.api_core import exceptions as google_exceptions
-from google.api_core import operation
-from google.longrunning import operations_pb2
-from google.cloud.cloudsecuritycompliance_v1.services.config import ConfigClient
-from google.cloud.cloudsecuritycompliance_v1.services.deployment import DeploymentClient
-from google.cloud.cloudsecuritycompliance_v1.types import (
-    CloudControl,
-    CreateCloudControlRequest,
-    CreateFrameworkDeploymentRequest,
-    CreateFrameworkRequest,
-    DeleteCloudControlRequest,
-    DeleteFrameworkDeploymentRequest,
-    DeleteFrameworkRequest,
-    Framework,
-    FrameworkReference,
-    FrameworkDeployment,
-    GetCloudControlDeploymentRequest,
-    GetCloudControlRequest,
-    GetFrameworkDeploymentRequest,
-    GetFrameworkRequest,
-    ListCloudControlDeploymentsRequest,
-    ListCloudControlsRequest,
-    ListFrameworkDeploymentsRequest,
-    ListFrameworksRequest,
-    TargetResourceConfig,
-    UpdateCloudControlRequest,
-    UpdateFrameworkRequest,
-    EnforcementMode,
-    CloudControlDetails,
-    CloudControlMetadata,
-)
 from google.protobuf import json_format
 from mcp.server.fastmcp import FastMCP
+import pydantic_core
+
+from cel_evaluation import (
+    CEL_WORKERS,
+    DRY_RUN_CHUNK_SIZE,
+    DRY_RUN_INLINE_BYTES,
+    compiled_cel_program,
+    evaluate_asset_chunk,
+    get_cel_worker_pool,
+    iter_asset_export,
+    read_asset_chunk,
+)
+from proto_serialization import COMPACT_FIELDS, normalize_field_path, proto_message_to_dict
+
+# Parameters shared by many tools are documented once, in the instructions sent to the client.
+SERVER_INSTRUCTIONS = """Parameters shared by the tools:
+- timeout_seconds: deadline for the whole call. Every API request the tool makes is sent with the remaining
+  time as its gRPC deadline; a call that overruns it is cancelled and returns a Deadline Exceeded error.
+- profile: credential profile to use (see list_credential_profiles). By default the profile whose resources
+  cover the organization, folder or project being called is used, otherwise Application Default Credentials."""
 
 # Initialize FastMCP server
-mcp = FastMCP("compliance-manager-mcp")
+mcp = FastMCP("compliance-manager-mcp", instructions=SERVER_INSTRUCTIONS)
 
 # Configure logging
 # IMPORTANT: MCP requires stdout to be clean JSON only
@@ -70,64 +76,1853 @@ logger.setLevel(logging.INFO)
 # The clients automatically use Application Default Credentials (ADC).
 # Ensure ADC are configured in the environment where the server runs
 # (e.g., by running `gcloud auth application-default login`).
-try:
-    config_client = ConfigClient()
-    logger.info("Successfully initialized Compliance Manager Config Client.")
-except Exception as e:
-    logger.error(f"Failed to initialize Config Client: {e}", exc_info=True)
-    config_client = None
-
-try:
-    deployment_client = DeploymentClient()
-    logger.info("Successfully initialized Compliance Manager Deployment Client.")
-except Exception as e:
-    logger.error(f"Failed to initialize Deployment Client: {e}", exc_info=True)
-    deployment_client = None
-
-
-# --- Helper Function for Proto to Dict Conversion ---
-def proto_message_to_dict(message: Any) -> Dict[str, Any]:
-    """Converts a protobuf message to a dictionary."""
-    try:
-        return json_format.MessageToDict(message._pb)
-    except Exception as e:
-        logger.error(f"Error converting protobuf message to dict: {e}")
-        return {"error": "Failed to serialize response part", "details": str(e)}
+# Importing the Google Cloud client libraries and building clients (credential
+# discovery, gRPC channel setup) dominates server startup, so neither happens at
+# import time: the libraries are imported on first use through LazyModule, and
+# clients are created by the client pool the first time a tool asks for one. This
+# also matters because the async clients open grpc.aio channels, which are bound
+# to the event loop they are created on.
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+
+cloudsecuritycompliance_v1 = LazyModule("google.cloud.cloudsecuritycompliance_v1")
+resourcemanager_v3 = LazyModule("google.cloud.resourcemanager_v3")
+operations_pb2 = LazyModule("google.longrunning.operations_pb2")
+google_auth = LazyModule("google.auth")
+google_auth_requests = LazyModule("google.auth.transport.requests")
+impersonated_credentials = LazyModule("google.auth.impersonated_credentials")
+grpc_aio = LazyModule("grpc.aio")
+
+
+# --- Credential Profiles and Client Pool ---
+# One server process can work with several organizations that use different
+# credentials. Named credential profiles are read from the JSON file named by
+# COMPLIANCE_MANAGER_PROFILES_FILE, for example:
+#   {
+#     "prod": {"resources": ["organizations/123456789012"],
+#              "credentials_file": "~/keys/prod-compliance.json"},
+#     "staging": {"resources": ["organizations/210987654321", "folders/555"],
+#                 "impersonate_service_account": "compliance@staging.iam.gserviceaccount.com",
+#                 "quota_project_id": "staging-ops"}
+#   }
+# Every tool accepts a `profile`; when none is given, the profile whose
+# `resources` contain the organization or parent being called is used, and
+# otherwise the 'default' profile (Application Default Credentials unless a
+# profile named 'default' is configured). A profile may also set `api_endpoint`
+# to reach the Compliance Manager API through another endpoint.
+
+CLOUD_PLATFORM_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+DEFAULT_PROFILE = "default"
+
+
+def load_credential_profiles() -> Dict[str, Dict[str, Any]]:
+    """Reads credential profiles from COMPLIANCE_MANAGER_PROFILES_FILE (none if unset)."""
+    path = os.environ.get("COMPLIANCE_MANAGER_PROFILES_FILE")
+    if not path:
+        return {}
+    try:
+        with open(os.path.expanduser(path)) as f:
+            profiles = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to load credential profiles from {path}: {e}")
+        return {}
+    logger.info(f"Loaded credential profiles: {', '.join(profiles)}")
+    return profiles
+
+
+def load_credentials(
+    credentials_file: Optional[str], impersonate_service_account: Optional[str], quota_project_id: Optional[str]
+):
+    """Builds credentials from a key file or ADC, optionally impersonating a service account."""
+    if credentials_file:
+        credentials, _ = google_auth.load_credentials_from_file(
+            os.path.expanduser(credentials_file), scopes=CLOUD_PLATFORM_SCOPES
+        )
+    else:
+        credentials, _ = google_auth.default(scopes=CLOUD_PLATFORM_SCOPES)
+    if impersonate_service_account:
+        credentials = impersonated_credentials.Credentials(
+            source_credentials=credentials,
+            target_principal=impersonate_service_account,
+            target_scopes=CLOUD_PLATFORM_SCOPES,
+        )
+    if quota_project_id:
+        credentials = credentials.with_quota_project(quota_project_id)
+    return credentials
 
-def fetch_lro_status(lro_name: str) -> Dict[str, Any]:
-    """Fetches the status of a long-running operation using DeploymentClient.get_operation."""
-    if not deployment_client:
-        return {"result": "failed", "error": "Deployment Client not initialized."}
 
-    logger.info(f"Fetching status for LRO: {lro_name}")
-    request = operations_pb2.GetOperationRequest(name=lro_name)
-    logger.info(f"Request for get operation {request}")
+class ClientPool:
+    """Shares API clients between tools, keyed by service, credentials and endpoint.
+
+    Clients are created on first use and wrapped so that their calls follow the
+    shared rate limits and retry policy. Clients with the same credentials and host
+    share one gRPC channel, so fanning out across organizations and services
+    does not open new connections. A background task refreshes each set of
+    credentials shortly before its access token expires, so requests do not
+    stall on a token refresh.
 
-    for i in range(30):  # Poll for a maximum of 30 * 10 = 300 seconds
+    With `emulator_host` set, every client talks to that address over a single
+    insecure channel without credentials instead, e.g. to a local fake backend.
+    """
+
+    def __init__(
+        self,
+        profiles: Dict[str, Dict[str, Any]],
+        refresh_margin: float = 300.0,
+        refresh_interval: float = 60.0,
+        emulator_host: str = "",
+    ):
+        self.profiles = profiles
+        self.emulator_host = emulator_host
+        self.refresh_margin = refresh_margin
+        self.refresh_interval = refresh_interval
+        self.token_refreshes = 0
+        self._services: Dict[str, tuple] = {}
+        self._clients: Dict[tuple, Any] = {}
+        self._credentials: Dict[tuple, Any] = {}
+        self._channels: Dict[tuple, Any] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def register(
+        self, service: str, description: str, module: LazyModule, class_name: str, uses_api_endpoint: bool
+    ) -> None:
+        self._services[service] = (description, module, class_name, uses_api_endpoint)
+
+    def resolve_profile(self, profile: str = "", resource: str = "") -> str:
+        """Returns the profile to use: the one asked for, else the one owning `resource`, else the default."""
+        if profile:
+            if profile not in self.profiles and profile != DEFAULT_PROFILE:
+                known = ", ".join(self.profiles) or "none"
+                raise ValueError(f"Unknown credential profile '{profile}'. Known profiles: {known}.")
+            return profile
+        for name, config in self.profiles.items():
+            for owned in config.get("resources", []):
+                if resource == owned or resource.startswith(owned + "/"):
+                    return name
+        return DEFAULT_PROFILE
+
+    def _key(self, service: str, profile: str) -> tuple:
+        config = self.profiles.get(profile, {})
+        credentials_key = (
+            config.get("credentials_file"),
+            config.get("impersonate_service_account"),
+            config.get("quota_project_id"),
+        )
+        uses_api_endpoint = self._services[service][3]
+        return service, credentials_key, config.get("api_endpoint") if uses_api_endpoint else None
+
+    async def get(self, service: str, profile: str = "", resource: str = "") -> Optional[Any]:
+        """Returns the shared client for a service and profile, creating it on first use (None on failure)."""
+        description = self._services[service][0]
         try:
-            # Use the DeploymentClient's get_operation method
-            operation_result = deployment_client.get_operation(request=request)
-            if operation_result.done:
-                if operation_result.HasField("error"):
-                    logger.error(f"LRO {lro_name} failed: {operation_result.error}")
-                    return {"result": "failed"}
-                else:
-                    logger.info(f"LRO {lro_name} completed successfully.")
-                    return {"result": "passed"}
+            profile = self.resolve_profile(profile, resource)
+        except ValueError as e:
+            logger.error(f"Failed to initialize {description}: {e}")
+            return None
+        key = self._key(service, profile)
+        client = self._clients.get(key)
+        if client is None:
+            try:
+                client = PolicyClient(await self._create(key))
+                # Another call may have created the client while the credentials were loading.
+                client = self._clients.setdefault(key, client)
+                logger.info(f"Successfully initialized {description} for profile '{profile}'.")
+            except Exception as e:
+                logger.error(f"Failed to initialize {description} for profile '{profile}': {e}", exc_info=True)
+        return client
+
+    def set(self, service: str, client: Any, profile: str = DEFAULT_PROFILE) -> None:
+        """Replaces a shared client, e.g. to point the server at a local fake backend."""
+        self._clients[self._key(service, profile)] = PolicyClient(client)
+
+    async def _create(self, key: tuple) -> Any:
+        service, credentials_key, api_endpoint = key
+        _, module, class_name, _ = self._services[service]
+        client_class = getattr(module, class_name)
+        transport_class = client_class.get_transport_class("grpc_asyncio")
+        if self.emulator_host:
+            channel = self._channels.get(self.emulator_host)
+            if channel is None:
+                channel = self._channels[self.emulator_host] = grpc_aio.insecure_channel(self.emulator_host)
+            return client_class(transport=transport_class(host=self.emulator_host, channel=channel))
+
+        credentials = self._credentials.get(credentials_key)
+        if credentials is None:
+            # Loading credentials reads key files and may call the metadata server, so it runs off the event loop.
+            credentials = await asyncio.to_thread(load_credentials, *credentials_key)
+            credentials = self._credentials.setdefault(credentials_key, credentials)
+            self._start_token_refresh()
+        host = api_endpoint or client_class.DEFAULT_ENDPOINT
+        channel = self._channels.get((credentials_key, host))
+        if channel is None:
+            target = host if ":" in host else f"{host}:443"
+            channel = self._channels[(credentials_key, host)] = transport_class.create_channel(
+                target, credentials=credentials
+            )
+        return client_class(transport=transport_class(host=host, channel=channel))
+
+    def _start_token_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            try:
+                self._refresh_task = asyncio.get_running_loop().create_task(
+                    self._refresh_tokens(), context=contextvars.Context()
+                )
+            except RuntimeError:
+                pass  # No running loop; tokens are refreshed on demand instead.
+
+    async def _refresh_tokens(self) -> None:
+        while True:
+            for credentials_key, credentials in list(self._credentials.items()):
+                expiry = getattr(credentials, "expiry", None)
+                now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+                if credentials.token and (expiry is None or (expiry - now).total_seconds() > self.refresh_margin):
+                    continue
+                try:
+                    await asyncio.to_thread(credentials.refresh, google_auth_requests.Request())
+                    self.token_refreshes += 1
+                    logger.debug(f"Refreshed access token for {credentials_key}.")
+                except Exception as e:
+                    logger.warning(f"Background token refresh failed for {credentials_key}, will retry: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self._clients),
+            "channels": len(self._channels),
+            "credentials": len(self._credentials),
+            "token_refreshes": self.token_refreshes,
+        }
+
+
+clients = ClientPool(load_credential_profiles(), emulator_host=os.environ.get("COMPLIANCE_MANAGER_EMULATOR_HOST", ""))
+clients.register("config", "Compliance Manager Config Client", cloudsecuritycompliance_v1, "ConfigAsyncClient", True)
+clients.register(
+    "deployment", "Compliance Manager Deployment Client", cloudsecuritycompliance_v1, "DeploymentAsyncClient", True
+)
+clients.register("folders", "Resource Manager Folders Client", resourcemanager_v3, "FoldersAsyncClient", False)
+clients.register("projects", "Resource Manager Projects Client", resourcemanager_v3, "ProjectsAsyncClient", False)
+
+
+async def get_config_client(profile: str = "", resource: str = "") -> Optional[Any]:
+    """Returns the shared Config async client for a profile (or for the profile owning `resource`)."""
+    return await clients.get("config", profile, resource)
+
+
+async def get_deployment_client(profile: str = "", resource: str = "") -> Optional[Any]:
+    """Returns the shared Deployment async client for a profile (or for the profile owning `resource`)."""
+    return await clients.get("deployment", profile, resource)
+
+
+async def get_resource_manager_clients(profile: str = "", resource: str = "") -> tuple[Optional[Any], Optional[Any]]:
+    """Returns the shared Resource Manager folders and projects clients, creating them on first use.
+
+    These are only needed to expand folders and organizations into the projects beneath them.
+    """
+    folders_client = await clients.get("folders", profile, resource)
+    projects_client = await clients.get("projects", profile, resource)
+    if folders_client is None or projects_client is None:
+        return None, None
+    return folders_client, projects_client
+
+
+# --- Call Deadlines ---
+# Every tool that calls the API accepts `timeout_seconds`. The deadline is held in a
+# context variable for the duration of the call: it is sent with each RPC as the
+# gRPC timeout and bounds retries and operation waits. A call that overruns it, or
+# that the client cancels, is cancelled together with its in-flight RPCs, so
+# abandoned work stops using quota. Background tasks start from an empty context
+# and never inherit a caller's deadline.
+
+# Extra time given to a tool after its deadline to return a timeout result on its own
+# before it is cancelled.
+DEADLINE_GRACE_SECONDS = 1.0
+
+call_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("call_deadline", default=None)
+
+
+def remaining_time(default: Optional[float] = None) -> Optional[float]:
+    """Returns the seconds left before the current call's deadline, capped at `default`.
+
+    Returns `default` when the call has no deadline.
+    """
+    deadline = call_deadline.get()
+    if deadline is None:
+        return default
+    remaining = deadline - time.monotonic()
+    return remaining if default is None else min(remaining, default)
+
+
+async def run_with_deadline(tool, timeout_seconds: Optional[float], /, *args, **kwargs) -> Any:
+    """Runs a tool call with `timeout_seconds` as its deadline.
+
+    A deadline can only shorten the one of an enclosing call (tools calling other
+    tools). A call still running shortly after its deadline is cancelled and
+    returns a Deadline Exceeded error.
+    """
+    if not timeout_seconds or timeout_seconds <= 0:
+        return await tool(*args, **kwargs)
+
+    deadline = time.monotonic() + timeout_seconds
+    outer = call_deadline.get()
+    token = call_deadline.set(deadline if outer is None else min(deadline, outer))
+    try:
+        async with asyncio.timeout(timeout_seconds + DEADLINE_GRACE_SECONDS):
+            return await tool(*args, **kwargs)
+    except TimeoutError:
+        logger.warning(f"{tool.__name__} cancelled after exceeding its {timeout_seconds}s deadline")
+        return {
+            "error": "Deadline Exceeded",
+            "details": f"{tool.__name__} did not finish within timeout_seconds={timeout_seconds}.",
+        }
+    finally:
+        call_deadline.reset(token)
+
+
+# --- Metrics and Tracing ---
+# Every tool call and every RPC attempt is timed into fixed-bucket latency
+# histograms, with error counts by gRPC status code, response sizes and
+# long-running operation durations; get_server_metrics returns the snapshot.
+# Setting COMPLIANCE_MANAGER_OTEL_EXPORTER to 'console' (stderr) or 'file' also
+# exports OpenTelemetry spans and metrics, with one span per tool call and a child
+# span per RPC attempt it made. The OpenTelemetry SDK is an optional dependency.
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+current_tool: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_tool", default=None)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds, with bucket-based percentile estimates."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, milliseconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Returns the upper bound of the bucket holding the given fraction of observations."""
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"<={bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self.counts) if count}
+        if self.counts[-1]:
+            buckets[f">{LATENCY_BUCKETS_MS[-1]}"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class ServerMetrics:
+    """In-process counters and latency histograms for tool calls, RPCs and long-running operations."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._tools: Dict[str, Dict[str, Any]] = {}
+        self._rpcs: Dict[str, Dict[str, Any]] = {}
+        self._operations: Dict[str, Dict[str, Any]] = {}
+        self._instruments: Optional[Dict[str, Any]] = None
+
+    def attach_meter(self, meter: Any) -> None:
+        """Also records every measurement through OpenTelemetry instruments created from `meter`."""
+        self._instruments = {
+            "tool_duration": meter.create_histogram("compliance_manager.tool.duration", unit="ms"),
+            "response_bytes": meter.create_counter("compliance_manager.tool.response_bytes", unit="By"),
+            "rpc_duration": meter.create_histogram("compliance_manager.rpc.duration", unit="ms"),
+            "operation_duration": meter.create_histogram("compliance_manager.operation.duration", unit="s"),
+        }
+
+    def _tool(self, tool: str) -> Dict[str, Any]:
+        entry = self._tools.get(tool)
+        if entry is None:
+            entry = self._tools[tool] = {
+                "calls": 0, "errors": {}, "rpcs": 0, "response_bytes": 0, "latency": LatencyHistogram()
+            }
+        return entry
+
+    def record_tool(self, tool: str, seconds: float, error: Optional[str], response_bytes: int) -> None:
+        entry = self._tool(tool)
+        entry["calls"] += 1
+        entry["response_bytes"] += response_bytes
+        entry["latency"].observe(seconds * 1000)
+        if error:
+            entry["errors"][error] = entry["errors"].get(error, 0) + 1
+        if self._instruments:
+            self._instruments["tool_duration"].record(seconds * 1000, {"tool": tool, "error": error or ""})
+            self._instruments["response_bytes"].add(response_bytes, {"tool": tool})
+
+    def record_rpc(self, method: str, seconds: float, code: str) -> None:
+        """Records one RPC attempt, attributed to the tool call it was made from."""
+        entry = self._rpcs.get(method)
+        if entry is None:
+            entry = self._rpcs[method] = {"calls": 0, "errors": {}, "latency": LatencyHistogram()}
+        entry["calls"] += 1
+        entry["latency"].observe(seconds * 1000)
+        if code != "OK":
+            entry["errors"][code] = entry["errors"].get(code, 0) + 1
+        tool = current_tool.get()
+        if tool is not None:
+            self._tool(tool)["rpcs"] += 1
+        if self._instruments:
+            self._instruments["rpc_duration"].record(seconds * 1000, {"rpc.method": method, "rpc.grpc.status_code": code})
+
+    def record_operation(self, kind: str, seconds: float, state: str) -> None:
+        entry = self._operations.get(kind)
+        if entry is None:
+            entry = self._operations[kind] = {"states": {}, "latency": LatencyHistogram()}
+        entry["states"][state] = entry["states"].get(state, 0) + 1
+        entry["latency"].observe(seconds * 1000)
+        if self._instruments:
+            self._instruments["operation_duration"].record(seconds, {"kind": kind, "state": state})
+
+    def snapshot(self) -> Dict[str, Any]:
+        def render(table: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+            return {
+                name: {
+                    key: value.snapshot() if isinstance(value, LatencyHistogram) else value
+                    for key, value in entry.items()
+                }
+                for name, entry in sorted(table.items())
+            }
+
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "tools": render(self._tools),
+            "rpcs": render(self._rpcs),
+            "operations": render(self._operations),
+        }
+
+
+server_metrics = ServerMetrics()
+tracer: Optional[Any] = None
+telemetry_destination: Optional[str] = None
+
+
+def configure_telemetry(exporter: str, path: str = "") -> Optional[str]:
+    """Exports spans and metrics through OpenTelemetry to stderr ('console') or a JSON lines file ('file').
+
+    Returns the destination, or None if the exporter is unknown or the
+    OpenTelemetry SDK is not installed.
+    """
+    global tracer, telemetry_destination
+    try:
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import ConsoleMetricExporter, PeriodicExportingMetricReader
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError:
+        logger.warning("OpenTelemetry export requested but opentelemetry-sdk is not installed.")
+        return None
+
+    if exporter == "console":
+        # Never stdout: it carries the MCP JSON-RPC stream.
+        out, destination = sys.stderr, "stderr"
+    elif exporter == "file":
+        destination = path or "compliance-manager-telemetry.jsonl"
+        out = open(destination, "a", encoding="utf-8")
+    else:
+        logger.warning(f"Unknown OpenTelemetry exporter '{exporter}'; use 'console' or 'file'.")
+        return None
+
+    resource = Resource.create({"service.name": "compliance-manager-mcp"})
+    tracer_provider = TracerProvider(resource=resource)
+    tracer_provider.add_span_processor(
+        BatchSpanProcessor(ConsoleSpanExporter(out=out, formatter=lambda span: span.to_json(indent=None) + "\n"))
+    )
+    metric_reader = PeriodicExportingMetricReader(
+        ConsoleMetricExporter(out=out, formatter=lambda metrics: metrics.to_json(indent=None) + "\n"),
+        export_interval_millis=float(os.environ.get("COMPLIANCE_MANAGER_OTEL_METRICS_INTERVAL_SECONDS", "60")) * 1000,
+    )
+    meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
+    tracer = tracer_provider.get_tracer("compliance-manager-mcp")
+    server_metrics.attach_meter(meter_provider.get_meter("compliance-manager-mcp"))
+
+    def shutdown() -> None:
+        tracer_provider.shutdown()
+        meter_provider.shutdown()
+
+    atexit.register(shutdown)
+    telemetry_destination = destination
+    return destination
+
+
+def start_span(name: str, attributes: Dict[str, Any]):
+    """Starts a span as a child of the current one, or does nothing when tracing is off."""
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+def response_size(result: Any) -> int:
+    """Returns the size of a tool result encoded as compact JSON."""
+    try:
+        return len(pydantic_core.to_json(result, fallback=str))
+    except Exception:
+        return 0
+
+
+def tool_call(tool):
+    """Wraps a tool so each call runs under its `timeout_seconds` deadline, is timed and gets a trace span."""
+    signature = inspect.signature(tool)
+    name = tool.__name__
+
+    @functools.wraps(tool)
+    async def call(*args, **kwargs):
+        timeout_seconds = signature.bind(*args, **kwargs).arguments.get("timeout_seconds")
+        start = time.perf_counter()
+        token = current_tool.set(name)
+        result, error = None, None
+        try:
+            with start_span(f"tool {name}", {"mcp.tool": name}) as span:
+                result = await run_with_deadline(tool, timeout_seconds, *args, **kwargs)
+                if isinstance(result, dict) and "error" in result:
+                    error = str(result["error"])
+                    if span is not None:
+                        span.set_attribute("mcp.tool.error", error)
+            return result
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            current_tool.reset(token)
+            server_metrics.record_tool(name, time.perf_counter() - start, error, response_size(result) if result else 0)
+
+    return call
+
+
+# --- Rate Limiting and Retries ---
+# Every API call made through the client pool goes through ApiCallPolicy, which
+# applies a shared token-bucket rate limit per API method and retries transient
+# failures with exponential backoff and jitter. Retries draw on a per-method
+# retry budget so a struggling backend is not hammered with retry storms, and
+# methods that change state are only retried on quota errors, which guarantee
+# the request was not executed. Limits are configured with
+#   COMPLIANCE_MANAGER_RATE_LIMIT_QPS    default calls per second per method (10)
+#   COMPLIANCE_MANAGER_RATE_LIMITS       per-method overrides, e.g. 'create_framework_deployment=2,list_cloud_controls=5'
+#   COMPLIANCE_MANAGER_MAX_RETRIES       retries per call (5)
+
+# Errors that mean the request was rejected before it was executed.
+QUOTA_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+)
+
+# Errors worth retrying for methods that do not change state.
+RETRYABLE_ERRORS = QUOTA_ERRORS + (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+)
+
+MUTATING_METHOD_PREFIXES = ("create_", "update_", "delete_")
+
+
+class RateLimiter:
+    """Async token bucket allowing `rate` calls per second, in bursts of up to `burst` calls."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Waits for a token and returns how many seconds the caller was throttled."""
+        start = time.monotonic()
+        # Waiters queue on the lock, so tokens are handed out first come, first served.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - start
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RetryBudget:
+    """Caps retries at a fraction of recent calls.
+
+    Every call deposits `ratio` tokens and every retry withdraws one, so
+    sustained retries cannot exceed roughly `ratio` of the call volume; up to
+    `reserve` tokens are available for bursts of failures after a quiet period.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+
+    def deposit(self) -> None:
+        self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+def server_retry_delay(error: Exception) -> Optional[float]:
+    """Returns the retry delay the server asked for in a RetryInfo error detail, if any."""
+    for detail in getattr(error, "details", None) or ():
+        if type(detail).__name__ == "RetryInfo":
+            return detail.retry_delay.seconds + detail.retry_delay.nanos / 1e9
+    return None
+
+
+def rpc_status_code(error: BaseException) -> str:
+    """Returns the gRPC status code name for an RPC error, e.g. 'RESOURCE_EXHAUSTED'."""
+    if isinstance(error, asyncio.CancelledError):
+        return "CANCELLED"
+    status_code = getattr(error, "grpc_status_code", None)
+    return status_code.name if status_code is not None else type(error).__name__
+
+
+def parse_rate_limits(spec: str) -> Dict[str, float]:
+    """Parses 'method=qps,method=qps' into a dict, skipping malformed entries."""
+    rates = {}
+    for entry in spec.split(","):
+        method, _, rate = entry.partition("=")
+        try:
+            rates[method.strip()] = float(rate)
+        except ValueError:
+            if entry.strip():
+                logger.warning(f"Ignoring malformed rate limit entry: {entry}")
+    return rates
+
+
+class ApiCallPolicy:
+    """Shared per-method rate limits, retries with backoff and call metrics for API clients."""
+
+    def __init__(
+        self,
+        default_rate: float = 10.0,
+        rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 5,
+        initial_delay: float = 1.0,
+        max_delay: float = 32.0,
+        multiplier: float = 2.0,
+        budget_ratio: float = 0.2,
+        budget_reserve: float = 10.0,
+    ):
+        self.default_rate = default_rate
+        self.rates = rates or {}
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self._methods: Dict[str, Dict[str, Any]] = {}
+
+    def _method(self, method: str) -> Dict[str, Any]:
+        state = self._methods.get(method)
+        if state is None:
+            rate = self.rates.get(method, self.default_rate)
+            state = self._methods[method] = {
+                "limiter": RateLimiter(rate),
+                "budget": RetryBudget(self.budget_ratio, self.budget_reserve),
+                "calls": 0,
+                "retries": 0,
+                "failures": 0,
+                "budget_exhausted": 0,
+                "throttled_seconds": 0.0,
+                "backoff_seconds": 0.0,
+                "errors": {},
+            }
+        return state
+
+    async def call(self, method: str, rpc, *args, **kwargs) -> Any:
+        """Calls `rpc` under the method's rate limit, retrying retryable errors with backoff."""
+        state = self._method(method)
+        retryable = QUOTA_ERRORS if method.startswith(MUTATING_METHOD_PREFIXES) else RETRYABLE_ERRORS
+        delay = self.initial_delay
+        attempt = 0
+        while True:
+            throttled = await state["limiter"].acquire()
+            state["throttled_seconds"] += throttled
+            remaining = remaining_time()
+            if remaining is not None:
+                if remaining <= 0:
+                    state["failures"] += 1
+                    raise google_exceptions.DeadlineExceeded(f"The call deadline expired before {method} was sent.")
+                kwargs["timeout"] = remaining
+            state["calls"] += 1
+            state["budget"].deposit()
+            try:
+                return await self._attempt(method, attempt, rpc, *args, **kwargs)
+            except retryable as e:
+                error_name = type(e).__name__
+                state["errors"][error_name] = state["errors"].get(error_name, 0) + 1
+                if attempt >= self.max_retries:
+                    state["failures"] += 1
+                    raise
+                if not state["budget"].withdraw():
+                    state["failures"] += 1
+                    state["budget_exhausted"] += 1
+                    logger.warning(f"Retry budget for {method} exhausted, not retrying: {e}")
+                    raise
+                # Equal jitter, unless the server said how long to wait.
+                backoff = server_retry_delay(e) or delay / 2 + random.uniform(0, delay / 2)
+                remaining = remaining_time()
+                if remaining is not None and backoff >= remaining:
+                    state["failures"] += 1
+                    raise
+                attempt += 1
+                state["retries"] += 1
+                state["backoff_seconds"] += backoff
+                logger.warning(f"{error_name} calling {method}, retry {attempt}/{self.max_retries} in {backoff:.1f}s: {e}")
+                await asyncio.sleep(backoff)
+                delay = min(delay * self.multiplier, self.max_delay)
+            except google_exceptions.GoogleAPICallError as e:
+                error_name = type(e).__name__
+                state["errors"][error_name] = state["errors"].get(error_name, 0) + 1
+                state["failures"] += 1
+                raise
+
+    @staticmethod
+    async def _attempt(method: str, attempt: int, rpc, *args, **kwargs) -> Any:
+        """Makes one RPC attempt, timed into the server metrics and traced as a child of the tool's span."""
+        start = time.perf_counter()
+        code = "OK"
+        try:
+            with start_span(f"rpc {method}", {"rpc.method": method, "rpc.attempt": attempt + 1}):
+                return await rpc(*args, **kwargs)
+        except BaseException as e:
+            code = rpc_status_code(e)
+            raise
+        finally:
+            server_metrics.record_rpc(method, time.perf_counter() - start, code)
+
+    def stats(self) -> Dict[str, Any]:
+        methods = {}
+        for method, state in sorted(self._methods.items()):
+            methods[method] = {
+                key: round(value, 3) if isinstance(value, float) else value
+                for key, value in state.items()
+                if key not in ("limiter", "budget")
+            }
+            methods[method]["rate_limit_qps"] = state["limiter"].rate
+        return {
+            "methods": methods,
+            "calls": sum(state["calls"] for state in self._methods.values()),
+            "retries": sum(state["retries"] for state in self._methods.values()),
+            "throttled_seconds": round(sum(state["throttled_seconds"] for state in self._methods.values()), 3),
+            "backoff_seconds": round(sum(state["backoff_seconds"] for state in self._methods.values()), 3),
+        }
+
+
+api_policy = ApiCallPolicy(
+    default_rate=float(os.environ.get("COMPLIANCE_MANAGER_RATE_LIMIT_QPS", "10")),
+    rates=parse_rate_limits(os.environ.get("COMPLIANCE_MANAGER_RATE_LIMITS", "")),
+    max_retries=int(os.environ.get("COMPLIANCE_MANAGER_MAX_RETRIES", "5")),
+)
+
+
+class PolicyClient:
+    """Wraps an API client so every RPC method call goes through the shared ApiCallPolicy."""
+
+    def __init__(self, client: Any):
+        self._client = client
+        self._methods: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name.startswith("_") or not inspect.iscoroutinefunction(attribute):
+            return attribute
+        method = self._methods.get(name)
+        if method is None:
+
+            async def method(*args, **kwargs):
+                return await api_policy.call(name, attribute, *args, **kwargs)
+
+            self._methods[name] = method
+        return method
+
+
+def concurrency_limited(method, semaphore: asyncio.Semaphore):
+    """Wraps an async RPC method so a fan-out keeps at most `semaphore`'s limit of calls in flight.
+
+    Rate limits and retries already come from the client's ApiCallPolicy, so this
+    only bounds concurrency.
+    """
+
+    async def call(*args, **kwargs):
+        async with semaphore:
+            return await method(*args, **kwargs)
+
+    return call
+
+
+# --- Progress Notifications ---
+# Tools that page through large collections or wait on long-running operations send
+# MCP progress notifications while they work, so the client can tell a slow call
+# from a stuck one and cancel early. Notifications are only sent when the client
+# passed a progress token with the tool call.
+
+PROGRESS_MIN_INTERVAL = float(os.environ.get("COMPLIANCE_MANAGER_PROGRESS_INTERVAL_SECONDS", "0.5"))
+
+# Per (session, progress token): [steps reported, monotonic time of the last notification sent].
+_progress_state: "OrderedDict[Any, list]" = OrderedDict()
+
+
+async def report_progress(message: str, force: bool = False) -> None:
+    """Sends a progress notification for the tool call being handled, if the client asked for them.
+
+    The progress value counts the steps reported during the call, so concurrent
+    pagers within one tool call still produce increasing values; `message`
+    carries the details. Notifications less than PROGRESS_MIN_INTERVAL apart are
+    dropped unless `force` is set.
+    """
+    context = mcp.get_context()
+    try:
+        meta = context.request_context.meta
+    except ValueError:
+        return  # Not handling an MCP request, e.g. a tool called directly.
+    token = meta.progressToken if meta else None
+    if token is None:
+        return
+
+    # Clients number their tokens independently, so a shared server keys them per session.
+    key = (id(context.request_context.session), token)
+    state = _progress_state.setdefault(key, [0, 0.0])
+    _progress_state.move_to_end(key)
+    while len(_progress_state) > 256:
+        _progress_state.popitem(last=False)
+    state[0] += 1
+    now = time.monotonic()
+    if not force and now - state[1] < PROGRESS_MIN_INTERVAL:
+        return
+    state[1] = now
+    try:
+        await context.report_progress(state[0], None, message)
+    except Exception as e:
+        logger.debug(f"Failed to send progress notification: {e}")
+
+
+# --- Pagination ---
+# List tools fetch one API page at a time and stop as soon as they have collected
+# `max_results` items, returning a `next_page_token` the caller can pass back to
+# continue. Nothing beyond the current page is held in memory.
+
+# Upper bound on the number of items a single list tool call returns.
+MAX_LIST_RESULTS = 1000
+
+# A listing that stops part-way through an API page returns a resume cursor,
+# 'resume:{n}:{page_token}': read the page at page_token again and skip the first
+# n items already returned from it.
+RESUME_PAGE_TOKEN_PREFIX = "resume:"
+
+
+def split_page_token(page_token: str) -> tuple[str, int]:
+    """Splits a resume cursor into the page token it resumes and the number of items already returned."""
+    if not page_token.startswith(RESUME_PAGE_TOKEN_PREFIX):
+        return page_token, 0
+    skip, _, token = page_token[len(RESUME_PAGE_TOKEN_PREFIX):].partition(":")
+    if not skip.isdigit():
+        raise ValueError(f"Malformed page token '{page_token}'.")
+    return token, int(skip)
+
+
+class ListStream:
+    """Streams items from a paginated list RPC one page at a time.
+
+    Each page is requested with a page size no larger than the number of items
+    still wanted, so iteration stops on a page boundary and `next_page_token`
+    (empty once the collection is exhausted) resumes exactly where this stream
+    left off. Items are passed through `convert` and, if a `predicate` is given,
+    only matching items are yielded and counted. Filtered streams always request
+    full pages, since sparse matches would otherwise shrink every page towards
+    one item; if `max_results` is reached with matches left on the page,
+    `next_page_token` is a resume cursor for that page instead.
+    """
+
+    def __init__(
+        self,
+        list_method,
+        request: Any,
+        items_field: str,
+        max_results: Optional[int] = None,
+        convert=None,
+        predicate=None,
+    ):
+        self._list_method = list_method
+        self._request = request
+        self._items_field = items_field
+        self._page_size = request.page_size or 50
+        self._convert = convert
+        self._predicate = predicate
+        self.max_results = max_results
+        self.next_page_token, self._skip = split_page_token(request.page_token)
+        self.pages_fetched = 0
+        self.items_returned = 0
+
+    async def __aiter__(self):
+        while True:
+            remaining = None if self.max_results is None else self.max_results - self.items_returned
+            if remaining is not None and remaining <= 0:
+                return
+            if remaining is None or self._predicate:
+                page_size = self._page_size
             else:
-                logger.debug(f"LRO {lro_name} is still in progress... (Attempt {i + 1})")
-                time.sleep(10)
-        except google_exceptions.GoogleAPICallError as e:
-            logger.error(f"Error calling GetOperation for {lro_name}: {e}", exc_info=True)
-            return {"result": "failed", "error": str(e)}
-        except Exception as e:
-            logger.error(f"Unexpected error fetching LRO status for {lro_name}: {e}", exc_info=True)
-            return {"result": "failed", "error": f"Unexpected error: {str(e)}"}
+                page_size = min(self._page_size, remaining + self._skip)
+            page_token = self.next_page_token
+            self._request.page_size = page_size
+            self._request.page_token = page_token
+            response = await self._list_method(request=self._request)
+            self.pages_fetched += 1
+            self.next_page_token = response.next_page_token
+            skip, self._skip = self._skip, 0
+            matched = 0
+            for item in getattr(response, self._items_field):
+                if self._convert:
+                    item = self._convert(item)
+                if self._predicate and not self._predicate(item):
+                    continue
+                matched += 1
+                if matched <= skip:
+                    continue
+                if self.max_results is not None and self.items_returned >= self.max_results:
+                    self.next_page_token = f"{RESUME_PAGE_TOKEN_PREFIX}{matched - 1}:{page_token}"
+                    return
+                self.items_returned += 1
+                yield item
+            # A resumed page that came back shorter than before carries the rest of the skip over.
+            self._skip = max(skip - matched, 0)
+            await report_progress(
+                f"Fetched {self.pages_fetched} page(s), {self.items_returned} {self._items_field.replace('_', ' ')} so far"
+            )
+            if not self.next_page_token:
+                return
+
+
+def resolve_max_results(max_results: Optional[int], page_size: int) -> int:
+    """Defaults max_results to one page and clamps it to MAX_LIST_RESULTS."""
+    if not max_results or max_results < 0:
+        max_results = page_size
+    return min(max_results, MAX_LIST_RESULTS)
+
+
+async def fetch_all_items(list_method, request: Any, items_field: str) -> list:
+    """Drains every page of a list RPC. Only used to build full catalog snapshots."""
+    return [item async for item in ListStream(list_method, request, items_field)]
+
+
+# --- Filtering, Projection and Search ---
+# Catalog list RPCs have no server-side filter, so list tools accept a small
+# filter language evaluated locally against each item as it streams in:
+#   severity=HIGH AND resource_type=storage.googleapis.com/Bucket
+# Terms are `field=value`, `field!=value` or `field:value` (substring; `field:*`
+# means the field is set), joined by AND. Fields are dotted paths in the JSON
+# form of the item (camelCase or snake_case), and list-valued fields match if
+# any element does.
+
+FILTER_TERM = re.compile(r'^\s*([\w.]+)\s*(!=|=|:)\s*(?:"([^"]*)"|(\S+))\s*$')
+
+
+def get_field_values(item: Any, path: List[str]) -> list:
+    """Returns every leaf value at `path` in a JSON-style item, flattening lists on the way."""
+    values = [item]
+    for key in path:
+        next_values = []
+        for value in values:
+            if isinstance(value, list):
+                value_list = value
+            else:
+                value_list = [value]
+            for element in value_list:
+                if isinstance(element, dict) and key in element:
+                    next_values.append(element[key])
+        values = next_values
+    flattened = []
+    for value in values:
+        flattened.extend(value if isinstance(value, list) else [value])
+    return flattened
+
+
+def make_local_predicate(expression: str):
+    """Compiles a local filter expression into a predicate over JSON-style items (None if empty)."""
+    if not expression or not expression.strip():
+        return None
+
+    terms = []
+    for clause in re.split(r"\s+AND\s+", expression.strip()):
+        match = FILTER_TERM.match(clause)
+        if not match:
+            raise ValueError(f"Invalid filter term '{clause}'. Use field=value, field!=value or field:value joined by AND.")
+        field, operator, quoted, bare = match.groups()
+        terms.append((normalize_field_path(field), operator, (quoted if quoted is not None else bare).lower()))
+
+    def predicate(item: Dict[str, Any]) -> bool:
+        for path, operator, expected in terms:
+            values = [str(value).lower() for value in get_field_values(item, path)]
+            if operator == "=":
+                matched = expected in values
+            elif operator == "!=":
+                matched = expected not in values
+            elif expected == "*":
+                matched = bool(values)
+            else:
+                matched = any(expected in value for value in values)
+            if not matched:
+                return False
+        return True
+
+    return predicate
+
+
+def expression_fields(filter: str, order_by: str) -> List[str]:
+    """Returns the fields read by a local filter expression and sort order."""
+    fields = []
+    for clause in re.split(r"\s+AND\s+", filter.strip()) if filter else []:
+        match = FILTER_TERM.match(clause)
+        if match:
+            fields.append(match.group(1))
+    for clause in order_by.split(",") if order_by else []:
+        parts = clause.split()
+        if parts:
+            fields.append(parts[0])
+    return fields
+
+
+def sort_items(items: List[Dict[str, Any]], order_by: str) -> List[Dict[str, Any]]:
+    """Sorts JSON-style items by a comma separated list of 'field [asc|desc]' keys."""
+    if not order_by or not order_by.strip():
+        return items
+    keys = []
+    for clause in order_by.split(","):
+        parts = clause.split()
+        if not parts:
+            continue
+        descending = len(parts) > 1 and parts[1].lower() == "desc"
+        keys.append((normalize_field_path(parts[0]), descending))
+    # Python's sort is stable, so sorting by each key from last to first gives a multi-key order.
+    for path, descending in reversed(keys):
+        items.sort(key=lambda item: str((get_field_values(item, path) or [""])[0]).lower(), reverse=descending)
+    return items
+
+
+def copy_field_path(source: Any, path: List[str], target: Dict[str, Any]) -> None:
+    """Copies the value at `path` in `source` into `target`, projecting each element of list-valued fields."""
+    key = path[0]
+    if not isinstance(source, dict) or key not in source:
+        return
+    value = source[key]
+    if len(path) == 1:
+        target[key] = value
+    elif isinstance(value, list):
+        elements = target[key] if isinstance(target.get(key), list) else [{} for _ in value]
+        for element, projected in zip(value, elements):
+            copy_field_path(element, path[1:], projected)
+        if any(elements):
+            target[key] = elements
+    else:
+        nested = target.get(key, {})
+        copy_field_path(value, path[1:], nested)
+        if nested:
+            target[key] = nested
+
+
+def project_fields(item: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Keeps only the requested (possibly dotted) fields of a JSON-style item."""
+    if not fields:
+        return item
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        copy_field_path(item, normalize_field_path(field), projected)
+    return projected
+
+
+SEARCH_TOKEN = re.compile(r"[a-z0-9]+(?:[./][a-z0-9]+)*")
+
+# Relative weight of a query term matching in each indexed field.
+SEARCH_FIELD_WEIGHTS = {
+    "displayName": 3.0,
+    "resource_type": 2.0,
+    "categories": 2.0,
+    "findingCategory": 2.0,
+    "description": 1.0,
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercases and splits text into search tokens.
+
+    Dotted or slashed names such as 'storage.googleapis.com/Bucket' are indexed
+    whole as well as by their parts, so either form can be searched for.
+    """
+    tokens = []
+    for token in SEARCH_TOKEN.findall(text.lower()):
+        tokens.append(token)
+        parts = re.split(r"[./]", token)
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+class CloudControlSearchIndex:
+    """In-memory inverted index over cloud control names, descriptions, resource types and categories."""
+
+    def __init__(self, controls: List[Dict[str, Any]]):
+        self.controls = controls
+        self.postings: Dict[str, Dict[int, float]] = {}
+        for doc_id, control in enumerate(controls):
+            for field, weight in SEARCH_FIELD_WEIGHTS.items():
+                for value in get_field_values(control, normalize_field_path(field)):
+                    for token in tokenize(str(value)):
+                        doc_scores = self.postings.setdefault(token, {})
+                        doc_scores[doc_id] = doc_scores.get(doc_id, 0.0) + weight
+
+    def search(self, query: str, limit: int = 20, predicate=None) -> List[tuple[float, Dict[str, Any]]]:
+        """Returns up to `limit` (score, control) pairs matching every query token, best first."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        # Intersect the shortest posting lists first.
+        postings = sorted((self.postings.get(token, {}) for token in tokens), key=len)
+        candidates = set(postings[0])
+        for doc_scores in postings[1:]:
+            candidates &= doc_scores.keys()
+            if not candidates:
+                return []
+        results = []
+        for doc_id in candidates:
+            control = self.controls[doc_id]
+            if predicate and not predicate(control):
+                continue
+            results.append((sum(doc_scores[doc_id] for doc_scores in postings), control))
+        results.sort(key=lambda result: (-result[0], result[1].get("name", "")))
+        return results[:limit]
+
+
+# --- Output Formats and Response Budgets ---
+# List tools return every item in full by default. `output_format='compact'` keeps
+# only the summary fields in COMPACT_FIELDS (unless `fields` are given), and
+# 'table' returns the same fields column-oriented, as one list of column names and
+# one row of values per item, so key names are not repeated for every item.
+# `max_response_bytes` caps the encoded size of a response: items that do not fit
+# are left out and `next_page_token` becomes a resume cursor (see Pagination)
+# skipping the items returned, so passing it back continues with the first item
+# left out. Items are fitted in listing order and only then sorted by a local
+# `order_by`, so each response is sorted on its own.
+
+OUTPUT_FORMATS = ("full", "compact", "table")
+
+
+def output_fields(message_class: Any, fields: Optional[List[str]], output_format: str) -> Optional[List[str]]:
+    """Returns the fields to serialize for each item in `output_format` (None for all fields)."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output_format '{output_format}'. Use one of: {', '.join(OUTPUT_FORMATS)}.")
+    if fields or output_format == "full":
+        return fields
+    return COMPACT_FIELDS[message_class.pb().DESCRIPTOR.full_name]
+
+
+def to_table(items: List[Dict[str, Any]], columns: List[str]) -> Dict[str, Any]:
+    """Turns JSON-style items into {'columns', 'rows'}; a cell holds a list when the path has several values."""
+    paths = [normalize_field_path(column) for column in columns]
+    rows = []
+    for item in items:
+        row = []
+        for path in paths:
+            values = get_field_values(item, path)
+            row.append(values[0] if len(values) == 1 else (values or None))
+        rows.append(row)
+    return {"columns": list(columns), "rows": rows}
+
+
+def shape_list_response(
+    result: Dict[str, Any],
+    items_key: str,
+    output_format: str,
+    fields: Optional[List[str]],
+    order_by: str,
+    page_token: str,
+    max_response_bytes: int,
+) -> Dict[str, Any]:
+    """Returns a list result sorted by `order_by`, projected to `fields` and in `output_format`, within the budget.
+
+    `result` holds the items in listing order, as read from `page_token`. At
+    least one item is always returned, so repeated calls make progress even when
+    a single item exceeds the budget.
+    """
+    items = result[items_key]
+    shaped = dict(result)
+    if max_response_bytes and max_response_bytes > 0:
+        token, skip = split_page_token(page_token)
+        shaped.update(
+            {items_key: to_table([], fields) if output_format == "table" else [], "count": len(items)},
+            next_page_token=f"{RESUME_PAGE_TOKEN_PREFIX}{skip + len(items)}:{token}",
+            truncated=True,
+        )
+        size = response_size(shaped)
+        fitted = 0
+        for item in items:
+            item = project_fields(item, fields)
+            cell = to_table([item], fields)["rows"][0] if output_format == "table" else item
+            size += response_size(cell) + (1 if fitted else 0)
+            if size > max_response_bytes and fitted:
+                break
+            fitted += 1
+        if fitted < len(items):
+            items = items[:fitted]
+            shaped.update(next_page_token=f"{RESUME_PAGE_TOKEN_PREFIX}{skip + fitted}:{token}")
+        else:
+            shaped.update(next_page_token=result["next_page_token"])
+            shaped.pop("truncated")
+    items = [project_fields(item, fields) for item in sort_items(items, order_by)]
+    shaped.update({items_key: to_table(items, fields) if output_format == "table" else items, "count": len(items)})
+    return shaped
+
+
+# --- Catalog Cache ---
+# Built-in frameworks and cloud controls rarely change within a session, so catalog
+# reads are served from a size-bounded LRU cache whose entries expire after a TTL.
+# Writes to the catalog invalidate the affected organization and location.
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Keys are tuples whose first element is the resource name the entry was read
+    from, which lets writes invalidate every entry under a parent by prefix.
+
+    Concurrent misses for the same key are coalesced: the first caller starts the
+    fetch and later callers await the same task, so a burst of identical reads
+    costs one RPC and one serialization.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0
+        self._entries: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[tuple, tuple[asyncio.Task, list]] = {}
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        """Returns (found, value) and marks the entry as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def set(self, key: tuple, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """Drops entries whose resource name starts with `prefix` (all entries if None)."""
+        keys = [key for key in self._entries if prefix is None or key[0].startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        # Fetches already in flight may return pre-write data: later callers start a new
+        # fetch, and the detached results are not stored.
+        for flight in [flight for flight in self._inflight if prefix is None or flight[0][0].startswith(prefix)]:
+            del self._inflight[flight]
+        return len(keys)
+
+    async def get_or_fetch(self, key: tuple, fetch, refresh: bool = False) -> Any:
+        """Returns the cached value for `key`, calling `fetch()` on a miss or when `refresh` is set.
+
+        Callers with the same key and `refresh` flag share a single in-flight fetch. The fetch
+        runs without any caller's deadline; each caller only waits until its own deadline
+        (raising DeadlineExceeded) or cancellation, and the fetch is cancelled once no
+        callers remain.
+        """
+        if not refresh:
+            found, value = self.get(key)
+            if found:
+                return value
+
+        flight = (key, refresh)
+        if flight in self._inflight:
+            task, waiters = self._inflight[flight]
+            self.coalesced += 1
+        else:
+            # The fetch outlives the caller that started it when others join, so it must not
+            # inherit that caller's deadline.
+            context = contextvars.copy_context()
+            context.run(call_deadline.set, None)
+            task, waiters = asyncio.get_running_loop().create_task(fetch(), context=context), []
+            self._inflight[flight] = (task, waiters)
+            task.add_done_callback(lambda done: self._finish(flight, done))
+
+        waiter = object()
+        waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), remaining_time())
+        except TimeoutError:
+            if len(waiters) == 1 and not task.done():
+                task.cancel()
+            raise google_exceptions.DeadlineExceeded(f"The call deadline expired while waiting for {key[0]}.")
+        except asyncio.CancelledError:
+            if len(waiters) == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            waiters.remove(waiter)
+
+    def _finish(self, flight: tuple, task: asyncio.Task) -> None:
+        """Stores a completed fetch unless it was detached by invalidate()."""
+        if self._inflight.get(flight, (None,))[0] is not task:
+            return
+        del self._inflight[flight]
+        if not task.cancelled() and task.exception() is None:
+            self.set(flight[0], task.result())
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+        }
 
-    logger.warning(f"LRO {lro_name} timed out after 300 seconds.")
-    return {"result": "timeout"}
 
-def create_cloud_control_metadata_list(cloud_controls: str, parent: str) -> list[CloudControlMetadata]:
+catalog_cache = TTLCache(
+    maxsize=int(os.environ.get("COMPLIANCE_MANAGER_CACHE_SIZE", "256")),
+    ttl=float(os.environ.get("COMPLIANCE_MANAGER_CACHE_TTL_SECONDS", "600")),
+)
+
+
+# --- Catalog Snapshot Store ---
+# Optional on-disk snapshot of the framework and cloud control catalogs, keyed by
+# organization and location, so a new session can answer catalog queries without
+# re-downloading thousands of controls. Enabled by setting
+# COMPLIANCE_MANAGER_SNAPSHOT_DIR. Snapshots older than the configured maximum age
+# are still served, and refreshed in the background.
+
+SNAPSHOT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_items (
+    scope TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (scope, kind, name)
+);
+CREATE TABLE IF NOT EXISTS catalog_snapshots (
+    scope TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (scope, kind)
+);
+"""
+
+
+class CatalogSnapshotStore:
+    """SQLite-backed snapshot of catalog listings, stored as serialized protos.
+
+    `scope` is the 'organizations/{org_id}/locations/{location}' parent and `kind`
+    is either 'frameworks' or 'cloud_controls'. Refreshes compare each item's
+    major revision with the stored copy and only rewrite what changed.
+    """
+
+    MESSAGE_TYPES = {"frameworks": "Framework", "cloud_controls": "CloudControl"}
+
+    def __init__(self, path: str, max_age: float = 3600.0):
+        self.path = path
+        self.max_age = max_age
+        self._refresh_tasks: Dict[tuple, asyncio.Task] = {}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SNAPSHOT_SCHEMA)
+
+    def _message_type(self, kind: str):
+        return getattr(cloudsecuritycompliance_v1, self.MESSAGE_TYPES[kind])
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _read_item(self, scope: str, kind: str, name: str) -> Optional[bytes]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM catalog_items WHERE scope = ? AND kind = ? AND name = ?", (scope, kind, name)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _write(self, scope: str, kind: str, messages: list, replace: bool) -> int:
+        message_type = self._message_type(kind)
+        changed = 0
+        with self._connect() as conn:
+            stored = dict(
+                conn.execute("SELECT name, revision FROM catalog_items WHERE scope = ? AND kind = ?", (scope, kind))
+            )
+            for message in messages:
+                if stored.pop(message.name, None) == message.major_revision_id and replace:
+                    continue
+                conn.execute(
+                    "INSERT OR REPLACE INTO catalog_items VALUES (?, ?, ?, ?, ?)",
+                    (scope, kind, message.name, message.major_revision_id, message_type.serialize(message)),
+                )
+                changed += 1
+            if replace:
+                conn.executemany(
+                    "DELETE FROM catalog_items WHERE scope = ? AND kind = ? AND name = ?",
+                    [(scope, kind, name) for name in stored],
+                )
+                changed += len(stored)
+                conn.execute("INSERT OR REPLACE INTO catalog_snapshots VALUES (?, ?, ?)", (scope, kind, time.time()))
+        return changed
+
+    def _read_page(self, scope: str, kind: str, offset: int, limit: int) -> Optional[tuple[list, int]]:
+        with self._connect() as conn:
+            if conn.execute(
+                "SELECT 1 FROM catalog_snapshots WHERE scope = ? AND kind = ?", (scope, kind)
+            ).fetchone() is None:
+                return None
+            total = conn.execute(
+                "SELECT COUNT(*) FROM catalog_items WHERE scope = ? AND kind = ?", (scope, kind)
+            ).fetchone()[0]
+            payloads = conn.execute(
+                "SELECT payload FROM catalog_items WHERE scope = ? AND kind = ? ORDER BY name LIMIT ? OFFSET ?",
+                (scope, kind, limit, offset),
+            ).fetchall()
+        return [payload for (payload,) in payloads], total
+
+    async def load_page(self, scope: str, kind: str, offset: int, limit: int) -> Optional[tuple[list, int]]:
+        """Returns up to `limit` items starting at `offset` plus the total item count, or None without a snapshot."""
+        page = await asyncio.to_thread(self._read_page, scope, kind, offset, limit)
+        if page is None:
+            return None
+        message_type = self._message_type(kind)
+        return [message_type.deserialize(payload) for payload in page[0]], page[1]
+
+    async def get(self, scope: str, kind: str, name: str) -> Optional[Any]:
+        """Returns one stored item by full resource name, or None if it is not in the snapshot."""
+        payload = await asyncio.to_thread(self._read_item, scope, kind, name)
+        return None if payload is None else self._message_type(kind).deserialize(payload)
+
+    async def save(self, scope: str, kind: str, messages: list) -> int:
+        """Replaces the snapshot with a full listing and returns the number of rows changed."""
+        return await asyncio.to_thread(self._write, scope, kind, messages, True)
+
+    async def upsert(self, scope: str, kind: str, messages: list) -> int:
+        """Adds or updates individual items, e.g. after a create, without touching the rest."""
+        return await asyncio.to_thread(self._write, scope, kind, messages, False)
+
+    def _refreshed_at(self, scope: str, kind: str) -> Optional[float]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT refreshed_at FROM catalog_snapshots WHERE scope = ? AND kind = ?", (scope, kind)
+            ).fetchone()
+        return row[0] if row else None
+
+    async def age(self, scope: str, kind: str) -> Optional[float]:
+        """Returns the snapshot's age in seconds, or None if there is no snapshot yet."""
+        refreshed_at = await asyncio.to_thread(self._refreshed_at, scope, kind)
+        return None if refreshed_at is None else time.time() - refreshed_at
+
+    async def refresh_if_stale(self, scope: str, kind: str, fetch_all, force: bool = False) -> None:
+        """Starts a background refresh with `fetch_all()` if the snapshot is missing or older than max_age."""
+        key = (scope, kind)
+        if key in self._refresh_tasks:
+            return
+        age = None if force else await self.age(scope, kind)
+        if age is not None and age < self.max_age:
+            return
+
+        async def refresh() -> None:
+            try:
+                changed = await self.save(scope, kind, await fetch_all())
+                logger.info(f"Refreshed {kind} snapshot for {scope} ({changed} changed).")
+                catalog_cache.invalidate(scope)
+            except Exception as e:
+                logger.warning(f"Background refresh of {kind} snapshot for {scope} failed: {e}")
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.create_task(refresh(), context=contextvars.Context())
+
+
+def create_catalog_snapshot_store() -> Optional[CatalogSnapshotStore]:
+    snapshot_dir = os.environ.get("COMPLIANCE_MANAGER_SNAPSHOT_DIR")
+    if not snapshot_dir:
+        return None
+    try:
+        return CatalogSnapshotStore(
+            os.path.join(os.path.expanduser(snapshot_dir), "catalog.sqlite3"),
+            max_age=float(os.environ.get("COMPLIANCE_MANAGER_SNAPSHOT_MAX_AGE_SECONDS", "3600")),
+        )
+    except Exception as e:
+        logger.error(f"Failed to open catalog snapshot in {snapshot_dir}: {e}", exc_info=True)
+        return None
+
+
+catalog_snapshot = create_catalog_snapshot_store()
+
+
+# Page tokens for listings served from the snapshot carry this prefix and an offset,
+# so they can never be confused with API page tokens.
+SNAPSHOT_PAGE_TOKEN_PREFIX = "snapshot:"
+
+
+async def list_catalog_page(
+    kind: str,
+    list_method,
+    request: Any,
+    max_results: int,
+    refresh: bool,
+    convert=None,
+    predicate=None,
+) -> tuple[list, str, str]:
+    """Lists one page of a catalog collection from the snapshot when available, otherwise from the API.
+
+    Returns the items (passed through `convert` and then `predicate` as they
+    stream in), the next page token and where the page came from ('snapshot' or
+    'api'). When the snapshot is enabled but missing or stale, a full listing is
+    fetched in the background to (re)build it.
+    """
+    convert = convert or (lambda item: item)
+    parent = request.parent
+    page_token = request.page_token
+    # A resume cursor can wrap a snapshot page token as well as an API one.
+    token, skip = split_page_token(page_token)
+
+    if catalog_snapshot:
+        full_request = type(request)(parent=parent, page_size=request.page_size)
+        fetch_all = lambda: fetch_all_items(list_method, full_request, kind)
+        if refresh:
+            await catalog_snapshot.refresh_if_stale(parent, kind, fetch_all, force=True)
+        elif not token or token.startswith(SNAPSHOT_PAGE_TOKEN_PREFIX):
+            offset = int(token[len(SNAPSHOT_PAGE_TOKEN_PREFIX):] or 0) if token else 0
+            page = await catalog_snapshot.load_page(parent, kind, offset, max_results + skip)
+            if page is not None:
+                await catalog_snapshot.refresh_if_stale(parent, kind, fetch_all)
+                items = []
+                position = offset
+                while True:
+                    batch, total = page
+                    for item in batch:
+                        position += 1
+                        item = convert(item)
+                        if predicate and not predicate(item):
+                            continue
+                        if skip:
+                            skip -= 1
+                            continue
+                        items.append(item)
+                        if len(items) >= max_results:
+                            break
+                    if len(items) >= max_results or position >= total or not batch:
+                        break
+                    page = await catalog_snapshot.load_page(parent, kind, position, max(max_results, 200))
+                next_page_token = f"{SNAPSHOT_PAGE_TOKEN_PREFIX}{position}" if position < total else ""
+                return items, next_page_token, "snapshot"
+            await catalog_snapshot.refresh_if_stale(parent, kind, fetch_all)
+
+    if token.startswith(SNAPSHOT_PAGE_TOKEN_PREFIX):
+        raise ValueError("The page token refers to a catalog snapshot that is no longer available; list again without page_token.")
+
+    stream = ListStream(list_method, request, kind, max_results, convert, predicate)
+    items = [item async for item in stream]
+    return items, stream.next_page_token, "api"
+
+
+async def load_full_catalog(kind: str, list_method, request: Any, refresh: bool = False) -> list:
+    """Returns every item of a catalog collection, from the snapshot when one exists.
+
+    With `refresh`, the collection is always listed from the API and the snapshot rewritten.
+    """
+    if catalog_snapshot and not refresh:
+        page = await catalog_snapshot.load_page(request.parent, kind, 0, -1)
+        if page is not None:
+            return page[0]
+    items = await fetch_all_items(list_method, request, kind)
+    if catalog_snapshot:
+        await catalog_snapshot.save(request.parent, kind, items)
+    return items
+
+
+# --- Long-Running Operation Tracking ---
+# Deployment creates and deletes return long-running operations (LROs). Instead of
+# holding a tool call open while they finish, the tracker polls each operation in
+# a background task and the tools hand back an operation handle straight away.
+
+# Transient errors that should not end tracking of an operation.
+TRANSIENT_ERRORS = (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+)
+
+# Deployment LROs are named organizations/{org}/locations/{location}/operations/{id}.
+OPERATION_NAME = re.compile(r"^organizations/[^/]+/locations/[^/]+/operations/[^/]+$")
+
+
+class OperationTracker:
+    """Polls long-running operations in the background and records their state.
+
+    Each operation is polled by its own asyncio task with exponential backoff and
+    jitter, so any number of operations can be in flight without blocking the
+    server.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 2.0,
+        max_delay: float = 30.0,
+        multiplier: float = 1.5,
+        timeout: float = 3600.0,
+        max_finished: int = 1000,
+    ):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.timeout = timeout
+        self.max_finished = max_finished
+        self._operations: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def track(self, operation_id: str, kind: str = "operation", resource: str = "", profile: str = "") -> Dict[str, Any]:
+        """Starts tracking an operation (if not already tracked) and returns its handle.
+
+        The operation is polled with the given credential profile, or the one owning the operation's name.
+        """
+        if operation_id not in self._operations:
+            self._operations[operation_id] = {
+                "operation_id": operation_id,
+                "kind": kind,
+                "resource": resource,
+                "profile": profile,
+                "state": "RUNNING",
+                "error": None,
+                "status_message": None,
+                "polls": 0,
+                "started_at": time.time(),
+                "finished_at": None,
+            }
+            self._tasks[operation_id] = asyncio.create_task(self._poll(operation_id), context=contextvars.Context())
+            self._evict_finished()
+        return self.status(operation_id)
+
+    async def resume(self, operation_id: str, profile: str = "") -> Dict[str, Any]:
+        """Returns the handle of an operation, first tracking it if it is not tracked yet.
+
+        This picks operations started before a server restart up again. The name is
+        checked and the operation looked up once before polling starts, so a
+        malformed name raises ValueError and an unknown operation raises
+        google_exceptions.NotFound instead of starting a background task.
+        """
+        status = self.status(operation_id)
+        if status is not None:
+            return status
+        if not OPERATION_NAME.match(operation_id):
+            raise ValueError(
+                f"'{operation_id}' is not an operation name; expected "
+                "'organizations/{org_id}/locations/{location}/operations/{operation_id}'."
+            )
+        deployment_client = await get_deployment_client(profile, operation_id)
+        if not deployment_client:
+            raise RuntimeError("Deployment Client not initialized.")
+        await deployment_client.get_operation(request=operations_pb2.GetOperationRequest(name=operation_id))
+        return self.track(operation_id, profile=profile)
+
+    def status(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """Returns a snapshot of the operation's state, or None if it is not tracked."""
+        record = self._operations.get(operation_id)
+        if record is None:
+            return None
+        snapshot = dict(record)
+        end = record["finished_at"] or time.time()
+        snapshot["elapsed_seconds"] = round(end - record["started_at"], 3)
+        return snapshot
+
+    async def wait(
+        self, operation_id: str, timeout: Optional[float] = None, report: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Waits up to `timeout` seconds for the operation to finish and returns its state.
+
+        While waiting, a progress notification with the operation's state is sent
+        after every poll interval, unless `report` is false.
+        """
+        task = self._tasks.get(operation_id)
+        if task is None or task.done():
+            return self.status(operation_id)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not task.done():
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                break
+            wait_for = remaining
+            if report:
+                wait_for = self.initial_delay if remaining is None else min(self.initial_delay, remaining)
+            await asyncio.wait({task}, timeout=wait_for)
+            if report and not task.done():
+                await report_progress(self.describe(operation_id))
+        return self.status(operation_id)
+
+    def forget(self, operation_id: str) -> None:
+        """Stops polling an operation and drops its record, e.g. when the caller waiting on it went away.
+
+        Tracking starts again from scratch if the operation is looked up later.
+        """
+        task = self._tasks.pop(operation_id, None)
+        if task is not None:
+            task.cancel()
+        self._operations.pop(operation_id, None)
+
+    def describe(self, operation_id: str) -> str:
+        """Returns a one-line summary of the operation's progress."""
+        status = self.status(operation_id)
+        detail = status["status_message"] or "in progress"
+        return (
+            f"{status['kind']} {operation_id}: {status['state']} ({detail}), "
+            f"{status['elapsed_seconds']:.0f}s elapsed, {status['polls']} poll(s)"
+        )
+
+    def _finish(self, operation_id: str, state: str, error: Optional[str] = None) -> None:
+        record = self._operations[operation_id]
+        record["state"] = state
+        record["error"] = error
+        record["finished_at"] = time.time()
+        self._tasks.pop(operation_id, None)
+        server_metrics.record_operation(record["kind"], record["finished_at"] - record["started_at"], state)
+
+    def _evict_finished(self) -> None:
+        finished = [op_id for op_id, record in self._operations.items() if record["finished_at"] is not None]
+        for op_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._operations[op_id]
+
+    async def _poll(self, operation_id: str) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        delay = self.initial_delay
+        request = operations_pb2.GetOperationRequest(name=operation_id)
+        record = self._operations[operation_id]
+
+        while True:
+            deployment_client = await get_deployment_client(record["profile"], operation_id)
+            if not deployment_client:
+                self._finish(operation_id, "FAILED", "Deployment Client not initialized.")
+                return
+            try:
+                record["polls"] += 1
+                operation_result = await deployment_client.get_operation(request=request)
+                metadata = cloudsecuritycompliance_v1.OperationMetadata.pb()()
+                if operation_result.metadata.Unpack(metadata):
+                    record["status_message"] = metadata.status_message or record["status_message"]
+                if operation_result.done:
+                    if operation_result.HasField("error"):
+                        logger.error(f"LRO {operation_id} failed: {operation_result.error}")
+                        self._finish(operation_id, "FAILED", operation_result.error.message or str(operation_result.error))
+                    else:
+                        logger.info(f"LRO {operation_id} completed successfully.")
+                        self._finish(operation_id, "SUCCEEDED")
+                    return
+                logger.debug(f"LRO {operation_id} is still in progress... (Attempt {record['polls']})")
+            except TRANSIENT_ERRORS as e:
+                logger.warning(f"Transient error polling LRO {operation_id}, will retry: {e}")
+            except google_exceptions.GoogleAPICallError as e:
+                logger.error(f"Error calling GetOperation for {operation_id}: {e}", exc_info=True)
+                self._finish(operation_id, "FAILED", str(e))
+                return
+            except Exception as e:
+                logger.error(f"Unexpected error fetching LRO status for {operation_id}: {e}", exc_info=True)
+                self._finish(operation_id, "FAILED", f"Unexpected error: {str(e)}")
+                return
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(f"LRO {operation_id} timed out after {self.timeout:.0f} seconds.")
+                self._finish(operation_id, "TIMEOUT")
+                return
+            # Equal jitter: sleep between half and all of the current backoff delay.
+            await asyncio.sleep(min(delay / 2 + random.uniform(0, delay / 2), remaining))
+            delay = min(delay * self.multiplier, self.max_delay)
+
+
+operation_tracker = OperationTracker()
+
+
+async def fetch_lro_status(lro_name: str, timeout: float = 300.0) -> Dict[str, Any]:
+    """Waits for a long-running operation to finish through the operation tracker.
+
+    The wait ends at `timeout` or the call's deadline, whichever comes first. If the
+    calling tool is cancelled, polling of the operation stops too.
+    """
+    logger.info(f"Fetching status for LRO: {lro_name}")
+    timeout = remaining_time(timeout)
+    operation_tracker.track(lro_name)
+    try:
+        status = await operation_tracker.wait(lro_name, timeout)
+    except asyncio.CancelledError:
+        operation_tracker.forget(lro_name)
+        raise
+
+    if status["state"] == "SUCCEEDED":
+        return {"result": "passed", "operation": status}
+    if status["state"] == "RUNNING":
+        logger.warning(f"LRO {lro_name} still running after {timeout:.0f} seconds.")
+        return {"result": "timeout", "operation": status}
+    result = {"result": "failed", "operation": status}
+    if status["error"]:
+        result["error"] = status["error"]
+    return result
+
+def create_cloud_control_metadata_list(
+    cloud_controls: str, parent: str
+) -> "list[cloudsecuritycompliance_v1.CloudControlMetadata]":
+    """Parses 'cloud_control_id#revision,...' into metadata for the controls under `parent`.
+
+    The revision may be omitted ('cloud_control_id'), in which case it is left
+    as 0 for resolve_cloud_control_metadata to fill in. Malformed entries are
+    skipped with a warning.
+    """
     cloud_control_metadata_list = []
     for control_entry in cloud_controls.split(','):
 
@@ -137,158 +1932,1249 @@ def create_cloud_control_metadata_list(cloud_controls: str, parent: str) -> list
 
         # Split control ID and revision
         parts = control_entry.split('#')
-        if len(parts) != 2:
-            print(f"Skipping malformed entry: {control_entry} - missing # or too many #")
+        if len(parts) > 2:
+            logger.warning(f"Skipping malformed entry: {control_entry} - too many #")
             continue
 
-        cloud_control_id, major_revision_str = parts
-        
+        cloud_control_id, major_revision_str = parts[0], parts[1] if len(parts) == 2 else "0"
+
         if not major_revision_str.isdigit():
-            print(f"Skipping non-integer revision: {major_revision_str} in {control_entry}")
+            logger.warning(f"Skipping non-integer revision: {major_revision_str} in {control_entry}")
             continue
 
-        major_revision_id = int(major_revision_str)
+        cloud_control_metadata = cloudsecuritycompliance_v1.CloudControlMetadata(
+            cloud_control_details=cloudsecuritycompliance_v1.CloudControlDetails(
+                name=f"{parent}/cloudControls/{cloud_control_id}", major_revision_id=int(major_revision_str)
+            ),
+            enforcement_mode=cloudsecuritycompliance_v1.EnforcementMode.DETECTIVE
+        )
+        cloud_control_metadata_list.append(cloud_control_metadata)
+    return cloud_control_metadata_list
+
+
+def parse_enforcement_mode(mode: str) -> "cloudsecuritycompliance_v1.EnforcementMode":
+    """Returns the EnforcementMode named `mode` (PREVENTIVE, DETECTIVE or AUDIT), case-insensitively."""
+    name = mode.strip().upper()
+    if name not in ("PREVENTIVE", "DETECTIVE", "AUDIT"):
+        raise ValueError(f"Invalid enforcement mode '{mode}'. Use PREVENTIVE, DETECTIVE or AUDIT.")
+    return cloudsecuritycompliance_v1.EnforcementMode[name]
 
-        # Construct the full control name
-        # control_name = f"{parent_with_location}/cloudControls/{cloud_control_id}"
 
-        print(f"ID: {cloud_control_id}, Major: {major_revision_id}")
+async def get_catalog_item(name: str, profile: str = "", major_revision_id: int = 0) -> Dict[str, Any]:
+    """Returns a framework or cloud control by full name, through the catalog cache.
 
+    Shares cache entries with get_framework and get_cloud_control; a specific
+    `major_revision_id` is cached separately from the latest revision.
+    """
+    kind = "get_framework" if "/frameworks/" in name else "get_cloud_control"
+    key = (name, kind, major_revision_id) if major_revision_id else (name, kind)
+
+    async def fetch() -> Dict[str, Any]:
+        config_client = await get_config_client(profile, name)
+        if not config_client:
+            raise RuntimeError("Config Client not initialized.")
+        if kind == "get_framework":
+            request = cloudsecuritycompliance_v1.GetFrameworkRequest(name=name, major_revision_id=major_revision_id)
+            return proto_message_to_dict(await config_client.get_framework(request=request))
+        request = cloudsecuritycompliance_v1.GetCloudControlRequest(name=name)
+        return proto_message_to_dict(await config_client.get_cloud_control(request=request))
+
+    return await catalog_cache.get_or_fetch(key, fetch)
 
-        cloud_control_metadata = CloudControlMetadata(
-            cloud_control_details=CloudControlDetails(name=f"{parent}/cloudControls/{cloud_control_id}", major_revision_id=major_revision_id),
-            enforcement_mode=EnforcementMode.DETECTIVE
+
+async def resolve_cloud_control_metadata(
+    framework_name: str,
+    cloud_controls: str = "",
+    framework_version: Optional[int] = None,
+    enforcement_mode: str = "DETECTIVE",
+    enforcement_modes: Optional[Dict[str, str]] = None,
+    profile: str = "",
+    max_concurrency: int = 10,
+) -> "list[cloudsecuritycompliance_v1.CloudControlMetadata]":
+    """Builds the cloud control metadata for deploying `framework_name`.
+
+    Without `cloud_controls` the controls, their revisions and parameters are
+    taken from the framework itself. Controls whose revision is still unknown
+    are looked up concurrently through the cache. `enforcement_modes` maps
+    cloud control IDs (or full names) to a mode overriding `enforcement_mode`.
+    """
+    scope = framework_name.split("/frameworks/")[0]
+    if cloud_controls:
+        metadata_list = create_cloud_control_metadata_list(cloud_controls, scope)
+    else:
+        framework = await get_catalog_item(framework_name, profile, framework_version or 0)
+        metadata_list = []
+        for details in framework.get("cloudControlDetails", []):
+            message = cloudsecuritycompliance_v1.CloudControlDetails.pb()()
+            json_format.ParseDict(details, message, ignore_unknown_fields=True)
+            metadata_list.append(
+                cloudsecuritycompliance_v1.CloudControlMetadata(
+                    cloud_control_details=cloudsecuritycompliance_v1.CloudControlDetails.wrap(message)
+                )
+            )
+    if not metadata_list:
+        raise ValueError(f"No cloud controls to deploy for framework '{framework_name}'.")
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def resolve_revision(details: "cloudsecuritycompliance_v1.CloudControlDetails") -> None:
+        async with semaphore:
+            cloud_control = await get_catalog_item(details.name, profile)
+        details.major_revision_id = int(cloud_control.get("majorRevisionId", 0))
+
+    await asyncio.gather(
+        *(
+            resolve_revision(metadata.cloud_control_details)
+            for metadata in metadata_list
+            if not metadata.cloud_control_details.major_revision_id
         )
-        cloud_control_metadata_list.append(cloud_control_metadata)
-    return cloud_control_metadata_list
+    )
+
+    default_mode = parse_enforcement_mode(enforcement_mode)
+    overrides = {key.rsplit("/", 1)[-1]: parse_enforcement_mode(mode) for key, mode in (enforcement_modes or {}).items()}
+    deployed_ids = {metadata.cloud_control_details.name.rsplit("/", 1)[-1] for metadata in metadata_list}
+    unknown = sorted(set(overrides) - deployed_ids)
+    if unknown:
+        raise ValueError(f"enforcement_modes names cloud controls that are not being deployed: {', '.join(unknown)}.")
+    for metadata in metadata_list:
+        metadata.enforcement_mode = overrides.get(metadata.cloud_control_details.name.rsplit("/", 1)[-1], default_mode)
+    return metadata_list
+
+
+def build_create_framework_deployment_request(
+    parent: str,
+    framework_deployment_id: str,
+    framework_name: str,
+    cloud_control_metadata_list: "list[cloudsecuritycompliance_v1.CloudControlMetadata]",
+    framework_version: Optional[int] = None,
+    location: str = "global",
+    target_resource: Optional[str] = None,
+) -> "cloudsecuritycompliance_v1.CreateFrameworkDeploymentRequest":
+    """Builds the request for deploying a framework on `parent` (or `target_resource`)."""
+    parent_with_location = f"{parent}/locations/{location}"
+
+    # Set target resource if provided
+    if not target_resource:
+        target_resource = parent
+
+    framework_reference = cloudsecuritycompliance_v1.FrameworkReference(framework = framework_name)
+    if framework_version:
+        framework_reference.major_revision_id = framework_version
+
+    # Create the framework deployment object
+    framework_deployment = cloudsecuritycompliance_v1.FrameworkDeployment(
+        framework=framework_reference,
+        cloud_control_metadata=cloud_control_metadata_list,
+        target_resource_config = cloudsecuritycompliance_v1.TargetResourceConfig(
+            existing_target_resource=target_resource
+        ),
+        name = f"{parent_with_location}/frameworkDeployments/{framework_deployment_id}"
+    )
+
+    return cloudsecuritycompliance_v1.CreateFrameworkDeploymentRequest(
+        parent=parent_with_location,
+        framework_deployment_id=framework_deployment_id,
+        framework_deployment=framework_deployment,
+    )
+
+# --- Bulk Operations ---
+
+# Upper bound on the folders and projects a bulk operation expands `folder` into.
+MAX_BULK_FOLDER_NODES = 10000
+
+
+async def resolve_bulk_targets(
+    parents: Optional[List[str]], folder: Optional[str], recursive: bool, profile: str = ""
+) -> List[str]:
+    """Combines explicit parents with the active projects under a folder, dropping duplicates.
+
+    `folder` may be given as 'folders/{folder_id}' or just the numeric ID.
+    """
+    targets = list(parents or [])
+    if folder:
+        folder = folder if folder.startswith("folders/") else f"folders/{folder}"
+        folders_client, projects_client = await get_resource_manager_clients(profile, folder)
+        if not folders_client or not projects_client:
+            raise RuntimeError("Resource Manager Clients not initialized.")
+        semaphore = asyncio.Semaphore(10)
+        nodes, truncated = await walk_hierarchy(
+            folder,
+            concurrency_limited(folders_client.list_folders, semaphore),
+            concurrency_limited(projects_client.list_projects, semaphore),
+            recursive,
+            MAX_BULK_FOLDER_NODES,
+        )
+        if truncated:
+            raise ValueError(
+                f"'{folder}' holds more than {MAX_BULK_FOLDER_NODES} folders and projects; "
+                "use smaller folders or explicit parents."
+            )
+        targets.extend(node for node in nodes if node.startswith("projects/"))
+    return list(dict.fromkeys(target.strip() for target in targets if target and target.strip()))
+
+
+async def run_bulk_operations(
+    targets: List[str],
+    submit,
+    kind: str,
+    max_concurrency: int = 10,
+    wait_timeout_seconds: float = 300,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Submits one long-running operation per target and aggregates the outcomes.
+
+    `submit` is a coroutine function taking a target and returning a tuple of
+    (LRO name, resource name). Submissions run at most `max_concurrency` at a time;
+    retries are left to the shared ApiCallPolicy, which only retries creates and
+    deletes on quota errors, since a create or delete that timed out may still
+    have gone through. All submitted operations are then awaited together for up
+    to `wait_timeout_seconds`; rows still running after that carry their
+    operation ID for get_operation_status.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def submit_one(target: str) -> Dict[str, Any]:
+        row = {"target": target, "state": "SUBMIT_FAILED", "operation_id": None, "error": None}
+        async with semaphore:
+            try:
+                lro_name, resource = await submit(target)
+            except Exception as e:
+                logger.error(f"Failed to submit {kind} for {target}: {e}")
+                row["error"] = str(e)
+                return row
+        operation_tracker.track(lro_name, kind, resource, profile)
+        row["operation_id"] = lro_name
+        row["state"] = "RUNNING"
+        return row
+
+    submitted_count = 0
+
+    async def submit_and_report(target: str) -> Dict[str, Any]:
+        nonlocal submitted_count
+        row = await submit_one(target)
+        submitted_count += 1
+        await report_progress(f"Submitted {submitted_count}/{len(targets)} {kind} operations")
+        return row
+
+    rows = await asyncio.gather(*(submit_and_report(target) for target in targets))
+
+    submitted = [row for row in rows if row["operation_id"]]
+    wait_timeout_seconds = remaining_time(wait_timeout_seconds)
+    if submitted and wait_timeout_seconds > 0:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_timeout_seconds
+        pending = {
+            asyncio.ensure_future(operation_tracker.wait(row["operation_id"], report=False)) for row in submitted
+        }
+        try:
+            while pending and loop.time() < deadline:
+                _, pending = await asyncio.wait(
+                    pending, timeout=min(operation_tracker.initial_delay, deadline - loop.time())
+                )
+                await report_progress(f"{len(submitted) - len(pending)}/{len(submitted)} {kind} operations finished")
+        except asyncio.CancelledError:
+            # Nobody will receive the operation handles, so stop polling them.
+            for row in submitted:
+                operation_tracker.forget(row["operation_id"])
+            raise
+        finally:
+            for waiter in pending:
+                waiter.cancel()
+    for row in submitted:
+        status = operation_tracker.status(row["operation_id"])
+        if status:
+            row["state"] = status["state"]
+            row["error"] = status["error"]
+
+    summary: Dict[str, int] = {}
+    for row in rows:
+        summary[row["state"]] = summary.get(row["state"], 0) + 1
+    return {"results": rows, "summary": summary, "count": len(rows)}
+
+
+# --- Compliance Posture ---
+# get_compliance_posture walks an organization or folder and lists the framework
+# deployments on every node concurrently, so the agent gets one target x framework
+# matrix instead of listing deployments parent by parent and joining the results.
+
+async def walk_hierarchy(
+    root: str, list_folders, list_projects, recursive: bool, max_targets: int
+) -> tuple[Dict[str, Optional[str]], bool]:
+    """Returns {resource: parent} for `root` and the active folders and projects beneath it.
+
+    Each level of the hierarchy is expanded concurrently. Returns the nodes and
+    whether the walk stopped early because it reached `max_targets`.
+    """
+    nodes: Dict[str, Optional[str]] = {root: None}
+    level = [] if root.startswith("projects/") else [root]
+    while level:
+
+        async def expand(parent: str) -> tuple[str, List[str], List[str]]:
+            folders = ListStream(list_folders, resourcemanager_v3.ListFoldersRequest(parent=parent), "folders")
+            projects = ListStream(list_projects, resourcemanager_v3.ListProjectsRequest(parent=parent), "projects")
+            child_folders = [folder.name async for folder in folders if folder.state == folder.State.ACTIVE]
+            child_projects = [project.name async for project in projects if project.state == project.State.ACTIVE]
+            return parent, child_folders, child_projects
+
+        next_level = []
+        for parent, child_folders, child_projects in await asyncio.gather(*(expand(parent) for parent in level)):
+            for child in child_folders + child_projects:
+                if len(nodes) >= max_targets:
+                    return nodes, True
+                nodes[child] = parent
+            next_level.extend(child_folders)
+        level = next_level if recursive else []
+    return nodes, False
+
+
+def short_state(state: Any) -> str:
+    """Returns a deployment state without its DEPLOYMENT_STATE_ prefix, e.g. 'READY'."""
+    name = getattr(state, "name", str(state))
+    return name.removeprefix("DEPLOYMENT_STATE_")
+
+
+def build_posture_matrix(
+    nodes: Dict[str, Optional[str]], deployments: Dict[str, Dict[str, str]], frameworks: List[str]
+) -> tuple[Dict[str, List[str]], Dict[str, Dict[str, int]], Dict[str, List[str]]]:
+    """Builds the target x framework matrix from each target's direct deployments.
+
+    A cell holds the target's own deployment state, INHERITED when an ancestor
+    within the walked hierarchy has a deployment of that framework, or MISSING.
+    Returns the matrix rows, the per-framework state counts and the targets
+    missing each framework.
+    """
+    matrix: Dict[str, List[str]] = {}
+    counts: Dict[str, Dict[str, int]] = {framework: {} for framework in frameworks}
+    missing: Dict[str, List[str]] = {framework: [] for framework in frameworks}
+    for target in nodes:
+        row = []
+        for framework in frameworks:
+            state = deployments.get(target, {}).get(framework)
+            if state is None:
+                ancestor = nodes[target]
+                while ancestor is not None and framework not in deployments.get(ancestor, {}):
+                    ancestor = nodes[ancestor]
+                state = "INHERITED" if ancestor is not None else "MISSING"
+            if state == "MISSING":
+                missing[framework].append(target)
+            counts[framework][state] = counts[framework].get(state, 0) + 1
+            row.append(state)
+        matrix[target] = row
+    return matrix, counts, missing
+
+
+# --- Batch Reads ---
+# The batch_get_* tools fetch many resources in one tool call, so inspecting the
+# controls of a framework is one round-trip for the agent instead of one per ID.
+# Each item goes through the corresponding single-item tool, which keeps caching,
+# single-flight de-duplication and error mapping identical.
+
+MAX_BATCH_SIZE = 500
+
+
+async def run_batch_reads(
+    ids: List[str], get_one, max_concurrency: int = 10, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Calls `get_one(id)` for each distinct ID, at most `max_concurrency` at a time.
+
+    `get_one` is a single-item tool returning either the resource or an
+    {"error", "details"} dictionary. Results keep the order of `ids`; failed
+    items carry their error instead of aborting the batch.
+    """
+    ids = list(dict.fromkeys(ids or []))
+    if not ids:
+        return {"error": "Invalid Argument", "details": "Provide at least one ID."}
+    if len(ids) > MAX_BATCH_SIZE:
+        return {"error": "Invalid Argument", "details": f"At most {MAX_BATCH_SIZE} IDs can be fetched per call, got {len(ids)}."}
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def read(resource_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            result = await get_one(resource_id)
+        if "error" in result:
+            return {"id": resource_id, "error": result["error"], "details": result.get("details")}
+        return {"id": resource_id, "item": project_fields(result, fields)}
+
+    results = await asyncio.gather(*(read(resource_id) for resource_id in ids))
+    failed = sum("error" in result for result in results)
+    return {"results": results, "succeeded": len(results) - failed, "failed": failed, "count": len(results)}
+
+
+# --- Drift Detection ---
+# detect_drift compares every framework deployment under a parent with the latest
+# revision of its framework. Deployments and frameworks are each indexed once into
+# dictionaries keyed by cloud control ID, so a deployment is diffed with set
+# operations against its framework's index rather than by scanning control lists.
+
+def index_deployed_controls(deployment: Any) -> Dict[str, tuple[int, str]]:
+    """Returns {cloud control ID: (major revision, enforcement mode)} for a framework deployment."""
+    # Read the raw protobuf: proto-plus wraps every nested field access, which dominates
+    # the cost on deployments with many controls.
+    mode_names = {mode.value: mode.name for mode in cloudsecuritycompliance_v1.EnforcementMode}
+    return {
+        metadata.cloud_control_details.name.rsplit("/", 1)[-1]: (
+            metadata.cloud_control_details.major_revision_id,
+            mode_names.get(metadata.enforcement_mode, str(metadata.enforcement_mode)),
+        )
+        for metadata in getattr(deployment, "_pb", deployment).cloud_control_metadata
+    }
+
+
+def diff_deployment(
+    deployed: Dict[str, tuple[int, str]],
+    baseline: Dict[str, tuple[int, str]],
+    expected_modes: Optional[Dict[str, str]] = None,
+) -> Dict[str, list]:
+    """Diffs a deployment's control index against its framework's baseline index.
+
+    Returns the controls missing from the deployment, the extra controls it
+    deploys, the controls pinned to an older revision than the baseline and,
+    when `expected_modes` is given, the controls whose enforcement mode differs.
+    """
+    outdated = [
+        {"cloud_control": control, "deployed_revision": deployed[control][0], "latest_revision": revision}
+        for control, (revision, _) in baseline.items()
+        if control in deployed and deployed[control][0] < revision
+    ]
+    mode_mismatches = []
+    if expected_modes is not None:
+        mode_mismatches = [
+            {"cloud_control": control, "deployed_mode": mode, "expected_mode": expected_modes[control]}
+            for control, (_, mode) in deployed.items()
+            if control in expected_modes and mode != expected_modes[control]
+        ]
+    return {
+        "missing_controls": sorted(baseline.keys() - deployed.keys()),
+        "extra_controls": sorted(deployed.keys() - baseline.keys()),
+        "outdated_controls": outdated,
+        "enforcement_mode_mismatches": mode_mismatches,
+    }
+
+
+# --- Compliance Bundles ---
+# A bundle is a YAML or JSON document holding custom cloud control and framework
+# definitions, so a library of them can be created, or copied to another
+# organization, in one tool call. Definitions use the field names of the API
+# (as returned by get_cloud_control and get_framework, in camelCase or
+# snake_case) with an `id` instead of the full resource name:
+#
+#   cloud_controls:
+#   - id: require-secure-boot
+#     displayName: Require Secure Boot
+#     severity: HIGH
+#     cel_expression: has(resource.data.shieldedInstanceConfig) && resource.data.shieldedInstanceConfig.enableSecureBoot
+#     resource_types: [compute.googleapis.com/Instance]
+#   frameworks:
+#   - id: hardened-vms
+#     displayName: Hardened VMs
+#     cloudControls: [require-secure-boot, {id: other-control, majorRevisionId: 2}]
+#
+# `cel_expression` with `resource_types` is shorthand for one entry of `rules`.
+# Frameworks list their controls by ID under `cloudControls`; a control without
+# a revision uses the one just created by the import, or else its latest.
+# YAML needs the optional PyYAML package.
+
+BUNDLE_EXPORT_PAGE_SIZE = 100
+BUNDLE_OUTPUT_ONLY_FIELDS = {"name", "majorRevisionId", "createTime", "updateTime", "relatedFrameworks", "type"}
+
+
+def bundle_format(path: str, format: str = "") -> str:
+    """Returns 'yaml' or 'json': `format` if given, else from the file extension."""
+    format = (format or ("yaml" if path.lower().endswith((".yaml", ".yml")) else "json")).lower()
+    if format not in ("yaml", "json"):
+        raise ValueError(f"Unsupported bundle format '{format}'. Use 'yaml' or 'json'.")
+    return format
+
+
+def import_yaml() -> Any:
+    """Returns the PyYAML module, raising ValueError if it is not installed."""
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("YAML bundles need PyYAML: pip install pyyaml (or the `yaml` extra), or use a JSON bundle.")
+    return yaml
+
+
+def load_compliance_bundle(path: str, format: str = "") -> Dict[str, list]:
+    """Reads a bundle file and checks that every definition has a unique `id`."""
+    with open(path, encoding="utf-8") as bundle_file:
+        if bundle_format(path, format) == "yaml":
+            yaml = import_yaml()
+            bundle = yaml.load(bundle_file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        else:
+            bundle = json.load(bundle_file)
+    if not isinstance(bundle, dict):
+        raise ValueError("A bundle must be a mapping with 'cloud_controls' and/or 'frameworks' lists.")
+    result = {}
+    for section in ("cloud_controls", "frameworks"):
+        definitions = bundle.get(section) or []
+        ids = [definition.get("id") if isinstance(definition, dict) else None for definition in definitions]
+        if not all(ids):
+            raise ValueError(f"Every entry of '{section}' must be a mapping with an 'id'.")
+        duplicates = sorted({i for i in ids if ids.count(i) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate IDs in '{section}': {', '.join(duplicates)}.")
+        result[section] = definitions
+    result["deployments"] = bundle.get("deployments") or []
+    return result
+
+
+def parse_definition(message_class: Any, definition: Dict[str, Any], kind: str) -> Any:
+    """Builds an API message from a bundle definition, ignoring output-only fields."""
+    fields = {key: value for key, value in definition.items() if key not in BUNDLE_OUTPUT_ONLY_FIELDS}
+    message = message_class.pb()()
+    try:
+        json_format.ParseDict(fields, message)
+    except json_format.ParseError as e:
+        raise ValueError(f"Invalid {kind} definition: {e}")
+    return message_class.wrap(message)
+
+
+def cloud_control_from_definition(definition: Dict[str, Any]) -> "cloudsecuritycompliance_v1.CloudControl":
+    definition = {key: value for key, value in definition.items() if key != "id"}
+    expression = definition.pop("cel_expression", None) or definition.pop("celExpression", None)
+    resource_types = definition.pop("resource_types", None) or definition.pop("resourceTypes", None) or []
+    if expression:
+        rule = {"celExpression": {"expression": expression, "resourceTypesValues": {"values": list(resource_types)}}}
+        definition["rules"] = list(definition.get("rules") or []) + [rule]
+    return parse_definition(cloudsecuritycompliance_v1.CloudControl, definition, "cloud control")
+
+
+def framework_control_references(definition: Dict[str, Any], scope: str) -> List[tuple[str, int, list]]:
+    """Returns (full cloud control name, revision or 0, parameters) for each control a framework lists."""
+    references = []
+    for entry in definition.get("cloudControls") or definition.get("cloud_controls") or []:
+        entry = {"id": entry} if isinstance(entry, str) else entry
+        control = entry.get("id") or entry.get("name") or ""
+        name = control if "/cloudControls/" in control else f"{scope}/cloudControls/{control}"
+        revision = int(entry.get("majorRevisionId") or entry.get("major_revision_id") or 0)
+        references.append((name, revision, entry.get("parameters") or []))
+    return references
+
+
+def framework_from_definition(
+    definition: Dict[str, Any], scope: str, revisions: Dict[str, int]
+) -> "cloudsecuritycompliance_v1.Framework":
+    """Builds a framework, taking control revisions missing from the definition from `revisions`."""
+    fields = {
+        key: value for key, value in definition.items() if key not in ("id", "cloudControls", "cloud_controls")
+    }
+    fields["cloudControlDetails"] = [
+        {"name": name, "majorRevisionId": revision or revisions.get(name, 0), "parameters": parameters}
+        for name, revision, parameters in framework_control_references(definition, scope)
+    ]
+    return parse_definition(cloudsecuritycompliance_v1.Framework, fields, "framework")
+
+
+def cloud_control_definition(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Turns a cloud control (as a JSON-style dict) into a bundle definition."""
+    definition = {"id": item["name"].rsplit("/", 1)[-1]}
+    definition.update((key, value) for key, value in item.items() if key not in BUNDLE_OUTPUT_ONLY_FIELDS)
+    return definition
+
+
+def framework_definition(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Turns a framework (as a JSON-style dict) into a bundle definition listing its controls by ID."""
+    definition = {"id": item["name"].rsplit("/", 1)[-1]}
+    definition.update(
+        (key, value) for key, value in item.items() if key not in BUNDLE_OUTPUT_ONLY_FIELDS | {"cloudControlDetails"}
+    )
+    definition["cloudControls"] = [
+        {
+            "id": details["name"].rsplit("/", 1)[-1],
+            "majorRevisionId": int(details.get("majorRevisionId", 0)),
+            **({"parameters": details["parameters"]} if details.get("parameters") else {}),
+        }
+        for details in item.get("cloudControlDetails", [])
+    ]
+    return definition
+
+
+class BundleWriter:
+    """Writes a bundle one definition at a time, so an export never holds the whole catalog."""
+
+    def __init__(self, path: str, format: str):
+        self._yaml = import_yaml() if format == "yaml" else None
+        self._file = open(path, "w", encoding="utf-8")
+        self._first = True
+        self._sections = 0
+        if not self._yaml:
+            self._file.write("{")
+
+    def section(self, name: str) -> None:
+        if self._yaml:
+            self._file.write(f"{name}:\n")
+        else:
+            self._file.write(f"{', ' if self._sections else ''}{json.dumps(name)}: [")
+        self._sections += 1
+        self._first = True
+
+    def end_section(self) -> None:
+        if self._yaml:
+            if self._first:
+                self._file.write("  []\n")  # Keep an empty section a list rather than null.
+        else:
+            self._file.write("\n]")
+
+    def write(self, definition: Dict[str, Any]) -> None:
+        if self._yaml:
+            dumper = getattr(self._yaml, "CSafeDumper", self._yaml.SafeDumper)
+            self._file.write(self._yaml.dump([definition], Dumper=dumper, sort_keys=False, allow_unicode=True))
+        else:
+            self._file.write(("\n  " if self._first else ",\n  ") + json.dumps(definition))
+        self._first = False
+
+    def close(self) -> None:
+        if not self._yaml:
+            self._file.write("}\n")
+        self._file.close()
+
+
+# --- Plan and Apply ---
+# plan_compliance_changes diffs a desired-state document against the live catalog
+# and deployments, and stores the minimal list of changes that reconciles them.
+# The document is a compliance bundle with an extra `deployments` list:
+#
+#   deployments:
+#   - framework: hardened-vms        # ID in the organization's catalog, or full name
+#     targets: [projects/my-project, folders/123456789]
+#     id: hardened-vms               # deployment ID on each target (defaults to the framework ID)
+#     enforcement_mode: DETECTIVE
+#     enforcement_modes: {require-secure-boot: PREVENTIVE}
+#
+# apply_compliance_plan runs the changes as a dependency graph: a framework change
+# waits for the changes to the cloud controls it lists, and a deployment change
+# for its framework's change, while independent changes run in parallel. The
+# catalog is read with one full listing per collection through the in-memory
+# catalog cache, so planning an unchanged document again costs little more than
+# one deployment listing per target. Planning never reads the on-disk snapshot,
+# which may be from an earlier session: a stale catalog would plan creates of
+# definitions that already exist. It refreshes the snapshot instead.
+
+MAX_STORED_PLANS = 32
+
+compliance_plans: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+async def load_catalog_index(
+    parent: str, kind: str, list_method, refresh: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """Returns {name: item as a JSON-style dict} for a whole catalog collection, listed from the API.
+
+    Goes through the in-memory catalog cache unless `refresh` is set, but never reads the snapshot.
+    """
+    request_class = (
+        cloudsecuritycompliance_v1.ListFrameworksRequest
+        if kind == "frameworks"
+        else cloudsecuritycompliance_v1.ListCloudControlsRequest
+    )
+
+    async def fetch() -> Dict[str, Dict[str, Any]]:
+        items = await load_full_catalog(kind, list_method, request_class(parent=parent, page_size=100), refresh=True)
+        return {item.name: proto_message_to_dict(item) for item in items}
+
+    return await catalog_cache.get_or_fetch((parent, "catalog_index", kind), fetch, refresh=refresh)
+
+
+def changed_fields(desired: Dict[str, Any], live: Dict[str, Any]) -> List[str]:
+    """Returns the top-level fields set in `desired` whose value differs from `live`."""
+    return [key for key, value in desired.items() if key not in BUNDLE_OUTPUT_ONLY_FIELDS and live.get(key) != value]
+
+
+def update_mask_paths(fields: List[str]) -> List[str]:
+    """Turns JSON field names into field mask paths (camelCase to snake_case)."""
+    return [re.sub(r"([A-Z])", r"_\1", field).lower() for field in fields]
+
+
+def plan_deployment_entries(document: Dict[str, Any], parent: str) -> List[Dict[str, Any]]:
+    """Expands the document's `deployments` into one entry per (framework, target), checking them."""
+    entries = {}
+    for deployment in document["deployments"]:
+        if not isinstance(deployment, dict) or not deployment.get("framework"):
+            raise ValueError("Every entry of 'deployments' must be a mapping with a 'framework'.")
+        framework = deployment["framework"]
+        framework_name = framework if "/frameworks/" in framework else f"{parent}/frameworks/{framework}"
+        targets = deployment.get("targets") or ([deployment["target"]] if deployment.get("target") else [])
+        if not targets:
+            raise ValueError(f"The deployment of '{framework}' has no 'targets'.")
+        mode = deployment.get("enforcement_mode", "DETECTIVE")
+        overrides = deployment.get("enforcement_modes") or {}
+        expected_modes = (parse_enforcement_mode(mode).name, {
+            key.rsplit("/", 1)[-1]: parse_enforcement_mode(value).name for key, value in overrides.items()
+        })
+        for target in targets:
+            if (framework_name, target) in entries:
+                raise ValueError(f"'{framework}' is listed more than once for target '{target}'.")
+            entries[(framework_name, target)] = {
+                "framework": framework_name,
+                "target": target,
+                "id": deployment.get("id") or framework_name.rsplit("/", 1)[-1],
+                "enforcement_mode": mode,
+                "enforcement_modes": overrides,
+                "expected_modes": expected_modes,
+            }
+    return list(entries.values())
+
+
+async def build_compliance_plan(
+    parent: str,
+    location: str,
+    document: Dict[str, Any],
+    config_client: Any,
+    deployment_client: Any,
+    prune: bool,
+    replace_outdated: bool,
+    max_concurrency: int,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """Diffs a desired-state document against the live state and returns the changes, in dependency order.
+
+    Each change has a `key` and lists the keys of the changes it depends on
+    under `depends_on`. The definitions a change needs at apply time are
+    returned separately, keyed the same way.
+    """
+    controls, frameworks = await asyncio.gather(
+        load_catalog_index(parent, "cloud_controls", config_client.list_cloud_controls, refresh),
+        load_catalog_index(parent, "frameworks", config_client.list_frameworks, refresh),
+    )
+    changes: List[Dict[str, Any]] = []
+    definitions: Dict[str, Any] = {}
+    revisions: Dict[str, int] = {}
+    pending: Dict[str, str] = {}  # Resource name -> key of the change creating or updating it.
+
+    def add(key: str, action: str, kind: str, resource: str, reason: str, depends_on=(), fields=None) -> None:
+        changes.append({
+            "key": key,
+            "action": action,
+            "kind": kind,
+            "resource": resource,
+            "reason": reason,
+            "changed_fields": fields or [],
+            "depends_on": sorted(set(depends_on)),
+        })
+
+    for definition in document["cloud_controls"]:
+        name = f"{parent}/cloudControls/{definition['id']}"
+        key = f"cloud_control:{definition['id']}"
+        desired = proto_message_to_dict(cloud_control_from_definition(definition))
+        live = controls.get(name)
+        if live is None:
+            add(key, "CREATE", "cloud_control", name, "Not found in the catalog.")
+        else:
+            fields = changed_fields(desired, live)
+            if not fields:
+                continue
+            add(key, "UPDATE", "cloud_control", name, f"Differs in {', '.join(fields)}.", fields=fields)
+        definitions[key] = definition
+        pending[name] = key
+
+    for definition in document["frameworks"]:
+        name = f"{parent}/frameworks/{definition['id']}"
+        key = f"framework:{definition['id']}"
+        references = framework_control_references(definition, parent)
+        expected = {}
+        for control, revision, _ in references:
+            if control not in controls and control not in pending:
+                raise ValueError(f"Framework '{definition['id']}' lists unknown cloud control '{control}'.")
+            if control in controls:
+                revisions[control] = int(controls[control].get("majorRevisionId", 0))
+            expected[control] = revision or (None if control in pending else revisions[control])
+        depends_on = [pending[control] for control, _, _ in references if control in pending]
+
+        desired = proto_message_to_dict(framework_from_definition(definition, parent, {}))
+        desired.pop("cloudControlDetails", None)
+        live = frameworks.get(name)
+        if live is None:
+            add(key, "CREATE", "framework", name, "Not found in the catalog.", depends_on)
+        else:
+            fields = changed_fields(desired, live)
+            deployed = {
+                details["name"]: int(details.get("majorRevisionId", 0))
+                for details in live.get("cloudControlDetails", [])
+            }
+            if deployed.keys() != expected.keys() or any(
+                revision is None or deployed[control] != revision for control, revision in expected.items()
+            ):
+                fields.append("cloudControlDetails")
+            if not fields:
+                continue
+            add(key, "UPDATE", "framework", name, f"Differs in {', '.join(fields)}.", depends_on, fields)
+        definitions[key] = definition
+        pending[name] = key
+
+    entries = plan_deployment_entries(document, parent)
+    for entry in entries:
+        if entry["framework"] not in frameworks and entry["framework"] not in pending:
+            raise ValueError(f"Deployment of unknown framework '{entry['framework']}'.")
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def scan(target: str) -> list:
+        request = cloudsecuritycompliance_v1.ListFrameworkDeploymentsRequest(
+            parent=f"{target}/locations/{location}", page_size=100
+        )
+        async with semaphore:
+            return [
+                deployment
+                async for deployment in ListStream(
+                    deployment_client.list_framework_deployments, request, "framework_deployments"
+                )
+            ]
+
+    targets = list(dict.fromkeys(entry["target"] for entry in entries))
+    live_deployments: Dict[tuple, list] = {}
+    for deployments in await asyncio.gather(*(scan(target) for target in targets)):
+        for deployment in deployments:
+            target = deployment.name.split("/locations/")[0]
+            live_deployments.setdefault((deployment.framework.framework, target), []).append(deployment)
+
+    drift = []
+    for entry in entries:
+        framework, target = entry["framework"], entry["target"]
+        name = f"{target}/locations/{location}/frameworkDeployments/{entry['id']}"
+        key = f"framework_deployment:{target}:{entry['id']}"
+        depends_on = [pending[framework]] if framework in pending else []
+        existing = live_deployments.get((framework, target), [])
+        if not existing:
+            add(key, "CREATE", "framework_deployment", name, "Not deployed on the target.", depends_on)
+            definitions[key] = entry
+            continue
+
+        deployment = existing[0]
+        default_mode, overrides = entry["expected_modes"]
+        reasons = []
+        if framework in pending:
+            reasons.append("its framework changes in this plan")
+        elif deployment.framework.major_revision_id and deployment.framework.major_revision_id < int(
+            frameworks[framework].get("majorRevisionId", 0)
+        ):
+            reasons.append("it is pinned to an older framework revision")
+        if any(
+            mode != overrides.get(control, default_mode)
+            for control, (_, mode) in index_deployed_controls(deployment).items()
+        ):
+            reasons.append("its enforcement modes differ")
+        if reasons and replace_outdated:
+            add(key, "REPLACE", "framework_deployment", deployment.name, f"Outdated: {'; '.join(reasons)}.", depends_on)
+            definitions[key] = {**entry, "id": deployment.name.rsplit("/", 1)[-1]}
+        elif reasons:
+            drift.append({"resource": deployment.name, "reason": f"Outdated: {'; '.join(reasons)}."})
+        if prune:
+            for duplicate in existing[1:]:
+                add(f"framework_deployment:{duplicate.name}", "DELETE", "framework_deployment", duplicate.name,
+                    "Duplicate deployment of the framework on the target.")
+
+    if prune:
+        desired_pairs = {(entry["framework"], entry["target"]) for entry in entries}
+        managed = {entry["framework"] for entry in entries}
+        for (framework, target), deployments in live_deployments.items():
+            if framework in managed and (framework, target) not in desired_pairs:
+                for deployment in deployments:
+                    add(f"framework_deployment:{deployment.name}", "DELETE", "framework_deployment", deployment.name,
+                        "Deployment of a managed framework on a target the document does not list.")
+
+    return {"changes": changes, "definitions": definitions, "revisions": revisions, "drift": drift}
+
+
+async def run_change_graph(changes: List[Dict[str, Any]], execute, max_concurrency: int) -> List[Dict[str, Any]]:
+    """Runs `execute(change)` for every change once the changes it depends on have been applied.
+
+    Changes must come in dependency order. At most `max_concurrency` changes run
+    at a time; a change whose dependency was not applied is skipped.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    tasks: Dict[str, asyncio.Task] = {}
+    finished = 0
+
+    async def run(change: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal finished
+        row = {
+            "key": change["key"],
+            "action": change["action"],
+            "resource": change["resource"],
+            "status": "APPLIED",
+            "error": None,
+        }
+        for dependency in change["depends_on"]:
+            if (await tasks[dependency])["status"] != "APPLIED":
+                row.update(status="SKIPPED", error=f"Depends on '{dependency}', which was not applied.")
+                return row
+        async with semaphore:
+            try:
+                await execute(change)
+            except Exception as e:
+                logger.error(f"Failed to apply {change['action']} {change['resource']}: {e}")
+                row.update(status="FAILED", error=str(e))
+        finished += 1
+        await report_progress(f"Applied {finished}/{len(changes)} changes")
+        return row
+
+    for change in changes:
+        tasks[change["key"]] = asyncio.create_task(run(change))
+    return list(await asyncio.gather(*tasks.values()))
+
 
 # --- Config Service Tools (Frameworks and Cloud Controls) ---
 
 @mcp.tool()
+@tool_call
 async def list_frameworks(
     organization_id: str,
     location: str = "global",
     page_size: int = 50,
+    page_token: str = "",
+    max_results: Optional[int] = None,
+    filter: str = "",
+    order_by: str = "",
+    fields: Optional[List[str]] = None,
+    refresh: bool = False,
+    output_format: str = "full",
+    max_response_bytes: int = 0,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: list_frameworks
 
-    Description: Lists all compliance frameworks available in an organization. Frameworks can be built-in
-                 (e.g., CIS, NIST, FedRAMP) or custom-defined.
+    Description: Lists compliance frameworks available in an organization, one page at a time. Frameworks can be
+                 built-in (e.g., CIS, NIST, FedRAMP) or custom-defined. Results are cached for the session.
     Parameters:
     organization_id (required): The Google Cloud organization ID (e.g., '123456789012').
     location (optional): The location for the frameworks. Defaults to 'global'.
-    page_size (optional): Maximum number of frameworks to return. Defaults to 50.
+    page_size (optional): Number of frameworks requested per API page. Defaults to 50.
+    page_token (optional): The next_page_token from a previous call, to continue the listing. When it came from a
+                           truncated response, pass the other arguments unchanged.
+    max_results (optional): Maximum number of frameworks to return (at most 1000). Defaults to page_size.
+    filter (optional): Local filter applied as results stream in, e.g. 'type=CUSTOM AND displayName:CIS'.
+                       Terms are field=value, field!=value or field:substring (field:* means the field is set), joined by AND.
+                       Fields are dotted paths in the returned JSON; shorthand: control (a cloud control in the framework).
+    order_by (optional): Comma separated 'field [asc|desc]' keys used to sort the results returned by this call, e.g. 'displayName'.
+    fields (optional): List of fields to return for each item, e.g. ['name', 'displayName', 'type']. Defaults to all fields.
+    refresh (optional): If true, bypass the cache and fetch fresh results from the API. Defaults to false.
+    output_format (optional): 'full' (every field), 'compact' (key fields only, unless `fields` are given) or 'table'
+                              (the same fields as `columns` plus one row of values per item). Defaults to 'full'.
+    max_response_bytes (optional): Upper bound on the encoded response size. Items that do not fit are left out, and
+                                   `truncated` is set with a `next_page_token` resuming at the first of them.
+                                   Defaults to no limit.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with `frameworks` (in `table` format, a dictionary of `columns` and `rows`), `count` and
+             `next_page_token` (empty when there are no more results).
     """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
     if not config_client:
         return {"error": "Config Client not initialized."}
 
     parent = f"organizations/{organization_id}/locations/{location}"
     logger.info(f"Listing frameworks for parent: {parent}")
 
-    try:
-        request = ListFrameworksRequest(
+    limit = resolve_max_results(max_results, page_size)
+
+    async def fetch() -> Dict[str, Any]:
+        request = cloudsecuritycompliance_v1.ListFrameworksRequest(
             parent=parent,
             page_size=page_size,
+            page_token=page_token,
         )
-        
-        response_pager = config_client.list_frameworks(request=request)
-        
-        frameworks = []
-        for framework in response_pager:
-            framework_dict = proto_message_to_dict(framework)
-            frameworks.append(framework_dict)
 
+        frameworks, next_page_token, source = await list_catalog_page(
+            "frameworks",
+            config_client.list_frameworks,
+            request,
+            limit,
+            refresh,
+            lambda item: proto_message_to_dict(item, mask_fields),
+            make_local_predicate(filter),
+        )
         return {
             "frameworks": frameworks,
             "count": len(frameworks),
+            "next_page_token": next_page_token,
+            "source": source,
         }
 
+    try:
+        fields = output_fields(cloudsecuritycompliance_v1.Framework, fields, output_format)
+        # Only serialize the requested fields, plus whatever the filter and sort order read.
+        mask_fields = fields and list(fields) + expression_fields(filter, order_by)
+        cache_key = (parent, "list_frameworks", page_size, page_token, limit, filter, order_by, tuple(fields or ()))
+        result = await catalog_cache.get_or_fetch(cache_key, fetch, refresh)
+        return shape_list_response(
+            result, "frameworks", output_format, fields, order_by, page_token, max_response_bytes
+        )
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
     except google_exceptions.NotFound as e:
         logger.error(f"Organization not found: {e}")
         return {"error": "Not Found", "details": f"Could not find organization '{organization_id}'. {str(e)}"}
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
 async def get_framework(
     organization_id: str,
     framework_id: str,
     location: str = "global",
+    refresh: bool = False,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: get_framework
 
     Description: Gets detailed information about a specific compliance framework, including its cloud controls
-                 and regulatory control mappings.
+                 and regulatory control mappings. Results are cached for the session.
     Parameters:
     organization_id (required): The Google Cloud organization ID.
     framework_id (required): The ID of the framework to retrieve.
     location (optional): The location for the framework. Defaults to 'global'.
+    refresh (optional): If true, bypass the cache and fetch a fresh copy from the API. Defaults to false.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
     if not config_client:
         return {"error": "Config Client not initialized."}
 
     name = f"organizations/{organization_id}/locations/{location}/frameworks/{framework_id}"
     logger.info(f"Getting framework: {name}")
 
-    try:
-        request = GetFrameworkRequest(name=name)
-        framework = config_client.get_framework(request=request)
+    async def fetch() -> Dict[str, Any]:
+        if catalog_snapshot and not refresh:
+            framework = await catalog_snapshot.get(f"organizations/{organization_id}/locations/{location}", "frameworks", name)
+            if framework is not None:
+                return proto_message_to_dict(framework)
+
+        request = cloudsecuritycompliance_v1.GetFrameworkRequest(name=name)
+        framework = await config_client.get_framework(request=request)
 
         return proto_message_to_dict(framework)
 
+    try:
+        return await catalog_cache.get_or_fetch((name, "get_framework"), fetch, refresh)
+
     except google_exceptions.NotFound as e:
         logger.error(f"Framework not found: {e}")
         return {"error": "Not Found", "details": f"Could not find framework '{framework_id}'. {str(e)}"}
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
+async def batch_get_frameworks(
+    organization_id: str,
+    framework_ids: List[str],
+    location: str = "global",
+    refresh: bool = False,
+    max_concurrency: int = 10,
+    fields: Optional[List[str]] = None,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: batch_get_frameworks
+
+    Description: Gets several compliance frameworks in one call, fetching them concurrently. Use this instead of
+                 calling get_framework once per ID. Items that fail are reported individually.
+    Parameters:
+    organization_id (required): The Google Cloud organization ID.
+    framework_ids (required): The IDs of the frameworks to retrieve (at most 500).
+    location (optional): The location of the frameworks. Defaults to 'global'.
+    refresh (optional): If true, bypass the cache and fetch fresh copies from the API. Defaults to false.
+    max_concurrency (optional): Maximum number of API calls in flight at once. Defaults to 10.
+    fields (optional): Fields to keep in each item, e.g. ['name', 'displayName'] (dotted paths allowed). Defaults to all fields.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with one `results` entry per distinct ID, in request order, holding either the `item` or its
+             `error` and `details`, plus `succeeded`, `failed` and `count` totals.
+    """
+    return await run_batch_reads(
+        framework_ids,
+        lambda framework_id: get_framework(organization_id, framework_id, location, refresh, profile=profile),
+        max_concurrency,
+        fields,
+    )
+
+
+@mcp.tool()
+@tool_call
 async def list_cloud_controls(
     organization_id: str,
     location: str = "global",
     page_size: int = 50,
+    page_token: str = "",
+    max_results: Optional[int] = None,
+    filter: str = "",
+    order_by: str = "",
+    fields: Optional[List[str]] = None,
+    refresh: bool = False,
+    output_format: str = "full",
+    max_response_bytes: int = 0,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: list_cloud_controls
 
-    Description: Lists all cloud controls available in an organization. Cloud controls are technical items
-                 that help meet compliance requirements.
+    Description: Lists cloud controls available in an organization, one page at a time. Cloud controls are
+                 technical items that help meet compliance requirements. Results are cached for the session.
     Parameters:
     organization_id (required): The Google Cloud organization ID.
     location (optional): The location for the cloud controls. Defaults to 'global'.
-    page_size (optional): Maximum number of cloud controls to return. Defaults to 50.
+    page_size (optional): Number of cloud controls requested per API page. Defaults to 50.
+    page_token (optional): The next_page_token from a previous call, to continue the listing. When it came from a
+                           truncated response, pass the other arguments unchanged.
+    max_results (optional): Maximum number of cloud controls to return (at most 1000). Defaults to page_size.
+    filter (optional): Local filter applied as results stream in, e.g. 'severity=HIGH AND resource_type=storage.googleapis.com/Bucket'.
+                       Terms are field=value, field!=value or field:substring (field:* means the field is set), joined by AND.
+                       Fields are dotted paths in the returned JSON; shorthands: resource_type, cel_expression, control.
+    order_by (optional): Comma separated 'field [asc|desc]' keys used to sort the results returned by this call, e.g. 'displayName'.
+    fields (optional): List of fields to return for each item, e.g. ['name', 'displayName', 'severity']. Defaults to all fields.
+    refresh (optional): If true, bypass the cache and fetch fresh results from the API. Defaults to false.
+    output_format (optional): 'full' (every field), 'compact' (key fields only, unless `fields` are given) or 'table'
+                              (the same fields as `columns` plus one row of values per item). Defaults to 'full'.
+    max_response_bytes (optional): Upper bound on the encoded response size. Items that do not fit are left out, and
+                                   `truncated` is set with a `next_page_token` resuming at the first of them.
+                                   Defaults to no limit.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with `cloud_controls` (in `table` format, a dictionary of `columns` and `rows`), `count` and
+             `next_page_token` (empty when there are no more results).
     """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
     if not config_client:
         return {"error": "Config Client not initialized."}
 
     parent = f"organizations/{organization_id}/locations/{location}"
     logger.info(f"Listing cloud controls for parent: {parent}")
 
-    try:
-        request = ListCloudControlsRequest(
+    limit = resolve_max_results(max_results, page_size)
+
+    async def fetch() -> Dict[str, Any]:
+        request = cloudsecuritycompliance_v1.ListCloudControlsRequest(
             parent=parent,
             page_size=page_size,
+            page_token=page_token,
+        )
+
+        cloud_controls, next_page_token, source = await list_catalog_page(
+            "cloud_controls",
+            config_client.list_cloud_controls,
+            request,
+            limit,
+            refresh,
+            lambda item: proto_message_to_dict(item, mask_fields),
+            make_local_predicate(filter),
+        )
+        return {
+            "cloud_controls": cloud_controls,
+            "count": len(cloud_controls),
+            "next_page_token": next_page_token,
+            "source": source,
+        }
+
+    try:
+        fields = output_fields(cloudsecuritycompliance_v1.CloudControl, fields, output_format)
+        # Only serialize the requested fields, plus whatever the filter and sort order read.
+        mask_fields = fields and list(fields) + expression_fields(filter, order_by)
+        cache_key = (parent, "list_cloud_controls", page_size, page_token, limit, filter, order_by, tuple(fields or ()))
+        result = await catalog_cache.get_or_fetch(cache_key, fetch, refresh)
+        return shape_list_response(
+            result, "cloud_controls", output_format, fields, order_by, page_token, max_response_bytes
+        )
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
+    except google_exceptions.NotFound as e:
+        logger.error(f"Organization not found: {e}")
+        return {"error": "Not Found", "details": f"Could not find organization '{organization_id}'. {str(e)}"}
+    except google_exceptions.PermissionDenied as e:
+        logger.error(f"Permission denied: {e}")
+        return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+
+@mcp.tool()
+@tool_call
+async def search_cloud_controls(
+    organization_id: str,
+    query: str,
+    location: str = "global",
+    filter: str = "",
+    fields: Optional[List[str]] = None,
+    max_results: int = 20,
+    refresh: bool = False,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: search_cloud_controls
+
+    Description: Full-text search over the organization's cloud controls by display name, description, resource
+                 type and category, returning the best matches first. Much cheaper than paging through
+                 list_cloud_controls to find relevant controls.
+    Parameters:
+    organization_id (required): The Google Cloud organization ID.
+    query (required): Search words; every word must match, e.g. 'bucket public access' or 'storage.googleapis.com/Bucket encryption'.
+    location (optional): The location for the cloud controls. Defaults to 'global'.
+    filter (optional): Additional local filter with the same syntax as list_cloud_controls, e.g. 'severity=HIGH'.
+    fields (optional): List of fields to return for each control. Defaults to name, displayName, description, severity and categories.
+    max_results (optional): Maximum number of matches to return (at most 1000). Defaults to 20.
+    refresh (optional): If true, rebuild the search index from fresh API results. Defaults to false.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with `cloud_controls` (each with a relevance `score`) and `count`.
+    """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
+    if not config_client:
+        return {"error": "Config Client not initialized."}
+
+    parent = f"organizations/{organization_id}/locations/{location}"
+    logger.info(f"Searching cloud controls for parent: {parent} query: {query}")
+
+    async def build_index() -> CloudControlSearchIndex:
+        controls = await load_full_catalog(
+            "cloud_controls",
+            config_client.list_cloud_controls,
+            cloudsecuritycompliance_v1.ListCloudControlsRequest(parent=parent, page_size=MAX_LIST_RESULTS),
         )
+        return CloudControlSearchIndex([proto_message_to_dict(control) for control in controls])
 
-        response_pager = config_client.list_cloud_controls(request=request)
+    try:
+        # The index lives in the catalog cache, so it expires and is invalidated along with the catalog.
+        index = await catalog_cache.get_or_fetch((parent, "cloud_control_search_index"), build_index, refresh)
+        matches = index.search(query, min(max_results, MAX_LIST_RESULTS), make_local_predicate(filter))
+        projection = fields or ["name", "displayName", "description", "severity", "categories"]
 
         cloud_controls = []
-        for control in response_pager:
-            control_dict = proto_message_to_dict(control)
+        for score, control in matches:
+            control_dict = project_fields(control, projection)
+            control_dict["score"] = score
             cloud_controls.append(control_dict)
 
         return {
             "cloud_controls": cloud_controls,
             "count": len(cloud_controls),
+            "indexed": len(index.controls),
         }
 
     except google_exceptions.NotFound as e:
@@ -297,49 +3183,77 @@ async def list_cloud_controls(
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
 async def get_cloud_control(
     organization_id: str,
     cloud_control_id: str,
     location: str = "global",
+    refresh: bool = False,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: get_cloud_control
 
     Description: Gets detailed information about a specific cloud control, including its rules, parameters,
-                 and enforcement mode.
+                 and enforcement mode. Results are cached for the session.
     Parameters:
     organization_id (required): The Google Cloud organization ID.
     cloud_control_id (required): The ID of the cloud control to retrieve.
     location (optional): The location for the cloud control. Defaults to 'global'.
+    refresh (optional): If true, bypass the cache and fetch a fresh copy from the API. Defaults to false.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
     if not config_client:
         return {"error": "Config Client not initialized."}
 
     name = f"organizations/{organization_id}/locations/{location}/cloudControls/{cloud_control_id}"
     logger.info(f"Getting cloud control: {name}")
 
-    try:
-        request = GetCloudControlRequest(name=name)
-        cloud_control = config_client.get_cloud_control(request=request)
+    async def fetch() -> Dict[str, Any]:
+        if catalog_snapshot and not refresh:
+            cloud_control = await catalog_snapshot.get(
+                f"organizations/{organization_id}/locations/{location}", "cloud_controls", name
+            )
+            if cloud_control is not None:
+                return proto_message_to_dict(cloud_control)
+
+        request = cloudsecuritycompliance_v1.GetCloudControlRequest(name=name)
+        cloud_control = await config_client.get_cloud_control(request=request)
 
         return proto_message_to_dict(cloud_control)
 
+    try:
+        return await catalog_cache.get_or_fetch((name, "get_cloud_control"), fetch, refresh)
+
     except google_exceptions.NotFound as e:
         logger.error(f"Cloud control not found: {e}")
         return {"error": "Not Found", "details": f"Could not find cloud control '{cloud_control_id}'. {str(e)}"}
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 @mcp.tool()
+@tool_call
 async def create_cloud_control(
     organization_id: str,
     cloud_control_id: str,
@@ -350,6 +3264,8 @@ async def create_cloud_control(
     severity: str = "MEDIUM",
     remediation_instructions: str = "",
     location: str = "global",
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: create_cloud_control
     Description: Creates a custom cloud control with CEL-based detection logic. Custom cloud controls allow you to
@@ -385,6 +3301,8 @@ async def create_cloud_control(
     severity (optional): Finding severity level. One of: "CRITICAL", "HIGH", "MEDIUM", "LOW". Defaults to "MEDIUM".
     remediation_instructions (optional): Instructions for remediating findings from this control.
     location (optional): Location for the cloud control. Defaults to 'global'.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     Returns: Dictionary with status and created cloud control details.
     Example:
         create_cloud_control(
@@ -400,6 +3318,7 @@ async def create_cloud_control(
     Note: For a complete list of Cloud Asset Inventory resource types and their properties, see:
           https://cloud.google.com/asset-inventory/docs/supported-asset-types
     """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
     if not config_client:
         return {"error": "Config Client not initialized."}
 
@@ -411,18 +3330,21 @@ async def create_cloud_control(
         # Note: The CloudControl message structure may need to be adjusted based on the actual API
         # The current implementation creates a basic cloud control
         # CEL expression and resource type configuration may need to be set through additional API calls
-        cloud_control = CloudControl(
+        cloud_control = cloudsecuritycompliance_v1.CloudControl(
             display_name=display_name,
             description=description,
         )
 
-        request = CreateCloudControlRequest(
+        request = cloudsecuritycompliance_v1.CreateCloudControlRequest(
             parent=parent,
             cloud_control_id=cloud_control_id,
             cloud_control=cloud_control,
         )
 
-        result = config_client.create_cloud_control(request=request)
+        result = await config_client.create_cloud_control(request=request)
+        catalog_cache.invalidate(parent)
+        if catalog_snapshot:
+            await catalog_snapshot.upsert(parent, "cloud_controls", [result])
 
         return {
             "status": "success",
@@ -442,12 +3364,190 @@ async def create_cloud_control(
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+
+@mcp.tool()
+@tool_call
+async def dry_run_cloud_control(
+    resource_type: str,
+    cel_expression: str,
+    asset_export_path: str,
+    max_results: int = 100,
+    include_passing: bool = False,
+    workers: int = 0,
+    timeout_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Name: dry_run_cloud_control
+    Description: Tests a cloud control's CEL expression locally, without network access, by evaluating it over a
+                 Cloud Asset Inventory export on disk. Use it to check an expression before create_cloud_control:
+                 assets for which the expression evaluates to false are the ones that would get a finding.
+                 The export is streamed, so exports of hundreds of thousands of assets are fine; large exports
+                 are evaluated by a pool of worker processes. Requires the optional cel-python package.
+    Parameters:
+    resource_type (required): Cloud Asset Inventory resource type to evaluate (e.g., "compute.googleapis.com/Instance").
+                              Assets of other types in the export are skipped. Pass "" to evaluate every asset.
+    cel_expression (required): CEL expression, as for create_cloud_control. The asset's `resource` object (with
+                               its `data`) is available as `resource`.
+    asset_export_path (required): Path to the export: newline-delimited JSON with one asset per line (as written
+                                  by `gcloud asset export` to Cloud Storage), or a JSON array of assets (as printed
+                                  by `gcloud asset list --format=json`).
+    max_results (optional): Maximum number of resource names returned per outcome. Counts are always complete.
+                            Defaults to 100.
+    include_passing (optional): Also return the names of resources for which the expression is true. Defaults to False.
+    workers (optional): Number of worker processes to use, up to the size of the shared pool (one per CPU, at most 8,
+                        or COMPLIANCE_MANAGER_CEL_WORKERS). Defaults to the whole pool for exports over 16 MiB,
+                        and in-process evaluation for smaller ones.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    Returns: Dictionary with counts of assets scanned and evaluated, `failing` (would get a finding), `passing`
+             and evaluation `errors` (e.g. a field accessed without has()), the `failing_resources`,
+             `passing_resources` and `evaluation_errors` found (up to max_results each), and timing.
+    Example:
+        dry_run_cloud_control(
+            resource_type="compute.googleapis.com/Instance",
+            cel_expression="has(resource.data.shieldedInstanceConfig) && resource.data.shieldedInstanceConfig.enableSecureBoot",
+            asset_export_path="~/exports/assets.json"
+        )
+    """
+    try:
+        import celpy
+    except ImportError:
+        return {
+            "error": "CEL Engine Unavailable",
+            "details": "dry_run_cloud_control needs cel-python: pip install cel-python (or the `cel` extra).",
+        }
+
+    start = time.perf_counter()
+    path = os.path.expanduser(asset_export_path)
+    max_results = max(0, max_results)
+    loop = asyncio.get_running_loop()
+    pending: List[asyncio.Future] = []
+    try:
+        size = os.path.getsize(path)
+        cached = compiled_cel_program.cache_info().hits
+        compiled_cel_program(cel_expression)
+        cached = compiled_cel_program.cache_info().hits > cached
+        compile_seconds = time.perf_counter() - start
+
+        if workers <= 0:
+            workers = 1 if size < DRY_RUN_INLINE_BYTES else CEL_WORKERS
+        # The shared pool is never resized, so asking for more workers than it holds gets the whole pool.
+        workers = min(workers, CEL_WORKERS) if CEL_WORKERS > 1 else 1
+        executor = get_cel_worker_pool() if workers > 1 else None
+        logger.info(f"Dry-running CEL expression over {path} ({size} bytes) with {workers} worker(s)")
+
+        totals = {"scanned": 0, "evaluated": 0, "passing": 0, "failing": 0, "errors": 0, "invalid": 0}
+        names: Dict[str, list] = {"failing_resources": [], "passing_resources": [], "evaluation_errors": []}
+
+        def merge(result: Dict[str, Any]) -> None:
+            for key in ("evaluated", "passing", "failing", "errors", "invalid"):
+                totals[key] += result[key]
+            for key, found in names.items():
+                found.extend(result[key][: max_results - len(found)])
+
+        assets = iter_asset_export(path)
+        exhausted = False
+        while not exhausted or pending:
+            if not exhausted:
+                chunk, scanned = await asyncio.to_thread(read_asset_chunk, assets, resource_type, DRY_RUN_CHUNK_SIZE)
+                totals["scanned"] += scanned
+                exhausted = len(chunk) < DRY_RUN_CHUNK_SIZE
+                if chunk:
+                    pending.append(loop.run_in_executor(
+                        executor, evaluate_asset_chunk,
+                        cel_expression, resource_type, chunk, max_results, include_passing,
+                    ))
+            # Keep a couple of chunks queued per worker, so reading overlaps evaluation without buffering the
+            # export. Chunks are merged in file order, so the names returned do not depend on scheduling.
+            if pending and (exhausted or len(pending) >= 2 * workers):
+                merge(await pending.pop(0))
+                await report_progress(f"Evaluated {totals['evaluated']} of {totals['scanned']} assets read")
+
+        elapsed = time.perf_counter() - start
+        return {
+            "resource_type": resource_type,
+            "cel_expression": cel_expression,
+            "assets_scanned": totals["scanned"],
+            "assets_evaluated": totals["evaluated"],
+            "failing": totals["failing"],
+            "passing": totals["passing"],
+            "errors": totals["errors"],
+            "invalid_lines": totals["invalid"],
+            **names,
+            "truncated": totals["failing"] > len(names["failing_resources"])
+            or totals["errors"] > len(names["evaluation_errors"])
+            or (include_passing and totals["passing"] > len(names["passing_resources"])),
+            "timing": {
+                "total_seconds": round(elapsed, 3),
+                "compile_seconds": round(compile_seconds, 6),
+                "program_cached": cached,
+                "assets_per_second": round(totals["evaluated"] / elapsed, 1) if elapsed else None,
+                "workers": workers,
+            },
+        }
+
+    except celpy.CELParseError as e:
+        logger.error(f"Invalid CEL expression: {e}")
+        return {"error": "Invalid Argument", "details": f"Invalid CEL expression: {e}"}
+    except FileNotFoundError as e:
+        logger.error(f"Asset export not found: {e}")
+        return {"error": "Not Found", "details": f"Asset export '{asset_export_path}' was not found."}
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
+    finally:
+        for future in pending:
+            future.cancel()
 
 
 @mcp.tool()
+@tool_call
+async def batch_get_cloud_controls(
+    organization_id: str,
+    cloud_control_ids: List[str],
+    location: str = "global",
+    refresh: bool = False,
+    max_concurrency: int = 10,
+    fields: Optional[List[str]] = None,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: batch_get_cloud_controls
+
+    Description: Gets several cloud controls in one call, fetching them concurrently. Use this instead of
+                 calling get_cloud_control once per ID. Items that fail are reported individually.
+    Parameters:
+    organization_id (required): The Google Cloud organization ID.
+    cloud_control_ids (required): The IDs of the cloud controls to retrieve (at most 500).
+    location (optional): The location of the cloud controls. Defaults to 'global'.
+    refresh (optional): If true, bypass the cache and fetch fresh copies from the API. Defaults to false.
+    max_concurrency (optional): Maximum number of API calls in flight at once. Defaults to 10.
+    fields (optional): Fields to keep in each item, e.g. ['name', 'displayName'] (dotted paths allowed). Defaults to all fields.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with one `results` entry per distinct ID, in request order, holding either the `item` or its
+             `error` and `details`, plus `succeeded`, `failed` and `count` totals.
+    """
+    return await run_batch_reads(
+        cloud_control_ids,
+        lambda cloud_control_id: get_cloud_control(
+            organization_id, cloud_control_id, location, refresh, profile=profile
+        ),
+        max_concurrency,
+        fields,
+    )
+
+
+@mcp.tool()
+@tool_call
 async def create_framework(
     organization_id: str,
     framework_id: str,
@@ -455,6 +3555,8 @@ async def create_framework(
     description: str,
     cloud_control_ids: List[str],
     location: str = "global",
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: create_framework
     Description: Creates a custom compliance framework. Frameworks are collections of cloud controls that help
@@ -466,7 +3568,10 @@ async def create_framework(
     description (required): A description of the framework's purpose.
     cloud_control_ids (required): List of cloud control IDs to include in this framework.
     location (optional): The location for the framework. Defaults to 'global'.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
     if not config_client:
         return {"error": "Config Client not initialized."}
 
@@ -480,45 +3585,367 @@ async def create_framework(
             for control_id in cloud_control_ids
         ]
 
-        framework = Framework(
+        framework = cloudsecuritycompliance_v1.Framework(
             display_name=display_name,
             description=description,
             cloud_controls=cloud_controls,
         )
 
-        request = CreateFrameworkRequest(
+        request = cloudsecuritycompliance_v1.CreateFrameworkRequest(
             parent=parent,
             framework_id=framework_id,
             framework=framework,
         )
 
-        result = config_client.create_framework(request=request)
+        result = await config_client.create_framework(request=request)
+        catalog_cache.invalidate(parent)
+        if catalog_snapshot:
+            await catalog_snapshot.upsert(parent, "frameworks", [result])
+
+        return {
+            "status": "success",
+            "framework": proto_message_to_dict(result),
+        }
+
+    except google_exceptions.AlreadyExists as e:
+        logger.error(f"Framework already exists: {e}")
+        return {"error": "Already Exists", "details": f"Framework '{framework_id}' already exists. {str(e)}"}
+    except google_exceptions.NotFound as e:
+        logger.error(f"One or more cloud controls not found: {e}")
+        return {"error": "Not Found", "details": f"One or more cloud controls not found. {str(e)}"}
+    except google_exceptions.PermissionDenied as e:
+        logger.error(f"Permission denied: {e}")
+        return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+
+@mcp.tool()
+@tool_call
+async def import_compliance_bundle(
+    organization_id: str,
+    bundle_path: str,
+    format: str = "",
+    location: str = "global",
+    skip_existing: bool = True,
+    max_concurrency: int = 10,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: import_compliance_bundle
+    Description: Creates the custom cloud controls and frameworks defined in a YAML or JSON bundle file in one call,
+                 e.g. to migrate a library of custom controls or copy them from another organization (see
+                 export_compliance_bundle). Cloud controls are created first, concurrently, then the frameworks
+                 using them. Each definition gets its own result, so one failure does not stop the rest.
+    Parameters:
+    organization_id (required): The Google Cloud organization ID to create the definitions in.
+    bundle_path (required): Path to the bundle file. Its top-level `cloud_controls` and `frameworks` lists hold
+                            definitions with an `id` and the API's fields (as returned by get_cloud_control and
+                            get_framework). A cloud control may use `cel_expression` and `resource_types` instead of
+                            `rules`; a framework lists its controls by ID under `cloudControls`, optionally with a
+                            `majorRevisionId` (defaults to the revision just created, or the latest).
+    format (optional): 'yaml' or 'json'. Defaults to YAML for .yaml/.yml files and JSON otherwise. YAML requires
+                       the optional PyYAML package.
+    location (optional): The location for the definitions. Defaults to 'global'.
+    skip_existing (optional): Report definitions whose ID already exists as EXISTS instead of FAILED. Defaults to True.
+    max_concurrency (optional): Maximum number of create requests in flight at once. Defaults to 10.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with one result per definition under `cloud_controls` and `frameworks` (id, status
+             CREATED, EXISTS, FAILED or SKIPPED, resource name and error), and a `summary` of statuses.
+    """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
+    if not config_client:
+        return {"error": "Config Client not initialized."}
+
+    parent = f"organizations/{organization_id}/locations/{location}"
+    logger.info(f"Importing compliance bundle {bundle_path} into parent: {parent}")
+
+    try:
+        bundle = load_compliance_bundle(os.path.expanduser(bundle_path), format)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        revisions: Dict[str, int] = {}
+        created: Dict[str, list] = {"cloud_controls": [], "frameworks": []}
+        total = len(bundle["cloud_controls"]) + len(bundle["frameworks"])
+        finished = 0
+
+        async def create(kind: str, definition: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal finished
+            row = {"id": definition["id"], "status": "FAILED", "name": None, "error": None}
+            try:
+                if kind == "cloud_controls":
+                    request = cloudsecuritycompliance_v1.CreateCloudControlRequest(
+                        parent=parent,
+                        cloud_control_id=definition["id"],
+                        cloud_control=cloud_control_from_definition(definition),
+                    )
+                    async with semaphore:
+                        result = await config_client.create_cloud_control(request=request)
+                else:
+                    request = cloudsecuritycompliance_v1.CreateFrameworkRequest(
+                        parent=parent,
+                        framework_id=definition["id"],
+                        framework=framework_from_definition(definition, parent, revisions),
+                    )
+                    async with semaphore:
+                        result = await config_client.create_framework(request=request)
+                revisions[result.name] = result.major_revision_id
+                created[kind].append(result)
+                row.update(status="CREATED", name=result.name)
+            except google_exceptions.AlreadyExists as e:
+                row.update(status="EXISTS" if skip_existing else "FAILED", error=None if skip_existing else str(e))
+            except Exception as e:
+                logger.error(f"Failed to import {kind} definition '{definition['id']}': {e}")
+                row["error"] = str(e)
+            finished += 1
+            await report_progress(f"Imported {finished}/{total} definitions")
+            return row
+
+        control_rows = await asyncio.gather(*(create("cloud_controls", d) for d in bundle["cloud_controls"]))
+        failed_controls = {f"{parent}/cloudControls/{row['id']}" for row in control_rows if row["status"] == "FAILED"}
+
+        # Frameworks pin a revision of each control: look up the latest one for controls this import did not create.
+        unresolved = {
+            name
+            for definition in bundle["frameworks"]
+            for name, revision, _ in framework_control_references(definition, parent)
+            if not revision and name not in revisions and name not in failed_controls
+        }
+
+        async def resolve_revision(name: str) -> None:
+            async with semaphore:
+                try:
+                    item = await get_catalog_item(name, profile)
+                    revisions[name] = int(item.get("majorRevisionId", 0))
+                except Exception as e:
+                    logger.warning(f"Could not look up the latest revision of {name}: {e}")
+
+        await asyncio.gather(*(resolve_revision(name) for name in unresolved))
+
+        async def create_framework_if_ready(definition: Dict[str, Any]) -> Dict[str, Any]:
+            missing = sorted(
+                name.rsplit("/", 1)[-1]
+                for name, revision, _ in framework_control_references(definition, parent)
+                if name in failed_controls
+            )
+            if missing:
+                return {
+                    "id": definition["id"],
+                    "status": "SKIPPED",
+                    "name": None,
+                    "error": f"Depends on cloud controls that failed to import: {', '.join(missing)}.",
+                }
+            return await create("frameworks", definition)
+
+        framework_rows = await asyncio.gather(*(create_framework_if_ready(d) for d in bundle["frameworks"]))
+
+        if created["cloud_controls"] or created["frameworks"]:
+            catalog_cache.invalidate(parent)
+            if catalog_snapshot:
+                for kind, items in created.items():
+                    if items:
+                        await catalog_snapshot.upsert(parent, kind, items)
+
+        summary: Dict[str, int] = {}
+        for row in control_rows + framework_rows:
+            summary[row["status"]] = summary.get(row["status"], 0) + 1
+        return {"parent": parent, "cloud_controls": control_rows, "frameworks": framework_rows, "summary": summary}
+
+    except FileNotFoundError as e:
+        logger.error(f"Bundle not found: {e}")
+        return {"error": "Not Found", "details": f"Bundle '{bundle_path}' was not found."}
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+
+@mcp.tool()
+@tool_call
+async def export_compliance_bundle(
+    organization_id: str,
+    output_path: str,
+    format: str = "",
+    location: str = "global",
+    include_builtin: bool = False,
+    cloud_control_filter: str = "",
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: export_compliance_bundle
+    Description: Writes the custom frameworks of an organization, and the cloud controls they use, to a YAML or
+                 JSON bundle file that import_compliance_bundle can read back (e.g. into another organization).
+                 The catalog is streamed to the file page by page, so exports of any size use little memory.
+    Parameters:
+    organization_id (required): The Google Cloud organization ID.
+    output_path (required): Path of the bundle file to write. It is replaced only once the export succeeds.
+    format (optional): 'yaml' or 'json'. Defaults to YAML for .yaml/.yml files and JSON otherwise. YAML requires
+                       the optional PyYAML package.
+    location (optional): The location of the catalog. Defaults to 'global'.
+    include_builtin (optional): Also export built-in frameworks and every cloud control. Defaults to False.
+    cloud_control_filter (optional): Also export cloud controls matching this filter, in the syntax of
+                                     list_cloud_controls' `filter` (e.g. 'name:acme-'). Use it for custom cloud
+                                     controls no custom framework uses.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with the `output_path`, `format`, the number of `frameworks` and `cloud_controls` written
+             and the file size in bytes.
+    """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
+    if not config_client:
+        return {"error": "Config Client not initialized."}
 
-        return {
-            "status": "success",
-            "framework": proto_message_to_dict(result),
-        }
+    parent = f"organizations/{organization_id}/locations/{location}"
+    path = os.path.expanduser(output_path)
+    partial_path = f"{path}.partial"
+    logger.info(f"Exporting compliance bundle for parent {parent} to {path}")
 
-    except google_exceptions.AlreadyExists as e:
-        logger.error(f"Framework already exists: {e}")
-        return {"error": "Already Exists", "details": f"Framework '{framework_id}' already exists. {str(e)}"}
+    writer = None
+    try:
+        format = bundle_format(path, format)
+        predicate = make_local_predicate(cloud_control_filter)
+        writer = BundleWriter(partial_path, format)
+        referenced = set()
+        counts = {"frameworks": 0, "cloud_controls": 0}
+
+        writer.section("frameworks")
+        request = cloudsecuritycompliance_v1.ListFrameworksRequest(parent=parent, page_size=BUNDLE_EXPORT_PAGE_SIZE)
+        async for framework in ListStream(
+            config_client.list_frameworks, request, "frameworks", convert=proto_message_to_dict
+        ):
+            if framework.get("type") == "BUILT_IN" and not include_builtin:
+                continue
+            referenced.update(details["name"] for details in framework.get("cloudControlDetails", []))
+            writer.write(framework_definition(framework))
+            counts["frameworks"] += 1
+        writer.end_section()
+
+        writer.section("cloud_controls")
+        request = cloudsecuritycompliance_v1.ListCloudControlsRequest(parent=parent, page_size=BUNDLE_EXPORT_PAGE_SIZE)
+        async for control in ListStream(
+            config_client.list_cloud_controls, request, "cloud_controls", convert=proto_message_to_dict
+        ):
+            if include_builtin or control["name"] in referenced or (predicate and predicate(control)):
+                writer.write(cloud_control_definition(control))
+                counts["cloud_controls"] += 1
+        writer.end_section()
+
+        writer.close()
+        writer = None
+        os.replace(partial_path, path)
+        return {"output_path": path, "format": format, **counts, "bytes": os.path.getsize(path)}
+
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
     except google_exceptions.NotFound as e:
-        logger.error(f"One or more cloud controls not found: {e}")
-        return {"error": "Not Found", "details": f"One or more cloud controls not found. {str(e)}"}
+        logger.error(f"Organization not found: {e}")
+        return {"error": "Not Found", "details": f"Could not find organization '{organization_id}'. {str(e)}"}
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
+    finally:
+        if writer is not None:
+            writer.close()
+            os.remove(partial_path)
+
+
+@mcp.tool()
+@tool_call
+async def get_cache_stats() -> Dict[str, Any]:
+    """Name: get_cache_stats
+
+    Description: Returns hit/miss counters and occupancy for the framework and cloud control catalog cache.
+                 Pass refresh=True to list_frameworks, get_framework, list_cloud_controls or get_cloud_control
+                 to bypass the cache for a single call. "coalesced" counts reads that joined an identical
+                 request already in flight instead of issuing their own API call.
+    """
+    return {"catalog_cache": catalog_cache.stats()}
+
+
+@mcp.tool()
+@tool_call
+async def list_credential_profiles() -> Dict[str, Any]:
+    """Name: list_credential_profiles
+
+    Description: Lists the credential profiles this server can call the API with and the organizations, folders
+                 or projects each one is used for by default. Pass a profile name as `profile` to any tool to
+                 use it explicitly.
+    Returns: Dictionary with `profiles` (name, resources, credential source, impersonated service account,
+             quota project and API endpoint), the `default_profile` and client pool statistics.
+    """
+    profiles = []
+    for name, config in clients.profiles.items():
+        profiles.append({
+            "name": name,
+            "resources": config.get("resources", []),
+            "credentials": config.get("credentials_file") or "application-default",
+            "impersonate_service_account": config.get("impersonate_service_account"),
+            "quota_project_id": config.get("quota_project_id"),
+            "api_endpoint": config.get("api_endpoint"),
+        })
+    return {"profiles": profiles, "default_profile": DEFAULT_PROFILE, "pool": clients.stats()}
+
+
+@mcp.tool()
+@tool_call
+async def get_api_call_stats() -> Dict[str, Any]:
+    """Name: get_api_call_stats
+
+    Description: Returns per API method call counts, retries, failures and errors, the time calls spent throttled
+                 by the client-side rate limiter and the time spent backing off before retries. Useful to tell
+                 whether slow tool calls are caused by API quotas.
+    """
+    return {"api_calls": api_policy.stats()}
+
+
+@mcp.tool()
+@tool_call
+async def get_server_metrics() -> Dict[str, Any]:
+    """Name: get_server_metrics
+
+    Description: Returns server-side metrics since startup: per tool call counts, errors, latency histograms
+                 (p50/p95/p99), response bytes and the number of API calls each tool made; per API method latency
+                 histograms and error counts by gRPC status code; long-running operation durations by final
+                 state; and catalog cache hit rates.
+    """
+    metrics = server_metrics.snapshot()
+    metrics["catalog_cache"] = catalog_cache.stats()
+    metrics["telemetry_exporter"] = telemetry_destination
+    return metrics
 
 # --- Deployment Service Tools ---
 
 @mcp.tool()
+@tool_call
 async def list_framework_deployments(
     parent: str,
     location: str = "global",
     page_size: int = 50,
+    page_token: str = "",
+    max_results: Optional[int] = None,
+    filter: str = "",
+    order_by: str = "",
+    fields: Optional[List[str]] = None,
+    output_format: str = "full",
+    max_response_bytes: int = 0,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: list_framework_deployments
 
@@ -526,8 +3953,24 @@ async def list_framework_deployments(
     Parameters:
     parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
     location (optional): The location for the deployments. Defaults to 'global'.
-    page_size (optional): Maximum number of deployments to return. Defaults to 50.
+    page_size (optional): Number of deployments requested per API page. Defaults to 50.
+    page_token (optional): The next_page_token from a previous call, to continue the listing. When it came from a
+                           truncated response, pass the other arguments unchanged.
+    max_results (optional): Maximum number of deployments to return (at most 1000). Defaults to page_size.
+    filter (optional): Server-side filter expression passed to the API (AIP-160 syntax).
+    order_by (optional): Server-side sort order passed to the API, e.g. 'create_time desc'.
+    fields (optional): List of fields to return for each deployment, e.g. ['name', 'deploymentState']. Defaults to all fields.
+    output_format (optional): 'full' (every field), 'compact' (key fields only, unless `fields` are given) or 'table'
+                              (the same fields as `columns` plus one row of values per item). Defaults to 'full'.
+    max_response_bytes (optional): Upper bound on the encoded response size. Items that do not fit are left out, and
+                                   `truncated` is set with a `next_page_token` resuming at the first of them.
+                                   Defaults to no limit.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with `framework_deployments` (in `table` format, a dictionary of `columns` and
+             `rows`), `count` and `next_page_token` (empty when there are no more results).
     """
+    deployment_client = await get_deployment_client(profile, parent)
     if not deployment_client:
         return {"error": "Deployment Client not initialized."}
 
@@ -535,22 +3978,37 @@ async def list_framework_deployments(
     logger.info(f"Listing framework deployments for parent: {parent_with_location}")
 
     try:
-        request = ListFrameworkDeploymentsRequest(
+        fields = output_fields(cloudsecuritycompliance_v1.FrameworkDeployment, fields, output_format)
+        request = cloudsecuritycompliance_v1.ListFrameworkDeploymentsRequest(
             parent=parent_with_location,
             page_size=page_size,
+            page_token=page_token,
+            filter=filter,
+            order_by=order_by,
         )
 
-        response_pager = deployment_client.list_framework_deployments(request=request)
+        stream = ListStream(
+            deployment_client.list_framework_deployments, request, "framework_deployments", resolve_max_results(max_results, page_size)
+        )
 
         deployments = []
-        for deployment in response_pager:
-            deployment_dict = proto_message_to_dict(deployment)
+        async for deployment in stream:
+            deployment_dict = proto_message_to_dict(deployment, fields)
             deployments.append(deployment_dict)
 
-        return {
+        result = {
             "framework_deployments": deployments,
             "count": len(deployments),
+            "next_page_token": stream.next_page_token,
         }
+        # order_by was applied by the API.
+        return shape_list_response(
+            result, "framework_deployments", output_format, fields, "", page_token, max_response_bytes
+        )
+
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
 
     except google_exceptions.NotFound as e:
         logger.error(f"Parent resource not found: {e}")
@@ -558,16 +4016,22 @@ async def list_framework_deployments(
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
 async def get_framework_deployment(
     parent: str,
     framework_deployment_id: str,
     location: str = "global",
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: get_framework_deployment
 
@@ -576,7 +4040,10 @@ async def get_framework_deployment(
     parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
     framework_deployment_id (required): The ID of the framework deployment to retrieve.
     location (optional): The location for the deployment. Defaults to 'global'.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     """
+    deployment_client = await get_deployment_client(profile, parent)
     if not deployment_client:
         return {"error": "Deployment Client not initialized."}
 
@@ -584,8 +4051,8 @@ async def get_framework_deployment(
     logger.info(f"Getting framework deployment: {name}")
 
     try:
-        request = GetFrameworkDeploymentRequest(name=name)
-        deployment = deployment_client.get_framework_deployment(request=request)
+        request = cloudsecuritycompliance_v1.GetFrameworkDeploymentRequest(name=name)
+        deployment = await deployment_client.get_framework_deployment(request=request)
 
         return proto_message_to_dict(deployment)
 
@@ -595,35 +4062,87 @@ async def get_framework_deployment(
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
+async def batch_get_framework_deployments(
+    parent: str,
+    framework_deployment_ids: List[str],
+    location: str = "global",
+    max_concurrency: int = 10,
+    fields: Optional[List[str]] = None,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: batch_get_framework_deployments
+
+    Description: Gets several framework deployments under one parent in one call, fetching them concurrently. Use
+                 this instead of calling get_framework_deployment once per ID. Items that fail are reported individually.
+    Parameters:
+    parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
+    framework_deployment_ids (required): The IDs of the framework deployments to retrieve (at most 500).
+    location (optional): The location of the deployments. Defaults to 'global'.
+    max_concurrency (optional): Maximum number of API calls in flight at once. Defaults to 10.
+    fields (optional): Fields to keep in each item, e.g. ['name', 'displayName'] (dotted paths allowed). Defaults to all fields.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with one `results` entry per distinct ID, in request order, holding either the `item` or its
+             `error` and `details`, plus `succeeded`, `failed` and `count` totals.
+    """
+    return await run_batch_reads(
+        framework_deployment_ids,
+        lambda deployment_id: get_framework_deployment(parent, deployment_id, location, profile=profile),
+        max_concurrency,
+        fields,
+    )
+
+
+@mcp.tool()
+@tool_call
 async def create_framework_deployment(
     parent: str,
     framework_deployment_id: str,
     framework_name: str,
-    cloud_controls: str,
+    cloud_controls: str = "",
     framework_version: int = None,
     location: str = "global",
     target_resource: Optional[str] = None,
+    wait_for_completion: bool = False,
+    enforcement_mode: str = "DETECTIVE",
+    enforcement_modes: Optional[Dict[str, str]] = None,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: create_framework_deployment
 
     Description: Creates a new framework deployment on a target resource. This applies a compliance framework
-                 to an organization, folder, or project. This is a long-running operation.
+                 to an organization, folder, or project. This is a long-running operation: by default the tool
+                 returns an operation handle immediately; use get_operation_status or wait_operation to follow it.
     Parameters:
     parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
     framework_deployment_id (required): The ID for the new framework deployment.
     framework_name (required): The full name of the framework to deploy (e.g., 'organizations/{org_id}/locations/global/frameworks/{framework_id}').
-    cloud_controls (required): This is a comma seperated list of could_control ids along with their revision number seperated by a hash.
-        So the entire string is of format: cloud_control_id1#revision1,cloud_control_id2#revision2.
+    cloud_controls (optional): Overrides the framework's cloud controls. A comma separated list of cloud control IDs,
+        each optionally followed by '#' and its major revision: cloud_control_id1#revision1,cloud_control_id2.
+        By default the controls, their revisions and parameters are resolved from the framework, so there is no
+        need to call get_framework and get_cloud_control first. Missing revisions are looked up automatically.
     location (optional): The location for the deployment. Defaults to 'global'.
     target_resource (optional): The target resource name. If not provided, uses the parent resource.
     framework_version (optional): The major version of the framework. If not specified the latest version of the framework is used.
+    wait_for_completion (optional): If true, wait up to 300 seconds for the operation to finish before returning. Defaults to false.
+    enforcement_mode (optional): Enforcement mode for the cloud controls: PREVENTIVE, DETECTIVE or AUDIT. Defaults to DETECTIVE.
+    enforcement_modes (optional): Per-control overrides of enforcement_mode, e.g. {'cloud_control_id1': 'PREVENTIVE'}.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     """
+    deployment_client = await get_deployment_client(profile, parent)
     if not deployment_client:
         return {"error": "Deployment Client not initialized."}
 
@@ -631,41 +4150,30 @@ async def create_framework_deployment(
     complete_framework_deployment_id = f"{parent_with_location}/frameworkDeployments/{framework_deployment_id}"
     logger.info(f"Creating framework deployment '{framework_deployment_id}' in parent: {parent_with_location}")
 
-    cloud_control_metadata_list = create_cloud_control_metadata_list(cloud_controls, parent_with_location)
-
-    # Set target resource if provided
-    if not target_resource:
-        target_resource = parent
-
-    framework_reference = FrameworkReference(framework = framework_name)
-    if framework_version:
-        framework_reference.major_revision_id = framework_version
-
     try:
-        # Create the framework deployment object
-        framework_deployment = FrameworkDeployment(
-            framework=framework_reference,
-            cloud_control_metadata=cloud_control_metadata_list,
-            target_resource_config = TargetResourceConfig(
-                existing_target_resource=target_resource
-            ),
-            name = complete_framework_deployment_id
+        cloud_control_metadata = await resolve_cloud_control_metadata(
+            framework_name, cloud_controls, framework_version, enforcement_mode, enforcement_modes, profile
         )
-
-        request = CreateFrameworkDeploymentRequest(
-            parent=parent_with_location,
-            framework_deployment_id=framework_deployment_id,
-            framework_deployment=framework_deployment,
+        request = build_create_framework_deployment_request(
+            parent, framework_deployment_id, framework_name, cloud_control_metadata, framework_version, location,
+            target_resource,
         )
 
         logger.info(f"Request for create framework deployment {request}")
 
         # This is a long-running operation
-        operation_result = deployment_client.create_framework_deployment(request=request)
+        operation_result = await deployment_client.create_framework_deployment(request=request)
 
-        # Wait for the operation to complete
-        logger.info(f"Waiting for framework deployment creation to complete...: {operation_result.operation.name}")
-        return fetch_lro_status(operation_result.operation.name)
+        lro_name = operation_result.operation.name
+        handle = operation_tracker.track(
+            lro_name, "create_framework_deployment", complete_framework_deployment_id, profile
+        )
+        if wait_for_completion:
+            logger.info(f"Waiting for framework deployment creation to complete...: {lro_name}")
+            return await fetch_lro_status(lro_name)
+
+        logger.info(f"Tracking framework deployment creation in the background: {lro_name}")
+        return {"status": "started", "operation": handle}
 
     except google_exceptions.NotFound as e:
         logger.error(f"Parent resource or framework not found: {e}")
@@ -676,25 +4184,39 @@ async def create_framework_deployment(
     except google_exceptions.AlreadyExists as e:
         logger.error(f"Framework deployment already exists: {e}")
         return {"error": "Already Exists", "details": f"Framework deployment '{framework_deployment_id}' already exists. {str(e)}"}
+    except ValueError as e:
+        return {"error": "Invalid Argument", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
 async def delete_framework_deployment(
     parent: str,
     framework_deployment_id: str,
     location: str = "global",
+    wait_for_completion: bool = False,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: delete_framework_deployment
 
-    Description: Deletes a framework deployment. This removes the compliance framework from the target resource. This is a long-running operation.
+    Description: Deletes a framework deployment. This removes the compliance framework from the target resource. This is a long-running operation:
+                 by default the tool returns an operation handle immediately; use get_operation_status or wait_operation to follow it.
     Parameters:
     parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
     framework_deployment_id (required): The ID of the framework deployment to delete.
     location (optional): The location for the deployment. Defaults to 'global'.
+    wait_for_completion (optional): If true, wait up to 300 seconds for the operation to finish before returning. Defaults to false.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     """
+    deployment_client = await get_deployment_client(profile, parent)
     if not deployment_client:
         return {"error": "Deployment Client not initialized."}
 
@@ -702,14 +4224,20 @@ async def delete_framework_deployment(
     logger.info(f"Deleting framework deployment: {name}")
 
     try:
-        request = DeleteFrameworkDeploymentRequest(name=name)
+        request = cloudsecuritycompliance_v1.DeleteFrameworkDeploymentRequest(name=name)
 
         # This is a long-running operation
-        operation_result = deployment_client.delete_framework_deployment(request=request)
+        operation_result = await deployment_client.delete_framework_deployment(request=request)
+
+        lro_name = operation_result.operation.name
+        handle = operation_tracker.track(lro_name, "delete_framework_deployment", name, profile)
+        if wait_for_completion:
+            logger.info(f"Waiting for framework deployment deletion to complete... LRO Name: {lro_name}")
+            return await fetch_lro_status(lro_name)
+
+        logger.info(f"Tracking framework deployment deletion in the background: {lro_name}")
+        return {"status": "started", "operation": handle}
 
-        # Wait for the operation to complete
-        logger.info(f"Waiting for framework deployment deletion to complete... LRO Name: {operation_result.operation.name}")
-        return fetch_lro_status(operation_result.operation.name)
 
     except google_exceptions.NotFound as e:
         logger.error(f"Framework deployment not found: {e}")
@@ -717,16 +4245,247 @@ async def delete_framework_deployment(
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
+async def get_operation_status(
+    operation_id: str,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: get_operation_status
+
+    Description: Gets the current state of a long-running operation started by create_framework_deployment or
+                 delete_framework_deployment. Returns immediately without waiting.
+    Parameters:
+    operation_id (required): The operation handle returned by the tool that started the operation
+                             (the full LRO name, e.g. 'organizations/{org_id}/locations/global/operations/{id}').
+    timeout_seconds (optional): Deadline for looking up an operation that is not tracked yet, in seconds. Defaults to
+                                no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with the operation state (RUNNING, SUCCEEDED, FAILED or TIMEOUT), error, poll count and elapsed time.
+    """
+    try:
+        return {"operation": await operation_tracker.resume(operation_id, profile=profile)}
+    except ValueError as e:
+        return {"error": "Invalid Argument", "details": str(e)}
+    except google_exceptions.NotFound as e:
+        logger.error(f"Operation not found: {e}")
+        return {"error": "Not Found", "details": f"Could not find operation '{operation_id}'. {str(e)}"}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+
+@mcp.tool()
+@tool_call
+async def wait_operation(
+    operation_id: str,
+    timeout_seconds: float = 300,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: wait_operation
+
+    Description: Waits for a long-running operation to finish, up to a timeout, and returns its final state.
+                 Other tool calls keep running while this one waits.
+    Parameters:
+    operation_id (required): The operation handle returned by the tool that started the operation.
+    timeout_seconds (optional): Maximum number of seconds to wait. Defaults to 300. If the operation is still
+                                running when the timeout expires its current state (RUNNING) is returned.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    """
+    try:
+        await operation_tracker.resume(operation_id, profile=profile)
+    except ValueError as e:
+        return {"error": "Invalid Argument", "details": str(e)}
+    except google_exceptions.NotFound as e:
+        logger.error(f"Operation not found: {e}")
+        return {"error": "Not Found", "details": f"Could not find operation '{operation_id}'. {str(e)}"}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+    status = await operation_tracker.wait(operation_id, timeout_seconds)
+    return {"operation": status, "done": status["state"] != "RUNNING"}
+
+
+@mcp.tool()
+@tool_call
+async def bulk_create_framework_deployments(
+    framework_deployment_id: str,
+    framework_name: str,
+    cloud_controls: str = "",
+    parents: Optional[List[str]] = None,
+    folder: Optional[str] = None,
+    recursive: bool = True,
+    framework_version: int = None,
+    location: str = "global",
+    max_concurrency: int = 10,
+    wait_timeout_seconds: float = 300,
+    enforcement_mode: str = "DETECTIVE",
+    enforcement_modes: Optional[Dict[str, str]] = None,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: bulk_create_framework_deployments
+
+    Description: Deploys one framework to many targets in a single call. Creates are submitted in parallel with a
+                 concurrency limit, then all long-running operations are tracked together and a per-target result
+                 table is returned. A create is only retried when the API rejects it for quota, since a create that
+                 timed out may still have gone through; other failures are reported as SUBMIT_FAILED rows.
+    Parameters:
+    framework_deployment_id (required): The ID for the framework deployment on each target.
+    framework_name (required): The full name of the framework to deploy (e.g., 'organizations/{org_id}/locations/global/frameworks/{framework_id}').
+    cloud_controls (optional): Overrides the framework's cloud controls, as for create_framework_deployment. By default
+                               the controls and their revisions are resolved from the framework once for all targets.
+    parents (optional): List of target resources in format 'organizations/{org_id}', 'folders/{folder_id}' or 'projects/{project_id}'.
+    folder (optional): A folder ('folders/{folder_id}') whose projects are added to the targets.
+    recursive (optional): When expanding `folder`, also include projects in its subfolders. Defaults to true.
+    framework_version (optional): The major version of the framework. If not specified the latest version is used.
+    location (optional): The location for the deployments. Defaults to 'global'.
+    max_concurrency (optional): Maximum number of creates submitted at once. Defaults to 10.
+    wait_timeout_seconds (optional): How long to wait for the operations to finish. Defaults to 300. Use 0 to return
+                                     as soon as everything is submitted.
+    enforcement_mode (optional): Enforcement mode for the cloud controls: PREVENTIVE, DETECTIVE or AUDIT. Defaults to DETECTIVE.
+    enforcement_modes (optional): Per-control overrides of enforcement_mode, e.g. {'cloud_control_id1': 'PREVENTIVE'}.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with a `results` row per target (target, state, operation_id, error), a `summary`
+             count per state and the total `count`.
+    """
+    try:
+        # Pin the profile so every target, and the polling of its operation, uses the same credentials.
+        profile = clients.resolve_profile(profile, framework_name)
+    except ValueError as e:
+        return {"error": "Invalid Argument", "details": str(e)}
+    deployment_client = await get_deployment_client(profile)
+    if not deployment_client:
+        return {"error": "Deployment Client not initialized."}
+
+    try:
+        targets = await resolve_bulk_targets(parents, folder, recursive, profile)
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"Failed to expand folder '{folder}': {e}", exc_info=True)
+        return {"error": "Failed to expand folder", "details": str(e)}
+    if not targets:
+        return {"error": "No targets", "details": "Provide `parents` and/or a `folder` containing projects."}
+
+    try:
+        cloud_control_metadata = await resolve_cloud_control_metadata(
+            framework_name, cloud_controls, framework_version, enforcement_mode, enforcement_modes, profile
+        )
+    except ValueError as e:
+        return {"error": "Invalid Argument", "details": str(e)}
+    except Exception as e:
+        logger.error(f"Failed to resolve the cloud controls of '{framework_name}': {e}", exc_info=True)
+        return {"error": "Failed to resolve cloud controls", "details": str(e)}
+
+    logger.info(f"Bulk creating framework deployment '{framework_deployment_id}' on {len(targets)} targets")
+
+    async def submit(target: str) -> tuple[str, str]:
+        request = build_create_framework_deployment_request(
+            target, framework_deployment_id, framework_name, cloud_control_metadata, framework_version, location
+        )
+        operation_result = await deployment_client.create_framework_deployment(request=request)
+        return operation_result.operation.name, request.framework_deployment.name
+
+    return await run_bulk_operations(
+        targets, submit, "create_framework_deployment", max_concurrency, wait_timeout_seconds, profile
+    )
+
+
+@mcp.tool()
+@tool_call
+async def bulk_delete_framework_deployments(
+    framework_deployment_id: str,
+    parents: Optional[List[str]] = None,
+    folder: Optional[str] = None,
+    recursive: bool = True,
+    location: str = "global",
+    max_concurrency: int = 10,
+    wait_timeout_seconds: float = 300,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: bulk_delete_framework_deployments
+
+    Description: Deletes a framework deployment from many targets in a single call, with the same bounded parallelism,
+                 quota-only retries and aggregated result table as bulk_create_framework_deployments.
+    Parameters:
+    framework_deployment_id (required): The ID of the framework deployment to delete on each target.
+    parents (optional): List of target resources in format 'organizations/{org_id}', 'folders/{folder_id}' or 'projects/{project_id}'.
+    folder (optional): A folder ('folders/{folder_id}') whose projects are added to the targets.
+    recursive (optional): When expanding `folder`, also include projects in its subfolders. Defaults to true.
+    location (optional): The location for the deployments. Defaults to 'global'.
+    max_concurrency (optional): Maximum number of deletes submitted at once. Defaults to 10.
+    wait_timeout_seconds (optional): How long to wait for the operations to finish. Defaults to 300.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    """
+    try:
+        # Pin the profile so every target, and the polling of its operation, uses the same credentials.
+        profile = clients.resolve_profile(profile, folder or (parents[0] if parents else ""))
+    except ValueError as e:
+        return {"error": "Invalid Argument", "details": str(e)}
+    deployment_client = await get_deployment_client(profile)
+    if not deployment_client:
+        return {"error": "Deployment Client not initialized."}
+
+    try:
+        targets = await resolve_bulk_targets(parents, folder, recursive, profile)
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"Failed to expand folder '{folder}': {e}", exc_info=True)
+        return {"error": "Failed to expand folder", "details": str(e)}
+    if not targets:
+        return {"error": "No targets", "details": "Provide `parents` and/or a `folder` containing projects."}
+
+    logger.info(f"Bulk deleting framework deployment '{framework_deployment_id}' on {len(targets)} targets")
+
+    async def submit(target: str) -> tuple[str, str]:
+        name = f"{target}/locations/{location}/frameworkDeployments/{framework_deployment_id}"
+        operation_result = await deployment_client.delete_framework_deployment(
+            request=cloudsecuritycompliance_v1.DeleteFrameworkDeploymentRequest(name=name)
+        )
+        return operation_result.operation.name, name
+
+    return await run_bulk_operations(
+        targets, submit, "delete_framework_deployment", max_concurrency, wait_timeout_seconds, profile
+    )
+
+
+@mcp.tool()
+@tool_call
 async def list_cloud_control_deployments(
     parent: str,
     location: str = "global",
     page_size: int = 50,
+    page_token: str = "",
+    max_results: Optional[int] = None,
+    filter: str = "",
+    order_by: str = "",
+    fields: Optional[List[str]] = None,
+    output_format: str = "full",
+    max_response_bytes: int = 0,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: list_cloud_control_deployments
 
@@ -734,8 +4493,24 @@ async def list_cloud_control_deployments(
     Parameters:
     parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
     location (optional): The location for the deployments. Defaults to 'global'.
-    page_size (optional): Maximum number of deployments to return. Defaults to 50.
+    page_size (optional): Number of deployments requested per API page. Defaults to 50.
+    page_token (optional): The next_page_token from a previous call, to continue the listing. When it came from a
+                           truncated response, pass the other arguments unchanged.
+    max_results (optional): Maximum number of deployments to return (at most 1000). Defaults to page_size.
+    filter (optional): Server-side filter expression passed to the API (AIP-160 syntax).
+    order_by (optional): Server-side sort order passed to the API, e.g. 'create_time desc'.
+    fields (optional): List of fields to return for each deployment, e.g. ['name', 'deploymentState']. Defaults to all fields.
+    output_format (optional): 'full' (every field), 'compact' (key fields only, unless `fields` are given) or 'table'
+                              (the same fields as `columns` plus one row of values per item). Defaults to 'full'.
+    max_response_bytes (optional): Upper bound on the encoded response size. Items that do not fit are left out, and
+                                   `truncated` is set with a `next_page_token` resuming at the first of them.
+                                   Defaults to no limit.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with `cloud_control_deployments` (in `table` format, a dictionary of `columns` and
+             `rows`), `count` and `next_page_token` (empty when there are no more results).
     """
+    deployment_client = await get_deployment_client(profile, parent)
     if not deployment_client:
         return {"error": "Deployment Client not initialized."}
 
@@ -743,22 +4518,37 @@ async def list_cloud_control_deployments(
     logger.info(f"Listing cloud control deployments for parent: {parent_with_location}")
 
     try:
-        request = ListCloudControlDeploymentsRequest(
+        fields = output_fields(cloudsecuritycompliance_v1.CloudControlDeployment, fields, output_format)
+        request = cloudsecuritycompliance_v1.ListCloudControlDeploymentsRequest(
             parent=parent_with_location,
             page_size=page_size,
+            page_token=page_token,
+            filter=filter,
+            order_by=order_by,
         )
 
-        response_pager = deployment_client.list_cloud_control_deployments(request=request)
+        stream = ListStream(
+            deployment_client.list_cloud_control_deployments, request, "cloud_control_deployments", resolve_max_results(max_results, page_size)
+        )
 
         deployments = []
-        for deployment in response_pager:
-            deployment_dict = proto_message_to_dict(deployment)
+        async for deployment in stream:
+            deployment_dict = proto_message_to_dict(deployment, fields)
             deployments.append(deployment_dict)
 
-        return {
+        result = {
             "cloud_control_deployments": deployments,
             "count": len(deployments),
+            "next_page_token": stream.next_page_token,
         }
+        # order_by was applied by the API.
+        return shape_list_response(
+            result, "cloud_control_deployments", output_format, fields, "", page_token, max_response_bytes
+        )
+
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
 
     except google_exceptions.NotFound as e:
         logger.error(f"Parent resource not found: {e}")
@@ -766,16 +4556,22 @@ async def list_cloud_control_deployments(
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
 @mcp.tool()
+@tool_call
 async def get_cloud_control_deployment(
     parent: str,
     cloud_control_deployment_id: str,
     location: str = "global",
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
 ) -> Dict[str, Any]:
     """Name: get_cloud_control_deployment
 
@@ -785,7 +4581,10 @@ async def get_cloud_control_deployment(
     parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
     cloud_control_deployment_id (required): The ID of the cloud control deployment to retrieve.
     location (optional): The location for the deployment. Defaults to 'global'.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
     """
+    deployment_client = await get_deployment_client(profile, parent)
     if not deployment_client:
         return {"error": "Deployment Client not initialized."}
 
@@ -793,8 +4592,8 @@ async def get_cloud_control_deployment(
     logger.info(f"Getting cloud control deployment: {name}")
 
     try:
-        request = GetCloudControlDeploymentRequest(name=name)
-        deployment = deployment_client.get_cloud_control_deployment(request=request)
+        request = cloudsecuritycompliance_v1.GetCloudControlDeploymentRequest(name=name)
+        deployment = await deployment_client.get_cloud_control_deployment(request=request)
 
         return proto_message_to_dict(deployment)
 
@@ -804,24 +4603,620 @@ async def get_cloud_control_deployment(
     except google_exceptions.PermissionDenied as e:
         logger.error(f"Permission denied: {e}")
         return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return {"error": "An unexpected error occurred", "details": str(e)}
 
 
-# --- Main execution ---
+@mcp.tool()
+@tool_call
+async def batch_get_cloud_control_deployments(
+    parent: str,
+    cloud_control_deployment_ids: List[str],
+    location: str = "global",
+    max_concurrency: int = 10,
+    fields: Optional[List[str]] = None,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: batch_get_cloud_control_deployments
 
-def main() -> None:
-    """Runs the FastMCP server."""
-    if not config_client:
-        logger.critical("Config Client failed to initialize. MCP server cannot serve config tools.")
+    Description: Gets several cloud control deployments under one parent in one call, fetching them concurrently.
+                 Use this instead of calling get_cloud_control_deployment once per ID. Items that fail are reported
+                 individually.
+    Parameters:
+    parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
+    cloud_control_deployment_ids (required): The IDs of the cloud control deployments to retrieve (at most 500).
+    location (optional): The location of the deployments. Defaults to 'global'.
+    max_concurrency (optional): Maximum number of API calls in flight at once. Defaults to 10.
+    fields (optional): Fields to keep in each item, e.g. ['name', 'displayName'] (dotted paths allowed). Defaults to all fields.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with one `results` entry per distinct ID, in request order, holding either the `item` or its
+             `error` and `details`, plus `succeeded`, `failed` and `count` totals.
+    """
+    return await run_batch_reads(
+        cloud_control_deployment_ids,
+        lambda deployment_id: get_cloud_control_deployment(parent, deployment_id, location, profile=profile),
+        max_concurrency,
+        fields,
+    )
+
+
+@mcp.tool()
+@tool_call
+async def get_compliance_posture(
+    parent: str,
+    frameworks: Optional[List[str]] = None,
+    location: str = "global",
+    recursive: bool = True,
+    include_cloud_controls: bool = False,
+    max_targets: int = 1000,
+    max_concurrency: int = 10,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: get_compliance_posture
 
+    Description: Summarizes which frameworks are deployed across an organization or folder in one call. Walks the
+                 resource hierarchy under `parent`, lists the framework deployments on every folder and project
+                 concurrently, and returns a compact target x framework matrix of deployment states.
+                 Use this instead of calling list_framework_deployments parent by parent, e.g. to find which
+                 projects are missing the CIS deployment.
+    Parameters:
+    parent (required): The root to summarize, in format 'organizations/{org_id}', 'folders/{folder_id}' or 'projects/{project_id}'.
+    frameworks (optional): Framework IDs to report on, e.g. ['cis-benchmark']. Defaults to every framework deployed anywhere in the hierarchy.
+    location (optional): The location of the deployments. Defaults to 'global'.
+    recursive (optional): Walk the whole hierarchy. If false, only `parent` and its direct children are included. Defaults to true.
+    include_cloud_controls (optional): Also count each target's cloud control deployments by state. Defaults to false.
+    max_targets (optional): Maximum number of folders and projects to include (at most 10000). Defaults to 1000.
+    max_concurrency (optional): Maximum number of API calls in flight at once. Defaults to 10. Calls are also subject to
+                                the server-wide per-method rate limits.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with the `frameworks` column order, a `matrix` mapping each target to one state per framework
+             (a deployment state such as READY or FAILED, INHERITED when deployed on an ancestor, or MISSING),
+             per-framework state `counts`, the `missing` targets per framework, and any per-target `errors`.
+    """
+    deployment_client = await get_deployment_client(profile, parent)
     if not deployment_client:
-        logger.critical("Deployment Client failed to initialize. MCP server cannot serve deployment tools.")
+        return {"error": "Deployment Client not initialized."}
+    folders_client, projects_client = await get_resource_manager_clients(profile, parent)
+    if not folders_client or not projects_client:
+        return {"error": "Resource Manager Clients not initialized."}
 
-    logger.info("Starting Compliance Manager MCP server...")
+    logger.info(f"Computing compliance posture for {parent}")
+    start = time.monotonic()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    list_framework_deployments = concurrency_limited(deployment_client.list_framework_deployments, semaphore)
+    list_cloud_control_deployments = concurrency_limited(deployment_client.list_cloud_control_deployments, semaphore)
+
+    try:
+        nodes, truncated = await walk_hierarchy(
+            parent,
+            concurrency_limited(folders_client.list_folders, semaphore),
+            concurrency_limited(projects_client.list_projects, semaphore),
+            recursive,
+            max(1, min(max_targets, 10000)),
+        )
+    except google_exceptions.PermissionDenied as e:
+        logger.error(f"Permission denied: {e}")
+        return {"error": "Permission Denied", "details": f"Could not list folders and projects under '{parent}'. {str(e)}"}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"Failed to walk the hierarchy under {parent}: {e}", exc_info=True)
+        return {"error": "Failed to walk the resource hierarchy", "details": str(e)}
+
+    errors = []
+
+    async def scan(target: str) -> tuple[str, Dict[str, str], Dict[str, int]]:
+        deployed: Dict[str, str] = {}
+        cloud_control_states: Dict[str, int] = {}
+        try:
+            request = cloudsecuritycompliance_v1.ListFrameworkDeploymentsRequest(
+                parent=f"{target}/locations/{location}", page_size=100
+            )
+            async for deployment in ListStream(list_framework_deployments, request, "framework_deployments"):
+                deployed[deployment.framework.framework.rsplit("/", 1)[-1]] = short_state(deployment.deployment_state)
+            if include_cloud_controls:
+                request = cloudsecuritycompliance_v1.ListCloudControlDeploymentsRequest(
+                    parent=f"{target}/locations/{location}", page_size=100
+                )
+                async for deployment in ListStream(list_cloud_control_deployments, request, "cloud_control_deployments"):
+                    state = short_state(deployment.deployment_state)
+                    cloud_control_states[state] = cloud_control_states.get(state, 0) + 1
+        except google_exceptions.GoogleAPICallError as e:
+            logger.warning(f"Failed to list deployments for {target}: {e}")
+            errors.append({"target": target, "error": str(e)})
+        return target, deployed, cloud_control_states
+
+    results = await asyncio.gather(*(scan(target) for target in nodes))
+    deployments = {target: deployed for target, deployed, _ in results if deployed}
+    columns = list(dict.fromkeys(frameworks or [])) or sorted(
+        {framework for deployed in deployments.values() for framework in deployed}
+    )
+    matrix, counts, missing = build_posture_matrix(nodes, deployments, columns)
+
+    posture = {
+        "parent": parent,
+        "frameworks": columns,
+        "matrix": matrix,
+        "counts": counts,
+        "missing": missing,
+        "targets": len(nodes),
+        "truncated": truncated,
+        "errors": errors,
+        "elapsed_seconds": round(time.monotonic() - start, 3),
+    }
+    if include_cloud_controls:
+        posture["cloud_control_counts"] = {target: states for target, _, states in results if states}
+    return posture
+
+
+@mcp.tool()
+@tool_call
+async def detect_drift(
+    parent: str,
+    frameworks: Optional[List[str]] = None,
+    location: str = "global",
+    recursive: bool = False,
+    enforcement_mode: str = "",
+    enforcement_modes: Optional[Dict[str, str]] = None,
+    include_up_to_date: bool = False,
+    max_targets: int = 1000,
+    max_concurrency: int = 10,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: detect_drift
+
+    Description: Finds framework deployments that have drifted from the latest revision of their framework. Lists the
+                 deployments under `parent` (and optionally every folder and project beneath it), fetches each
+                 framework once, and reports per deployment the cloud controls that are missing, extra, pinned to an
+                 older revision, or deployed with an unexpected enforcement mode, plus deployments pinned to an old
+                 framework revision. Use this instead of diffing list_framework_deployments and get_framework by hand.
+    Parameters:
+    parent (required): The parent resource in format 'organizations/{org_id}', 'folders/{folder_id}', or 'projects/{project_id}'.
+    frameworks (optional): Framework IDs to check, e.g. ['cis-benchmark']. Defaults to every deployed framework.
+    location (optional): The location of the deployments. Defaults to 'global'.
+    recursive (optional): Also check the deployments on every folder and project under `parent`. Defaults to false.
+    enforcement_mode (optional): Expected enforcement mode of every control (PREVENTIVE, DETECTIVE or AUDIT). Enforcement
+                                 modes are only checked when this or enforcement_modes is set.
+    enforcement_modes (optional): Per-control expected enforcement modes, e.g. {'cloud_control_id1': 'PREVENTIVE'}.
+    include_up_to_date (optional): Also list deployments without drift. Defaults to false.
+    max_targets (optional): Maximum number of folders and projects to include when recursive (at most 10000). Defaults to 1000.
+    max_concurrency (optional): Maximum number of API calls in flight at once. Defaults to 10. Calls are also subject to
+                                the server-wide per-method rate limits.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with the latest revision and control count of each framework (`frameworks`), one `drift` entry
+             per drifted deployment, a `summary` of counts, and any per-target or per-framework `errors`.
+    """
+    deployment_client = await get_deployment_client(profile, parent)
+    if not deployment_client:
+        return {"error": "Deployment Client not initialized."}
+    try:
+        expected_default = parse_enforcement_mode(enforcement_mode).name if enforcement_mode else None
+        expected_overrides = {
+            key.rsplit("/", 1)[-1]: parse_enforcement_mode(mode).name for key, mode in (enforcement_modes or {}).items()
+        }
+    except ValueError as e:
+        return {"error": "Invalid Argument", "details": str(e)}
+
+    logger.info(f"Detecting framework deployment drift under {parent}")
+    start = time.monotonic()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    list_framework_deployments = concurrency_limited(deployment_client.list_framework_deployments, semaphore)
+
+    truncated = False
+    targets = [parent]
+    if recursive:
+        folders_client, projects_client = await get_resource_manager_clients(profile, parent)
+        if not folders_client or not projects_client:
+            return {"error": "Resource Manager Clients not initialized."}
+        try:
+            nodes, truncated = await walk_hierarchy(
+                parent,
+                concurrency_limited(folders_client.list_folders, semaphore),
+                concurrency_limited(projects_client.list_projects, semaphore),
+                True,
+                max(1, min(max_targets, 10000)),
+            )
+        except google_exceptions.PermissionDenied as e:
+            logger.error(f"Permission denied: {e}")
+            return {"error": "Permission Denied", "details": f"Could not list folders and projects under '{parent}'. {str(e)}"}
+        except google_exceptions.DeadlineExceeded as e:
+            logger.warning(f"Deadline exceeded: {e}")
+            return {"error": "Deadline Exceeded", "details": str(e)}
+        except Exception as e:
+            logger.error(f"Failed to walk the hierarchy under {parent}: {e}", exc_info=True)
+            return {"error": "Failed to walk the resource hierarchy", "details": str(e)}
+        targets = list(nodes)
+
+    wanted = set(frameworks or [])
+    errors = []
+
+    async def scan(target: str) -> list:
+        request = cloudsecuritycompliance_v1.ListFrameworkDeploymentsRequest(
+            parent=f"{target}/locations/{location}", page_size=100
+        )
+        try:
+            return [
+                deployment
+                async for deployment in ListStream(list_framework_deployments, request, "framework_deployments")
+                if not wanted or deployment.framework.framework.rsplit("/", 1)[-1] in wanted
+            ]
+        except google_exceptions.GoogleAPICallError as e:
+            logger.warning(f"Failed to list deployments for {target}: {e}")
+            errors.append({"target": target, "error": str(e)})
+            return []
+
+    scanned = await asyncio.gather(*(scan(target) for target in targets))
+    deployments = [deployment for found in scanned for deployment in found]
+
+    # Index each distinct framework once: {framework name: (latest revision, {control ID: (revision, mode)})}.
+    async def index_framework(framework_name: str) -> Optional[tuple[int, Dict[str, tuple[int, str]]]]:
+        try:
+            framework = await get_catalog_item(framework_name, profile)
+            metadata = await resolve_cloud_control_metadata(framework_name, profile=profile, max_concurrency=max_concurrency)
+        except Exception as e:
+            logger.warning(f"Failed to fetch framework {framework_name}: {e}")
+            errors.append({"framework": framework_name, "error": str(e)})
+            return None
+        return int(framework.get("majorRevisionId", 0)), {
+            item.cloud_control_details.name.rsplit("/", 1)[-1]: (item.cloud_control_details.major_revision_id, "")
+            for item in metadata
+        }
+
+    framework_names = list(dict.fromkeys(deployment.framework.framework for deployment in deployments))
+    baselines = dict(zip(framework_names, await asyncio.gather(*(index_framework(name) for name in framework_names))))
+
+    drift = []
+    summary = {"deployments": len(deployments), "drifted": 0, "up_to_date": 0, "unchecked": 0}
+    for deployment in deployments:
+        baseline = baselines.get(deployment.framework.framework)
+        if baseline is None:
+            summary["unchecked"] += 1
+            continue
+        latest_revision, baseline_controls = baseline
+        expected_modes = None
+        if expected_default or expected_overrides:
+            expected_modes = {
+                control: expected_overrides.get(control, expected_default)
+                for control in baseline_controls
+                if expected_overrides.get(control, expected_default)
+            }
+        delta = diff_deployment(index_deployed_controls(deployment), baseline_controls, expected_modes)
+        pinned_revision = deployment.framework.major_revision_id
+        outdated_framework = bool(pinned_revision) and pinned_revision < latest_revision
+        drifted = outdated_framework or any(delta.values())
+        summary["drifted" if drifted else "up_to_date"] += 1
+        if drifted or include_up_to_date:
+            drift.append(
+                {
+                    "deployment": deployment.name,
+                    "target": deployment.computed_target_resource or deployment.target_resource_config.existing_target_resource,
+                    "framework": deployment.framework.framework.rsplit("/", 1)[-1],
+                    "framework_revision": pinned_revision,
+                    "latest_framework_revision": latest_revision,
+                    "drifted": drifted,
+                    **{key: value for key, value in delta.items() if value},
+                }
+            )
+
+    return {
+        "parent": parent,
+        "frameworks": {
+            name.rsplit("/", 1)[-1]: {"latest_revision": baseline[0], "cloud_controls": len(baseline[1])}
+            for name, baseline in baselines.items()
+            if baseline is not None
+        },
+        "drift": drift,
+        "summary": summary,
+        "targets": len(targets),
+        "truncated": truncated,
+        "errors": errors,
+        "elapsed_seconds": round(time.monotonic() - start, 3),
+    }
+
+
+@mcp.tool()
+@tool_call
+async def plan_compliance_changes(
+    organization_id: str,
+    desired_state_path: str,
+    format: str = "",
+    location: str = "global",
+    prune: bool = False,
+    replace_outdated: bool = False,
+    max_concurrency: int = 10,
+    refresh: bool = False,
+    timeout_seconds: Optional[float] = None,
+    profile: str = "",
+) -> Dict[str, Any]:
+    """Name: plan_compliance_changes
+    Description: Compares a desired-state document (custom cloud controls, frameworks, and which frameworks are
+                 deployed on which targets) with the live state and returns the minimal set of changes needed,
+                 without making any. Review the plan, then pass its plan_id to apply_compliance_plan. Planning
+                 a document that is already in effect returns no changes.
+    Parameters:
+    organization_id (required): The Google Cloud organization ID owning the catalog.
+    desired_state_path (required): Path to the YAML or JSON document: a compliance bundle (see
+                                   import_compliance_bundle) plus a `deployments` list of entries with a
+                                   `framework` (ID or full name), `targets` (e.g. ["projects/my-project",
+                                   "folders/123"]), and optionally the deployment `id` (defaults to the framework
+                                   ID), `enforcement_mode` and per-control `enforcement_modes`.
+    format (optional): 'yaml' or 'json'. Defaults to YAML for .yaml/.yml files and JSON otherwise.
+    location (optional): The location of the catalog and deployments. Defaults to 'global'.
+    prune (optional): Also delete deployments of the document's frameworks on targets it lists for other
+                      frameworks, and duplicate deployments. Defaults to False.
+    replace_outdated (optional): Redeploy (delete and create) deployments pinned to an older framework revision,
+                                 with different enforcement modes, or whose framework changes in this plan.
+                                 Otherwise they are only reported under `drift`. Defaults to False.
+    max_concurrency (optional): Maximum number of deployment listings in flight at once. Defaults to 10.
+    refresh (optional): Also bypass the in-memory catalog cache, e.g. after changing the catalog outside this
+                        server. The catalog is always read from the API, never from the on-disk snapshot.
+                        Defaults to False.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    profile (optional): Credential profile to use. Defaults to the profile owning the resource, or ADC.
+    Returns: Dictionary with the `plan_id`, the `changes` in dependency order (key, action CREATE, UPDATE, DELETE or
+             REPLACE, kind, resource, reason, changed_fields and the keys it depends_on), a `summary` of actions,
+             `no_op` and the outdated deployments left alone under `drift`.
+    """
+    config_client = await get_config_client(profile, f"organizations/{organization_id}")
+    if not config_client:
+        return {"error": "Config Client not initialized."}
+    deployment_client = await get_deployment_client(profile, f"organizations/{organization_id}")
+    if not deployment_client:
+        return {"error": "Deployment Client not initialized."}
+
+    parent = f"organizations/{organization_id}/locations/{location}"
+    logger.info(f"Planning changes for {desired_state_path} against parent: {parent}")
+
+    try:
+        document = load_compliance_bundle(os.path.expanduser(desired_state_path), format)
+        plan = await build_compliance_plan(
+            parent, location, document, config_client, deployment_client, prune, replace_outdated, max_concurrency,
+            refresh,
+        )
+    except FileNotFoundError as e:
+        logger.error(f"Desired-state document not found: {e}")
+        return {"error": "Not Found", "details": f"Document '{desired_state_path}' was not found."}
+    except ValueError as e:
+        logger.error(f"Invalid argument: {e}")
+        return {"error": "Invalid Argument", "details": str(e)}
+    except google_exceptions.PermissionDenied as e:
+        logger.error(f"Permission denied: {e}")
+        return {"error": "Permission Denied", "details": str(e)}
+    except google_exceptions.DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded: {e}")
+        return {"error": "Deadline Exceeded", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+    plan_id = f"plan-{os.urandom(6).hex()}"
+    compliance_plans[plan_id] = {
+        **plan, "parent": parent, "location": location, "profile": profile, "applied": False
+    }
+    while len(compliance_plans) > MAX_STORED_PLANS:
+        compliance_plans.popitem(last=False)
+
+    summary: Dict[str, int] = {}
+    for change in plan["changes"]:
+        summary[change["action"]] = summary.get(change["action"], 0) + 1
+    return {
+        "plan_id": plan_id,
+        "parent": parent,
+        "changes": plan["changes"],
+        "summary": summary,
+        "no_op": not plan["changes"],
+        "drift": plan["drift"],
+    }
+
+
+@mcp.tool()
+@tool_call
+async def apply_compliance_plan(
+    plan_id: str,
+    max_concurrency: int = 10,
+    wait_timeout_seconds: float = 300,
+    timeout_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Name: apply_compliance_plan
+    Description: Applies the changes of a plan from plan_compliance_changes. Changes run as a dependency graph:
+                 cloud controls before the frameworks listing them, frameworks before their deployments, with
+                 independent changes in parallel. A change whose dependency failed is skipped. A plan can be
+                 applied once; plan again afterwards to check that nothing is left to do.
+    Parameters:
+    plan_id (required): The plan_id returned by plan_compliance_changes.
+    max_concurrency (optional): Maximum number of changes in flight at once. Defaults to 10.
+    wait_timeout_seconds (optional): How long to wait for each deployment operation. Defaults to 300.
+    timeout_seconds (optional): Deadline for the whole call, in seconds. Defaults to no deadline.
+    Returns: Dictionary with one result per change (key, action, resource, status APPLIED, FAILED or SKIPPED and
+             error) and a `summary` of statuses.
+    """
+    plan = compliance_plans.get(plan_id)
+    if plan is None:
+        return {"error": "Not Found", "details": f"Unknown plan '{plan_id}'. Plans are kept for this session only."}
+    if plan["applied"]:
+        return {"error": "Failed Precondition", "details": f"Plan '{plan_id}' was already applied; plan again."}
+
+    parent, location, profile = plan["parent"], plan["location"], plan["profile"]
+    config_client = await get_config_client(profile, parent)
+    deployment_client = await get_deployment_client(profile, parent)
+    if not config_client or not deployment_client:
+        return {"error": "Clients not initialized."}
+
+    plan["applied"] = True
+    revisions = dict(plan["revisions"])
+    logger.info(f"Applying {len(plan['changes'])} changes of {plan_id} to {parent}")
+
+    async def wait_for(operation_name: str, kind: str, resource: str) -> None:
+        operation_tracker.track(operation_name, kind, resource, profile)
+        try:
+            status = await operation_tracker.wait(operation_name, remaining_time(wait_timeout_seconds), report=False)
+        except asyncio.CancelledError:
+            operation_tracker.forget(operation_name)
+            raise
+        if status["state"] != "SUCCEEDED":
+            raise RuntimeError(status["error"] or f"Operation {operation_name} is still {status['state']}.")
+
+    async def execute(change: Dict[str, Any]) -> None:
+        definition = plan["definitions"].get(change["key"])
+        if change["kind"] == "cloud_control":
+            control = cloud_control_from_definition(definition)
+            if change["action"] == "CREATE":
+                request = cloudsecuritycompliance_v1.CreateCloudControlRequest(
+                    parent=parent, cloud_control_id=definition["id"], cloud_control=control
+                )
+                result = await config_client.create_cloud_control(request=request)
+            else:
+                control.name = change["resource"]
+                request = cloudsecuritycompliance_v1.UpdateCloudControlRequest(
+                    cloud_control=control, update_mask={"paths": update_mask_paths(change["changed_fields"])}
+                )
+                result = await config_client.update_cloud_control(request=request)
+        elif change["kind"] == "framework":
+            framework = framework_from_definition(definition, parent, revisions)
+            if change["action"] == "CREATE":
+                request = cloudsecuritycompliance_v1.CreateFrameworkRequest(
+                    parent=parent, framework_id=definition["id"], framework=framework
+                )
+                result = await config_client.create_framework(request=request)
+            else:
+                framework.name = change["resource"]
+                request = cloudsecuritycompliance_v1.UpdateFrameworkRequest(
+                    framework=framework, update_mask={"paths": update_mask_paths(change["changed_fields"])}
+                )
+                result = await config_client.update_framework(request=request)
+        else:
+            if change["action"] in ("DELETE", "REPLACE"):
+                request = cloudsecuritycompliance_v1.DeleteFrameworkDeploymentRequest(name=change["resource"])
+                operation = await deployment_client.delete_framework_deployment(request=request)
+                await wait_for(operation.operation.name, "delete_framework_deployment", change["resource"])
+            if change["action"] in ("CREATE", "REPLACE"):
+                metadata = await resolve_cloud_control_metadata(
+                    definition["framework"],
+                    enforcement_mode=definition["enforcement_mode"],
+                    enforcement_modes=definition["enforcement_modes"],
+                    profile=profile,
+                )
+                request = build_create_framework_deployment_request(
+                    definition["target"], definition["id"], definition["framework"], metadata, None, location
+                )
+                operation = await deployment_client.create_framework_deployment(request=request)
+                await wait_for(operation.operation.name, "create_framework_deployment", change["resource"])
+            return
+
+        # The catalog changed: later changes (and reads) must see the new revision.
+        revisions[result.name] = result.major_revision_id
+        catalog_cache.invalidate(parent)
+        if catalog_snapshot:
+            await catalog_snapshot.upsert(parent, f"{change['kind']}s", [result])
+
+    try:
+        rows = await run_change_graph(plan["changes"], execute, max_concurrency)
+    except Exception as e:
+        logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+    summary: Dict[str, int] = {}
+    for row in rows:
+        summary[row["status"]] = summary.get(row["status"], 0) + 1
+    return {"plan_id": plan_id, "parent": parent, "results": rows, "summary": summary}
+
+
+# --- Shared Server ---
+# By default every Gemini CLI session starts its own server over stdio, with its
+# own API clients, caches and operation tracker. With COMPLIANCE_MANAGER_TRANSPORT
+# set to 'streamable-http' (or 'sse') the server instead runs as a long-lived local
+# daemon that any number of sessions and CI jobs connect to at once, sharing all
+# of that state. Sessions that can only launch a stdio command keep working: with
+# COMPLIANCE_MANAGER_SERVER_URL set, the stdio process just relays JSON-RPC
+# messages to the daemon, and falls back to serving in-process when the daemon is
+# not running.
+
+SERVER_TRANSPORTS = ("stdio", "streamable-http", "sse")
 
-    mcp.run(transport="stdio")
+# How long the relay waits on a response stream; tool calls can wait on long-running operations.
+RELAY_READ_TIMEOUT_SECONDS = 3600.0
+
+
+async def server_reachable(url: str, timeout: float = 1.0) -> bool:
+    """Returns whether something accepts TCP connections at the URL's host and port."""
+    parsed = urllib.parse.urlsplit(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(parsed.hostname, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def relay_stdio(url: str) -> None:
+    """Relays the MCP session on stdin/stdout to the shared server at `url` until either side closes."""
+    import anyio
+    from mcp.client.sse import sse_client
+    from mcp.client.streamable_http import streamablehttp_client
+    from mcp.server.stdio import stdio_server
+
+    if urllib.parse.urlsplit(url).path.rstrip("/").endswith("/sse"):
+        remote = sse_client(url, sse_read_timeout=RELAY_READ_TIMEOUT_SECONDS)
+    else:
+        remote = streamablehttp_client(url, sse_read_timeout=RELAY_READ_TIMEOUT_SECONDS)
+
+    async with stdio_server() as (local_read, local_write), remote as (remote_read, remote_write, *_):
+        async with anyio.create_task_group() as tasks:
+
+            async def pump(source, sink, direction: str) -> None:
+                async with sink:
+                    async for message in source:
+                        if isinstance(message, Exception):
+                            logger.warning(f"Dropped malformed message {direction}: {message}")
+                            continue
+                        await sink.send(message)
+                tasks.cancel_scope.cancel()
+
+            tasks.start_soon(pump, local_read, remote_write, "from the client")
+            tasks.start_soon(pump, remote_read, local_write, "from the shared server")
+
+
+# --- Main execution ---
+
+def main() -> None:
+    """Runs the FastMCP server, or relays stdio to a shared one."""
+    transport = os.environ.get("COMPLIANCE_MANAGER_TRANSPORT", "stdio")
+    if transport not in SERVER_TRANSPORTS:
+        sys.exit(f"Unsupported COMPLIANCE_MANAGER_TRANSPORT '{transport}'. Use one of: {', '.join(SERVER_TRANSPORTS)}.")
+
+    server_url = os.environ.get("COMPLIANCE_MANAGER_SERVER_URL", "")
+    if transport == "stdio" and server_url:
+        if asyncio.run(server_reachable(server_url)):
+            logger.info(f"Relaying stdio to the shared server at {server_url}")
+            asyncio.run(relay_stdio(server_url))
+            return
+        logger.warning(f"Shared server at {server_url} is not reachable; serving this session in-process.")
+
+    logger.info("Starting Compliance Manager MCP server...")
+    exporter = os.environ.get("COMPLIANCE_MANAGER_OTEL_EXPORTER", "")
+    if exporter:
+        destination = configure_telemetry(exporter, os.environ.get("COMPLIANCE_MANAGER_OTEL_FILE", ""))
+        if destination:
+            logger.info(f"Exporting OpenTelemetry spans and metrics to {destination}")
+
+    if transport != "stdio":
+        mcp.settings.host = os.environ.get("COMPLIANCE_MANAGER_HOST", mcp.settings.host)
+        mcp.settings.port = int(os.environ.get("COMPLIANCE_MANAGER_PORT", mcp.settings.port))
+        path = mcp.settings.sse_path if transport == "sse" else mcp.settings.streamable_http_path
+        logger.info(f"Serving {transport} on http://{mcp.settings.host}:{mcp.settings.port}{path}")
+    mcp.run(transport=transport)
 
 
 if __name__ == "__main__":
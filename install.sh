@@ -42,12 +42,13 @@ else
         python-dotenv>=1.0.0 \
         typing-extensions>=4.8.0 \
         aiohttp>=3.9.0 \
-        google-cloud-cloudsecuritycompliance>=0.2.0
+        google-cloud-cloudsecuritycompliance>=0.2.0 \
+        google-cloud-resource-manager>=1.12.0
 fi
 
 # Copy files
 echo "Copying extension files..."
-cp compliance_manager_mcp.py "$EXTENSION_DIR/"
+cp compliance_manager_mcp.py cel_evaluation.py proto_serialization.py "$EXTENSION_DIR/"
 cp GEMINI.md "$EXTENSION_DIR/"
 
 # Create run script
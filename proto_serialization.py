@@ -0,0 +1,218 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Conversion of Compliance Manager API messages to JSON-style dicts.
+
+json_format.MessageToDict runs every message through a generic printer and is
+the dominant CPU cost when listing large catalogs. ProtoSerializer produces the
+same JSON form, but builds one converter per field descriptor and reuses it,
+only visits fields that are set (ListFields skips default values) and, given a
+field mask, never descends into fields that were not asked for.
+
+Field paths are dotted paths in the JSON form of a message, in camelCase or
+snake_case, or one of the shorthands in FIELD_ALIASES.
+"""
+
+import base64
+import functools
+import logging
+import math
+import struct
+from typing import Any, Dict, List, Optional
+
+from google.protobuf import json_format
+
+logger = logging.getLogger("compliance-manager-mcp")
+
+# Shorthands for deeply nested fields.
+FIELD_ALIASES = {
+    "resource_type": "rules.celExpression.resourceTypesValues.values",
+    "resource_types": "rules.celExpression.resourceTypesValues.values",
+    "cel_expression": "rules.celExpression.expression",
+    "control": "cloudControlDetails.name",
+    "framework": "framework.framework",
+    "state": "deploymentState",
+}
+
+
+def to_camel_case(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+def normalize_field_path(path: str) -> List[str]:
+    path = FIELD_ALIASES.get(path, path)
+    return [to_camel_case(part) for part in path.split(".")]
+
+
+# Fields kept for each message type in compact output when no explicit field list is given.
+COMPACT_FIELDS = {
+    "google.cloud.cloudsecuritycompliance.v1.CloudControl": [
+        "name",
+        "displayName",
+        "majorRevisionId",
+        "severity",
+        "categories",
+        "supportedCloudProviders",
+    ],
+    "google.cloud.cloudsecuritycompliance.v1.Framework": [
+        "name",
+        "displayName",
+        "majorRevisionId",
+        "type",
+        "category",
+        "supportedCloudProviders",
+    ],
+    "google.cloud.cloudsecuritycompliance.v1.FrameworkDeployment": [
+        "name",
+        "framework",
+        "computedTargetResource",
+        "targetResourceDisplayName",
+        "deploymentState",
+    ],
+    "google.cloud.cloudsecuritycompliance.v1.CloudControlDeployment": [
+        "name",
+        "cloudControlMetadata.cloudControlDetails.name",
+        "targetResource",
+        "targetResourceDisplayName",
+        "deploymentState",
+    ],
+}
+
+
+@functools.lru_cache(maxsize=256)
+def build_field_mask(fields: Optional[tuple]) -> Optional[Dict[str, Any]]:
+    """Turns (possibly dotted) field paths into a nested mask; an empty subtree means 'everything below'.
+
+    Masks are cached and shared, so callers must not modify them.
+    """
+    if not fields:
+        return None
+    mask: Dict[str, Any] = {}
+    for field in fields:
+        node = mask
+        path = normalize_field_path(field)
+        for key in path[:-1]:
+            child = node.get(key)
+            if child == {} and key in node:
+                break  # An ancestor was already requested in full.
+            node = node.setdefault(key, {})
+        else:
+            node[path[-1]] = {}
+    return mask
+
+
+def shortest_float(value: float) -> float:
+    """Returns the shortest decimal that round-trips a float32 value, as MessageToDict does."""
+    packed = struct.pack("<f", value)
+    for precision in range(6, 10):
+        candidate = float(f"{value:.{precision}g}")
+        if struct.pack("<f", candidate) == packed:
+            return candidate
+    return value
+
+
+class ProtoSerializer:
+    """Converts protobuf messages to the JSON-style dicts json_format.MessageToDict produces."""
+
+    def __init__(self):
+        self._converters: Dict[Any, tuple] = {}
+
+    def to_dict(self, message: Any, mask: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        result = {}
+        for field, value in message.ListFields():
+            entry = self._converters.get(field)
+            if entry is None:
+                entry = self._converters[field] = (field.json_name, self._field_converter(field))
+            json_name, convert = entry
+            if mask is not None:
+                if json_name not in mask:
+                    continue
+                field_mask = mask[json_name] or None
+            else:
+                field_mask = None
+            result[json_name] = value if convert is None else convert(value, field_mask)
+        return result
+
+    def _field_converter(self, field: Any):
+        if field.is_extension:
+            return lambda value, mask: json_format.MessageToDict(value) if hasattr(value, "ListFields") else value
+        message_type = field.message_type
+        if message_type is not None and message_type.GetOptions().map_entry:
+            key_is_bool = message_type.fields_by_name["key"].type == field.TYPE_BOOL
+            convert_value = self._value_converter(message_type.fields_by_name["value"])
+
+            def convert_map(value, mask):
+                return {
+                    (("true" if key else "false") if key_is_bool else str(key)): convert_value(item, None)
+                    for key, item in value.items()
+                }
+
+            return convert_map
+        convert_item = self._value_converter(field)
+        repeated = field.is_repeated if hasattr(field, "is_repeated") else field.label == field.LABEL_REPEATED
+        if not repeated:
+            return convert_item  # None for plain scalars, which are stored as is.
+        if convert_item is None:
+            return lambda value, mask: list(value)
+        return lambda value, mask: [convert_item(item, mask) for item in value]
+
+    def _value_converter(self, field: Any):
+        """Returns a converter for a single value of `field`, or None when the value is already JSON-ready."""
+        cpp_type = field.cpp_type
+        if cpp_type == field.CPPTYPE_MESSAGE:
+            if field.message_type.file.package == "google.protobuf":
+                # Well-known types (Timestamp, Duration, Struct, ...) have special JSON forms.
+                return lambda value, mask: json_format.MessageToDict(value)
+            return self.to_dict
+        if cpp_type == field.CPPTYPE_ENUM:
+            names = {value.number: value.name for value in field.enum_type.values}
+            return lambda value, mask: names.get(value, value)
+        if cpp_type in (field.CPPTYPE_INT64, field.CPPTYPE_UINT64):
+            return lambda value, mask: str(value)
+        if field.type == field.TYPE_BYTES:
+            return lambda value, mask: base64.b64encode(value).decode("utf-8")
+        if cpp_type in (field.CPPTYPE_FLOAT, field.CPPTYPE_DOUBLE):
+            single = cpp_type == field.CPPTYPE_FLOAT
+
+            def convert_float(value, mask):
+                if math.isnan(value):
+                    return "NaN"
+                if math.isinf(value):
+                    return "Infinity" if value > 0 else "-Infinity"
+                return shortest_float(value) if single else value
+
+            return convert_float
+        return None
+
+
+serializer = ProtoSerializer()
+
+
+def proto_message_to_dict(
+    message: Any, fields: Optional[List[str]] = None, compact: bool = False
+) -> Dict[str, Any]:
+    """Converts a protobuf message to a dictionary.
+
+    Only the given (possibly dotted) `fields` are converted. With `compact`, and
+    no explicit fields, only the summary fields in COMPACT_FIELDS are kept.
+    """
+    try:
+        pb = getattr(message, "_pb", message)
+        if compact and not fields:
+            fields = COMPACT_FIELDS.get(pb.DESCRIPTOR.full_name)
+        return serializer.to_dict(pb, build_field_mask(tuple(fields) if fields else None))
+    except Exception as e:
+        logger.error(f"Error converting protobuf message to dict: {e}")
+        return {"error": "Failed to serialize response part", "details": str(e)}
@@ -0,0 +1,70 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The server module and the fakes in benchmarks/ are imported as top-level modules.
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import compliance_manager_mcp as server  # noqa: E402
+from fake_grpc_server import FakeServerThread, make_clients  # noqa: E402
+
+# Importing the server configures its logger; tests only care about results.
+logging.getLogger("compliance-manager-mcp").setLevel(logging.CRITICAL)
+
+
+class FakeApi:
+    """A fake API server on its own thread, with a way to run tool calls against it."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._thread = FakeServerThread(backend)
+        self.address = self._thread.start()
+
+    def run(self, call):
+        """Runs `call()` on a new event loop, with the server's clients pointed at the fake API."""
+
+        async def main():
+            # gRPC channels are bound to the event loop they are created on, so every run gets fresh clients.
+            config_client, deployment_client = make_clients(self.address)
+            server.clients.set("config", config_client)
+            server.clients.set("deployment", deployment_client)
+            return await call()
+
+        return asyncio.run(main())
+
+    def stop(self) -> None:
+        self._thread.stop()
+
+
+@pytest.fixture
+def fake_api():
+    """Starts a FakeApi for a backend; `fake_api(backend)` returns it, and it is stopped after the test."""
+    started = []
+
+    def start(backend) -> FakeApi:
+        started.append(FakeApi(backend))
+        return started[-1]
+
+    yield start
+    for api in started:
+        api.stop()
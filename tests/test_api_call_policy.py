@@ -0,0 +1,153 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ApiCallPolicy retries, retry budget and throttling against the quota-limited fake client."""
+
+import asyncio
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+from google.cloud.cloudsecuritycompliance_v1.types import GetCloudControlRequest
+
+import compliance_manager_mcp as server
+from bench_quota import PARENT, QuotaLimitedConfigClient
+
+UNLIMITED = 1000.0
+
+
+def get_control(policy: server.ApiCallPolicy, fake: QuotaLimitedConfigClient, method: str = "get_cloud_control"):
+    request = GetCloudControlRequest(name=f"{PARENT}/cloudControls/control-00001")
+    return policy.call(method, fake.get_cloud_control, request=request)
+
+
+async def gather_outcomes(calls) -> list:
+    return await asyncio.gather(*calls, return_exceptions=True)
+
+
+def test_quota_errors_are_retried_with_backoff():
+    fake = QuotaLimitedConfigClient(quota_per_second=1, unavailable_rate=0.0, latency=0.0)
+    policy = server.ApiCallPolicy(default_rate=UNLIMITED, max_retries=8, initial_delay=0.4, max_delay=1.0)
+
+    outcomes = asyncio.run(gather_outcomes(get_control(policy, fake) for _ in range(2)))
+
+    assert not [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    stats = policy.stats()["methods"]["get_cloud_control"]
+    assert fake.rejected >= 1
+    assert stats["retries"] == fake.rejected
+    assert stats["backoff_seconds"] > 0
+    assert stats["errors"] == {"ResourceExhausted": fake.rejected}
+    assert stats["failures"] == 0
+
+
+def test_retries_stop_after_max_retries():
+    fake = QuotaLimitedConfigClient(quota_per_second=0, unavailable_rate=0.0, latency=0.0)
+    policy = server.ApiCallPolicy(default_rate=UNLIMITED, max_retries=2, initial_delay=0.01)
+
+    with pytest.raises(google_exceptions.ResourceExhausted):
+        asyncio.run(get_control(policy, fake))
+
+    stats = policy.stats()["methods"]["get_cloud_control"]
+    assert fake.calls == 3
+    assert stats["retries"] == 2
+    assert stats["failures"] == 1
+    assert stats["budget_exhausted"] == 0
+
+
+def test_retry_budget_stops_retries():
+    fake = QuotaLimitedConfigClient(quota_per_second=1, unavailable_rate=0.0, latency=0.0)
+    policy = server.ApiCallPolicy(
+        default_rate=UNLIMITED, max_retries=8, initial_delay=0.01, budget_ratio=0.0, budget_reserve=1.0
+    )
+
+    outcomes = asyncio.run(gather_outcomes(get_control(policy, fake) for _ in range(4)))
+
+    failed = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    assert all(isinstance(outcome, google_exceptions.ResourceExhausted) for outcome in failed)
+    stats = policy.stats()["methods"]["get_cloud_control"]
+    # The reserve pays for a single retry; every other rejected call fails at once.
+    assert stats["retries"] == 1
+    assert fake.calls == 5
+    assert stats["budget_exhausted"] == stats["failures"] == len(failed) >= 1
+
+
+def test_rate_limit_records_throttled_time():
+    fake = QuotaLimitedConfigClient(quota_per_second=1000, unavailable_rate=0.0, latency=0.0)
+    policy = server.ApiCallPolicy(default_rate=10.0, max_retries=0)
+
+    outcomes = asyncio.run(gather_outcomes(get_control(policy, fake) for _ in range(15)))
+
+    assert not [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    stats = policy.stats()
+    assert fake.rejected == 0
+    assert stats["calls"] == 15
+    assert stats["retries"] == 0
+    # A burst of 10 goes through at once; the other 5 wait about 0.1s each in turn.
+    assert stats["throttled_seconds"] >= 0.5
+    assert stats["methods"]["get_cloud_control"]["rate_limit_qps"] == 10.0
+
+
+def test_state_changing_methods_are_only_retried_on_quota_errors():
+    fake = QuotaLimitedConfigClient(quota_per_second=1000, unavailable_rate=1.0, latency=0.0)
+    policy = server.ApiCallPolicy(default_rate=UNLIMITED, max_retries=3, initial_delay=0.01)
+
+    with pytest.raises(google_exceptions.ServiceUnavailable):
+        asyncio.run(get_control(policy, fake, method="create_cloud_control"))
+    assert fake.calls == 1
+
+    with pytest.raises(google_exceptions.ServiceUnavailable):
+        asyncio.run(get_control(policy, fake))
+    assert fake.calls == 1 + 4
+
+    stats = policy.stats()["methods"]
+    assert stats["create_cloud_control"]["retries"] == 0
+    assert stats["get_cloud_control"]["retries"] == 3
+    assert stats["get_cloud_control"]["errors"] == {"ServiceUnavailable": 4}
+
+
+def test_bulk_submissions_are_not_retried_on_top_of_the_policy():
+    attempts = []
+
+    async def submit(target: str):
+        attempts.append(target)
+        raise google_exceptions.ServiceUnavailable("The service is currently unavailable.")
+
+    result = asyncio.run(
+        server.run_bulk_operations(["projects/a", "projects/b"], submit, "create_framework_deployment")
+    )
+
+    assert attempts == ["projects/a", "projects/b"]
+    assert result["summary"] == {"SUBMIT_FAILED": 2}
+
+
+def test_fan_outs_bound_concurrency_without_a_second_rate_limit():
+    in_flight = []
+    peak = []
+
+    async def list_page(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+
+    async def fan_out():
+        call = server.concurrency_limited(list_page, asyncio.Semaphore(3))
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(*(call(request=index) for index in range(12)))
+        return asyncio.get_running_loop().time() - start
+
+    elapsed = asyncio.run(fan_out())
+
+    assert max(peak) == 3
+    # Four waves of three calls, with no per-call rate limit stacked on top.
+    assert elapsed < 0.2
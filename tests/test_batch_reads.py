@@ -0,0 +1,79 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""batch_get_* tools against the fake gRPC backend."""
+
+import asyncio
+
+import pytest
+from google.cloud.cloudsecuritycompliance_v1.types import FrameworkDeployment, FrameworkReference
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_cloud_controls=20, num_frameworks=3
+    )
+    for i in range(4):
+        name = f"{PARENT}/frameworkDeployments/deployment-{i}"
+        backend.framework_deployments[name] = FrameworkDeployment(
+            name=name, framework=FrameworkReference(framework=next(iter(backend.frameworks)), major_revision_id=1)
+        )
+    return backend
+
+
+def short_ids(names) -> list:
+    return [name.rsplit("/", 1)[-1] for name in names]
+
+
+@pytest.mark.parametrize("profile", ["", "default"])
+def test_batch_gets_pass_the_profile_through(fake_api, backend, profile):
+    framework_ids = short_ids(backend.frameworks)[:2]
+    control_ids = short_ids(backend.cloud_controls)[:3]
+    deployment_ids = short_ids(backend.framework_deployments)[:2]
+    parent = f"organizations/{ORGANIZATION_ID}"
+
+    async def calls():
+        return await asyncio.gather(
+            server.batch_get_frameworks(ORGANIZATION_ID, framework_ids, profile=profile),
+            server.batch_get_cloud_controls(ORGANIZATION_ID, control_ids, profile=profile),
+            server.batch_get_framework_deployments(parent, deployment_ids, profile=profile),
+        )
+
+    frameworks, controls, deployments = fake_api(backend).run(calls)
+
+    assert [result.get("error") for result in frameworks["results"]] == [None, None]
+    assert frameworks["succeeded"] == 2
+    assert controls["succeeded"] == 3
+    assert deployments["succeeded"] == 2
+
+
+def test_batch_get_reports_missing_items_per_item(fake_api, backend):
+    existing = short_ids(backend.cloud_controls)[0]
+
+    result = fake_api(backend).run(
+        lambda: server.batch_get_cloud_controls(ORGANIZATION_ID, [existing, "no-such-control"])
+    )
+
+    assert result["succeeded"] == 1
+    assert result["failed"] == 1
+    assert result["results"][1]["error"] == "Not Found"
@@ -0,0 +1,40 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Regression gates of the stdio benchmark."""
+
+from bench_stdio import check_thresholds, compare
+
+
+def run(p99_ms=10.0, throughput=100.0, errors=0, startup_ms=500.0):
+    scenario = {"throughput_per_second": throughput, "p50_ms": 5.0, "p99_ms": p99_ms, "errors": errors}
+    return {"startup_ms": startup_ms, "memory_high_water_mb": 80.0, "scenarios": {"get_framework": scenario}}
+
+
+def test_compare_passes_within_the_allowed_regression():
+    assert compare(run(p99_ms=11.0, throughput=90.0), run(), 0.2) == []
+
+
+def test_compare_flags_slower_and_failing_runs():
+    regressions = compare(run(p99_ms=20.0, throughput=50.0, errors=2), run(), 0.2)
+    assert [r.split(":")[0] for r in sorted(regressions)] == [
+        "get_framework.errors", "get_framework.p99_ms", "get_framework.throughput_per_second",
+    ]
+
+
+def test_thresholds():
+    assert check_thresholds(run(), max_p99_ms=50, min_throughput=10, max_errors=0) == []
+    assert check_thresholds(run(p99_ms=60.0)) == []
+    violations = check_thresholds(run(p99_ms=60.0, throughput=5.0, errors=1), 50, 10, 0)
+    assert len(violations) == 3
@@ -0,0 +1,120 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Call deadlines: shared catalog reads, Deadline Exceeded results and cancelled operation waits."""
+
+import asyncio
+
+import pytest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+
+
+async def with_deadline(seconds: float, call):
+    token = server.call_deadline.set(server.time.monotonic() + seconds)
+    try:
+        return await call()
+    finally:
+        server.call_deadline.reset(token)
+
+
+def test_shared_fetch_ignores_the_deadline_of_the_caller_that_started_it():
+    cache = server.TTLCache()
+    fetch_deadlines = []
+
+    async def fetch():
+        fetch_deadlines.append(server.call_deadline.get())
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def reads():
+        hasty = asyncio.ensure_future(with_deadline(0.01, lambda: cache.get_or_fetch(("a",), fetch)))
+        patient = asyncio.ensure_future(cache.get_or_fetch(("a",), fetch))
+        return await asyncio.gather(hasty, patient, return_exceptions=True)
+
+    hasty, patient = asyncio.run(reads())
+
+    assert isinstance(hasty, server.google_exceptions.DeadlineExceeded)
+    assert patient == "value"
+    assert fetch_deadlines == [None]
+    assert cache.get(("a",)) == (True, "value")
+
+
+def test_fetch_is_cancelled_when_its_only_caller_times_out():
+    cache = server.TTLCache()
+    cancelled = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def read():
+        with pytest.raises(server.google_exceptions.DeadlineExceeded):
+            await with_deadline(0.01, lambda: cache.get_or_fetch(("a",), fetch))
+        await asyncio.sleep(0)
+
+    asyncio.run(read())
+
+    assert cancelled == [1]
+    assert cache.stats()["in_flight"] == 0
+
+
+@pytest.fixture
+def slow_backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    return FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.3, num_frameworks=1, num_cloud_controls=2
+    )
+
+
+def test_tools_report_expired_deadlines_as_deadline_exceeded(fake_api, slow_backend):
+    control_id = next(iter(slow_backend.cloud_controls)).rsplit("/", 1)[-1]
+
+    result = fake_api(slow_backend).run(
+        lambda: server.get_cloud_control(ORGANIZATION_ID, control_id, timeout_seconds=0.05)
+    )
+
+    assert result["error"] == "Deadline Exceeded"
+
+
+def test_cancelled_operation_wait_stops_tracking_the_operation(fake_api, monkeypatch):
+    monkeypatch.setattr(server, "operation_tracker", server.OperationTracker(initial_delay=0.01, max_delay=0.02))
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=2, operation_polls=1000
+    )
+    operation_id = backend._new_operation("target").name
+
+    async def wait_then_cancel():
+        waiter = asyncio.ensure_future(server.fetch_lro_status(operation_id, timeout=10))
+        await asyncio.sleep(0.05)
+        assert server.operation_tracker.status(operation_id)["state"] == "RUNNING"
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        # A poll already sent may still reach the fake API's thread; only later polls count.
+        await asyncio.sleep(0.05)
+        polls = backend.rpc_count
+        await asyncio.sleep(0.1)
+        return polls
+
+    polls = fake_api(backend).run(wait_then_cancel)
+
+    assert server.operation_tracker.status(operation_id) is None
+    assert backend.rpc_count == polls
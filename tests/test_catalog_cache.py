@@ -0,0 +1,203 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The TTL + LRU catalog cache and the catalog reads served from it."""
+
+import asyncio
+
+import pytest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = server.TTLCache(maxsize=8, ttl=60.0)
+    monkeypatch.setattr(server, "catalog_cache", cache)
+    return cache
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    cache = server.TTLCache(maxsize=2, ttl=60.0)
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    cache.get(("a",))
+    cache.set(("c",), 3)
+
+    assert cache.get(("b",)) == (False, None)
+    assert cache.get(("a",)) == (True, 1)
+    assert cache.get(("c",)) == (True, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    cache = server.TTLCache(maxsize=2, ttl=10.0)
+    cache.set(("a",), 1)
+
+    now[0] += 9.0
+    assert cache.get(("a",)) == (True, 1)
+    now[0] += 2.0
+    assert cache.get(("a",)) == (False, None)
+    assert cache.stats()["size"] == 0
+
+
+def test_invalidate_drops_entries_under_a_prefix():
+    cache = server.TTLCache()
+    cache.set(("organizations/1/locations/global/frameworks/a", "get_framework"), 1)
+    cache.set(("organizations/2/locations/global/frameworks/b", "get_framework"), 2)
+
+    assert cache.invalidate("organizations/1/") == 1
+    assert cache.get(("organizations/2/locations/global/frameworks/b", "get_framework")) == (True, 2)
+
+
+def test_get_or_fetch_calls_fetch_on_misses_and_refreshes_only():
+    cache = server.TTLCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    async def reads():
+        return [
+            await cache.get_or_fetch(("a",), fetch),
+            await cache.get_or_fetch(("a",), fetch),
+            await cache.get_or_fetch(("a",), fetch, refresh=True),
+        ]
+
+    assert asyncio.run(reads()) == [1, 1, 2]
+
+
+def test_catalog_reads_are_served_from_the_cache(fake_api, cache):
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=3
+    )
+    control_id = next(iter(backend.cloud_controls)).rsplit("/", 1)[-1]
+
+    async def reads():
+        first = await server.get_cloud_control(ORGANIZATION_ID, control_id)
+        second = await server.get_cloud_control(ORGANIZATION_ID, control_id)
+        refreshed = await server.get_cloud_control(ORGANIZATION_ID, control_id, refresh=True)
+        return first, second, refreshed
+
+    first, second, refreshed = fake_api(backend).run(reads)
+
+    assert first == second == refreshed
+    assert backend.rpc_count == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_concurrent_misses_share_one_fetch():
+    cache = server.TTLCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def reads():
+        return await asyncio.gather(*(cache.get_or_fetch(("a",), fetch) for _ in range(5)))
+
+    assert asyncio.run(reads()) == ["value"] * 5
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 4
+    assert cache.stats()["in_flight"] == 0
+    assert cache.get(("a",)) == (True, "value")
+
+
+def test_cancelled_caller_leaves_the_shared_fetch_running():
+    cache = server.TTLCache()
+    started = []
+
+    async def fetch():
+        started.append(1)
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def reads():
+        first = asyncio.ensure_future(cache.get_or_fetch(("a",), fetch))
+        second = asyncio.ensure_future(cache.get_or_fetch(("a",), fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = asyncio.run(reads())
+
+    assert isinstance(first, asyncio.CancelledError)
+    assert second == "value"
+    assert len(started) == 1
+
+
+def test_fetch_is_cancelled_once_every_caller_is_gone():
+    cache = server.TTLCache()
+    fetch_cancelled = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            fetch_cancelled.append(1)
+            raise
+
+    async def read_and_cancel():
+        reader = asyncio.ensure_future(cache.get_or_fetch(("a",), fetch))
+        await asyncio.sleep(0)
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    asyncio.run(read_and_cancel())
+
+    assert fetch_cancelled == [1]
+    assert cache.stats()["in_flight"] == 0
+    assert cache.get(("a",)) == (False, None)
+
+
+def test_fetches_detached_by_invalidate_are_not_stored():
+    cache = server.TTLCache()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "stale"
+
+    async def read_during_write():
+        reader = asyncio.ensure_future(cache.get_or_fetch(("organizations/1/frameworks/a",), fetch))
+        await asyncio.sleep(0)
+        cache.invalidate("organizations/1/")
+        return await reader
+
+    assert asyncio.run(read_during_write()) == "stale"
+    assert cache.get(("organizations/1/frameworks/a",)) == (False, None)
+
+
+def test_concurrent_tool_reads_cost_one_rpc(fake_api, cache):
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.01, num_frameworks=1, num_cloud_controls=3
+    )
+    control_id = next(iter(backend.cloud_controls)).rsplit("/", 1)[-1]
+
+    async def reads():
+        return await asyncio.gather(*(server.get_cloud_control(ORGANIZATION_ID, control_id) for _ in range(5)))
+
+    results = fake_api(backend).run(reads)
+
+    assert all(result == results[0] for result in results)
+    assert "error" not in results[0]
+    assert backend.rpc_count == 1
@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dry-running cloud control CEL expressions over a local Cloud Asset Inventory export."""
+
+import asyncio
+import json
+
+import pytest
+
+import cel_evaluation
+import compliance_manager_mcp as server
+
+pytest.importorskip("celpy")
+
+INSTANCE = "compute.googleapis.com/Instance"
+SECURE_BOOT = "has(resource.data.secureBoot) && resource.data.secureBoot"
+
+
+def assets() -> list:
+    """Ten instances, the even ones with secure boot, and a bucket that must be skipped."""
+    instances = [
+        {"name": f"//compute.googleapis.com/instances/vm-{i}", "asset_type": INSTANCE,
+         "resource": {"data": {"secureBoot": i % 2 == 0}}}
+        for i in range(10)
+    ]
+    bucket = {"name": "//storage.googleapis.com/bucket", "asset_type": "storage.googleapis.com/Bucket",
+              "resource": {"data": {}}}
+    return instances + [bucket]
+
+
+def dry_run(path, **kwargs) -> dict:
+    return asyncio.run(server.dry_run_cloud_control(INSTANCE, SECURE_BOOT, str(path), **kwargs))
+
+
+@pytest.fixture
+def ndjson_export(tmp_path):
+    path = tmp_path / "assets.ndjson"
+    path.write_text("\n".join(json.dumps(asset) for asset in assets()) + "\nnot json, but an instance " + INSTANCE)
+    return path
+
+
+def test_ndjson_export_is_evaluated_in_process(ndjson_export):
+    result = dry_run(ndjson_export)
+
+    assert (result["assets_scanned"], result["assets_evaluated"]) == (12, 10)
+    assert (result["failing"], result["passing"], result["errors"], result["invalid_lines"]) == (5, 5, 0, 1)
+    assert result["failing_resources"] == [f"//compute.googleapis.com/instances/vm-{i}" for i in (1, 3, 5, 7, 9)]
+    assert result["passing_resources"] == []
+    assert result["timing"]["workers"] == 1
+
+
+def test_json_array_export_gives_the_same_result(tmp_path):
+    path = tmp_path / "assets.json"
+    path.write_text(json.dumps(assets(), indent=2))
+
+    result = dry_run(path, include_passing=True, max_results=2)
+
+    assert (result["assets_scanned"], result["failing"], result["passing"]) == (11, 5, 5)
+    assert len(result["failing_resources"]) == len(result["passing_resources"]) == 2
+    assert result["truncated"]
+
+
+def test_pooled_evaluation_matches_in_process_evaluation(monkeypatch, ndjson_export):
+    monkeypatch.setattr(server, "DRY_RUN_CHUNK_SIZE", 3)
+    monkeypatch.setattr(server, "CEL_WORKERS", 2)
+    monkeypatch.setattr(cel_evaluation, "CEL_WORKERS", 2)
+    monkeypatch.setattr(cel_evaluation, "_cel_worker_pool", None)
+
+    inline = dry_run(ndjson_export)
+    pooled = dry_run(ndjson_export, workers=8)
+    pool = cel_evaluation.get_cel_worker_pool()
+    try:
+        # More workers than the pool holds get the whole pool, which is never replaced.
+        assert pooled["timing"]["workers"] == 2
+        assert dry_run(ndjson_export, workers=2)["failing"] == 5
+        assert cel_evaluation.get_cel_worker_pool() is pool
+        for key in ("assets_scanned", "assets_evaluated", "failing", "passing", "failing_resources"):
+            assert pooled[key] == inline[key]
+    finally:
+        pool.shutdown()
+
+
+def test_evaluation_errors_are_reported_per_resource(ndjson_export):
+    result = asyncio.run(server.dry_run_cloud_control(INSTANCE, "resource.data.missing", str(ndjson_export)))
+
+    assert (result["errors"], result["failing"], result["passing"]) == (10, 0, 0)
+    assert len(result["evaluation_errors"]) == 10
+
+
+def test_invalid_expression_and_missing_export_are_errors(tmp_path, ndjson_export):
+    invalid = asyncio.run(server.dry_run_cloud_control(INSTANCE, "resource.data.(", str(ndjson_export)))
+    missing = dry_run(tmp_path / "missing.json")
+
+    assert invalid["error"] == "Invalid Argument"
+    assert missing["error"] == "Not Found"
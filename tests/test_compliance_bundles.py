@@ -0,0 +1,128 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Importing and exporting bundles of custom cloud control and framework definitions."""
+
+import json
+
+import pytest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+COPY_ORGANIZATION_ID = "210987654321"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+BUNDLE = """\
+cloud_controls:
+- id: require-secure-boot
+  displayName: Require Secure Boot
+  severity: HIGH
+  cel_expression: resource.data.secureBoot
+  resource_types: [compute.googleapis.com/Instance]
+frameworks:
+- id: hardened-vms
+  displayName: Hardened VMs
+  cloudControls: [require-secure-boot, {id: control-00000, majorRevisionId: 1}]
+"""
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    return FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=2, controls_per_framework=2
+    )
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    path = tmp_path / "bundle.yaml"
+    path.write_text(BUNDLE)
+    return path
+
+
+def test_import_creates_controls_then_frameworks_pinned_to_their_revisions(fake_api, backend, bundle_path):
+    result = fake_api(backend).run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(bundle_path)))
+
+    assert result["summary"] == {"CREATED": 2}
+    control = backend.cloud_controls[f"{PARENT}/cloudControls/require-secure-boot"]
+    assert control.rules[0].cel_expression.expression == "resource.data.secureBoot"
+    assert list(control.rules[0].cel_expression.resource_types_values.values) == ["compute.googleapis.com/Instance"]
+    framework = backend.frameworks[f"{PARENT}/frameworks/hardened-vms"]
+    assert [(d.name.rsplit("/", 1)[-1], d.major_revision_id) for d in framework.cloud_control_details] == [
+        ("require-secure-boot", 1),
+        ("control-00000", 1),
+    ]
+
+
+def test_reimport_reports_existing_definitions(fake_api, backend, bundle_path):
+    api = fake_api(backend)
+    api.run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(bundle_path)))
+
+    assert api.run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(bundle_path)))["summary"] == {
+        "EXISTS": 2
+    }
+    strict = api.run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(bundle_path), skip_existing=False))
+    # The existing control now counts as a failure, so the framework using it is not attempted.
+    assert strict["summary"] == {"FAILED": 1, "SKIPPED": 1}
+
+
+def test_frameworks_using_a_failed_control_are_skipped(fake_api, backend, tmp_path):
+    path = tmp_path / "bundle.json"
+    path.write_text(json.dumps({
+        "cloud_controls": [{"id": "broken", "severity": "NOT_A_SEVERITY"}],
+        "frameworks": [{"id": "uses-broken", "cloudControls": ["broken"]}],
+    }))
+
+    result = fake_api(backend).run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(path)))
+
+    assert [row["status"] for row in result["cloud_controls"] + result["frameworks"]] == ["FAILED", "SKIPPED"]
+    assert f"{PARENT}/frameworks/uses-broken" not in backend.frameworks
+
+
+@pytest.mark.parametrize("extension", ["yaml", "json"])
+def test_export_round_trips_into_another_organization(fake_api, backend, bundle_path, tmp_path, extension):
+    exported = tmp_path / f"exported.{extension}"
+    api = fake_api(backend)
+    api.run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(bundle_path)))
+
+    result = api.run(lambda: server.export_compliance_bundle(ORGANIZATION_ID, str(exported)))
+    # Only the custom framework is exported, with the two cloud controls it uses.
+    assert (result["format"], result["frameworks"], result["cloud_controls"]) == (extension, 1, 2)
+    assert not (tmp_path / f"exported.{extension}.partial").exists()
+
+    copied = api.run(lambda: server.import_compliance_bundle(COPY_ORGANIZATION_ID, str(exported)))
+    assert copied["summary"] == {"CREATED": 3}
+    copy_parent = f"organizations/{COPY_ORGANIZATION_ID}/locations/global"
+    original = backend.cloud_controls[f"{PARENT}/cloudControls/require-secure-boot"]
+    copy = backend.cloud_controls[f"{copy_parent}/cloudControls/require-secure-boot"]
+    assert (copy.display_name, copy.severity, copy.rules) == (original.display_name, original.severity, original.rules)
+    framework = backend.frameworks[f"{copy_parent}/frameworks/hardened-vms"]
+    assert {d.name for d in framework.cloud_control_details} == {
+        f"{copy_parent}/cloudControls/require-secure-boot",
+        f"{copy_parent}/cloudControls/control-00000",
+    }
+
+
+def test_invalid_bundles_are_rejected(fake_api, backend, tmp_path):
+    path = tmp_path / "bundle.json"
+    path.write_text(json.dumps({"cloud_controls": [{"id": "a"}, {"id": "a"}]}))
+    api = fake_api(backend)
+
+    assert api.run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(path)))["error"] == "Invalid Argument"
+    missing = api.run(lambda: server.import_compliance_bundle(ORGANIZATION_ID, str(tmp_path / "missing.yaml")))
+    assert missing["error"] == "Not Found"
@@ -0,0 +1,174 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Planning and applying a desired-state document as a dependency graph of changes."""
+
+import asyncio
+import os
+
+import pytest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+DOCUMENT = """\
+cloud_controls:
+- id: require-secure-boot
+  displayName: Require Secure Boot
+  severity: HIGH
+frameworks:
+- id: hardened-vms
+  displayName: Hardened VMs
+  cloudControls: [require-secure-boot, control-00000]
+deployments:
+- framework: hardened-vms
+  targets: [projects/project-a, projects/project-b]
+"""
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    monkeypatch.setattr(server, "operation_tracker", server.OperationTracker(initial_delay=0.01, max_delay=0.02))
+    # Plans list every collection, quickly exceeding the default rate limit; a throttled
+    # limiter's lock would be shared across the event loops of the runs below.
+    monkeypatch.setattr(server, "api_policy", server.ApiCallPolicy(default_rate=1000.0))
+    return FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=2, controls_per_framework=2
+    )
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "desired.yaml"
+    path.write_text(DOCUMENT)
+    return str(path)
+
+
+def plan_and_apply(api, path: str) -> dict:
+    plan = api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, path))
+    return api.run(lambda: server.apply_compliance_plan(plan["plan_id"]))
+
+
+def test_change_graph_runs_changes_after_their_dependencies():
+    changes = [
+        {"key": "a", "action": "CREATE", "resource": "a", "depends_on": []},
+        {"key": "b", "action": "CREATE", "resource": "b", "depends_on": []},
+        {"key": "c", "action": "CREATE", "resource": "c", "depends_on": ["a", "b"]},
+        {"key": "d", "action": "CREATE", "resource": "d", "depends_on": ["c"]},
+    ]
+    started, finished = [], []
+
+    async def execute(change):
+        started.append(change["key"])
+        await asyncio.sleep(0.01 if change["key"] == "a" else 0)
+        finished.append(change["key"])
+
+    rows = asyncio.run(server.run_change_graph(changes, execute, max_concurrency=4))
+
+    assert [row["status"] for row in rows] == ["APPLIED"] * 4
+    # a and b start together; c waits for both, and d for c.
+    assert set(started[:2]) == {"a", "b"}
+    assert finished.index("c") > finished.index("a") and started.index("d") > finished.index("c")
+
+
+def test_change_graph_skips_changes_whose_dependency_failed():
+    changes = [
+        {"key": "a", "action": "CREATE", "resource": "a", "depends_on": []},
+        {"key": "b", "action": "CREATE", "resource": "b", "depends_on": ["a"]},
+        {"key": "c", "action": "CREATE", "resource": "c", "depends_on": ["b"]},
+        {"key": "x", "action": "CREATE", "resource": "x", "depends_on": []},
+    ]
+
+    async def execute(change):
+        if change["key"] == "a":
+            raise RuntimeError("boom")
+
+    rows = asyncio.run(server.run_change_graph(changes, execute, max_concurrency=2))
+
+    assert [row["status"] for row in rows] == ["FAILED", "SKIPPED", "SKIPPED", "APPLIED"]
+
+
+def test_plan_orders_changes_and_planning_again_after_apply_is_a_no_op(fake_api, backend, document):
+    api = fake_api(backend)
+
+    plan = api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, document))
+    assert plan["summary"] == {"CREATE": 4}
+    keys = [change["key"] for change in plan["changes"]]
+    assert keys[:2] == ["cloud_control:require-secure-boot", "framework:hardened-vms"]
+    assert all(change["depends_on"] == ["framework:hardened-vms"] for change in plan["changes"][2:])
+
+    applied = api.run(lambda: server.apply_compliance_plan(plan["plan_id"]))
+    assert applied["summary"] == {"APPLIED": 4}
+    framework = backend.frameworks[f"{PARENT}/frameworks/hardened-vms"]
+    assert {d.name.rsplit("/", 1)[-1] for d in framework.cloud_control_details} == {
+        "require-secure-boot", "control-00000"
+    }
+    assert api.run(lambda: server.apply_compliance_plan(plan["plan_id"]))["error"] == "Failed Precondition"
+
+    replan = api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, document))
+    assert replan["no_op"] and replan["changes"] == [] and replan["drift"] == []
+
+
+def test_plan_updates_changed_definitions_and_their_dependents(fake_api, backend, document, tmp_path):
+    api = fake_api(backend)
+    plan_and_apply(api, document)
+    changed = tmp_path / "changed.yaml"
+    changed.write_text(DOCUMENT.replace("severity: HIGH", "severity: CRITICAL"))
+
+    plan = api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, str(changed)))
+
+    # The control gets a new revision, so the framework must pin it, and the deployments drift.
+    assert [(change["action"], change["key"]) for change in plan["changes"]] == [
+        ("UPDATE", "cloud_control:require-secure-boot"),
+        ("UPDATE", "framework:hardened-vms"),
+    ]
+    assert plan["changes"][0]["changed_fields"] == ["severity"]
+    assert plan["changes"][1]["depends_on"] == ["cloud_control:require-secure-boot"]
+    assert len(plan["drift"]) == 2
+
+
+def test_planning_reads_the_live_catalog_not_the_snapshot(monkeypatch, fake_api, backend, document, tmp_path):
+    api = fake_api(backend)
+    plan_and_apply(api, document)
+    store = server.CatalogSnapshotStore(os.path.join(tmp_path, "catalog.sqlite3"), max_age=3600.0)
+    # A snapshot saved before the apply, e.g. by an earlier session, lacks the new definitions.
+    asyncio.run(store.save(PARENT, "cloud_controls", []))
+    asyncio.run(store.save(PARENT, "frameworks", []))
+    monkeypatch.setattr(server, "catalog_snapshot", store)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+
+    assert api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, document))["no_op"]
+    page = asyncio.run(store.load_page(PARENT, "cloud_controls", 0, -1))
+    assert f"{PARENT}/cloudControls/require-secure-boot" in {control.name for control in page[0]}
+
+
+def test_refresh_bypasses_the_in_memory_catalog_cache(fake_api, backend, document):
+    api = fake_api(backend)
+    assert api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, document))["summary"]["CREATE"] == 4
+    # A definition created outside this server is only seen once the cache is bypassed.
+    name = f"{PARENT}/cloudControls/require-secure-boot"
+    backend.cloud_controls[name] = server.cloudsecuritycompliance_v1.CloudControl(
+        name=name, display_name="Require Secure Boot", severity="HIGH", major_revision_id=1
+    )
+
+    cached = api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, document))
+    refreshed = api.run(lambda: server.plan_compliance_changes(ORGANIZATION_ID, document, refresh=True))
+
+    assert cached["summary"]["CREATE"] == 4
+    assert refreshed["summary"] == {"CREATE": 3}
@@ -0,0 +1,96 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resolving the cloud controls, revisions and enforcement modes of a framework deployment."""
+
+import pytest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+FRAMEWORK = f"{PARENT}/frameworks/framework-000"
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    return FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=6, controls_per_framework=4
+    )
+
+
+def resolved(metadata_list) -> dict:
+    return {
+        metadata.cloud_control_details.name.rsplit("/", 1)[-1]: (
+            metadata.cloud_control_details.major_revision_id,
+            metadata.enforcement_mode.name,
+        )
+        for metadata in metadata_list
+    }
+
+
+def test_controls_and_revisions_come_from_the_framework(fake_api, backend):
+    metadata_list = fake_api(backend).run(lambda: server.resolve_cloud_control_metadata(FRAMEWORK))
+
+    assert resolved(metadata_list) == {
+        "control-00000": (1, "DETECTIVE"),
+        "control-00001": (2, "DETECTIVE"),
+        "control-00002": (3, "DETECTIVE"),
+        "control-00003": (1, "DETECTIVE"),
+    }
+    # The framework already carries every revision, so nothing else is looked up.
+    assert backend.rpc_count == 1
+
+
+def test_missing_revisions_are_looked_up_once_each(fake_api, backend):
+    metadata_list = fake_api(backend).run(
+        lambda: server.resolve_cloud_control_metadata(FRAMEWORK, "control-00001,control-00002#7,control-00001")
+    )
+
+    assert [metadata.cloud_control_details.major_revision_id for metadata in metadata_list] == [2, 7, 2]
+    # The repeated control is served from the catalog cache.
+    assert backend.rpc_count == 1
+
+
+def test_enforcement_modes_override_the_default(fake_api, backend):
+    metadata_list = fake_api(backend).run(
+        lambda: server.resolve_cloud_control_metadata(
+            FRAMEWORK,
+            enforcement_mode="audit",
+            enforcement_modes={"control-00001": "PREVENTIVE", f"{PARENT}/cloudControls/control-00003": "detective"},
+        )
+    )
+
+    assert {control: mode for control, (_, mode) in resolved(metadata_list).items()} == {
+        "control-00000": "AUDIT",
+        "control-00001": "PREVENTIVE",
+        "control-00002": "AUDIT",
+        "control-00003": "DETECTIVE",
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"enforcement_mode": "STRICT"}, "Invalid enforcement mode"),
+        ({"enforcement_modes": {"control-00005": "AUDIT"}}, "not being deployed: control-00005"),
+        ({"cloud_controls": "control-00001#x"}, "No cloud controls to deploy"),
+    ],
+)
+def test_invalid_requests_raise_value_errors(fake_api, backend, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        fake_api(backend).run(lambda: server.resolve_cloud_control_metadata(FRAMEWORK, **kwargs))
@@ -0,0 +1,110 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Diffing framework deployments against the latest revision of their framework."""
+
+import pytest
+from google.cloud.cloudsecuritycompliance_v1.types import (
+    CloudControlDetails,
+    CloudControlMetadata,
+    EnforcementMode,
+    FrameworkDeployment,
+    FrameworkReference,
+)
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+FRAMEWORK = f"{PARENT}/frameworks/framework-000"
+
+
+def deployment(controls: dict, framework_revision: int = 1, name: str = "cis") -> FrameworkDeployment:
+    """Builds a deployment of FRAMEWORK from {cloud control ID: (revision, enforcement mode)}."""
+    return FrameworkDeployment(
+        name=f"{PARENT}/frameworkDeployments/{name}",
+        framework=FrameworkReference(framework=FRAMEWORK, major_revision_id=framework_revision),
+        computed_target_resource=f"organizations/{ORGANIZATION_ID}",
+        cloud_control_metadata=[
+            CloudControlMetadata(
+                cloud_control_details=CloudControlDetails(
+                    name=f"{PARENT}/cloudControls/{control}", major_revision_id=revision
+                ),
+                enforcement_mode=EnforcementMode[mode],
+            )
+            for control, (revision, mode) in controls.items()
+        ],
+    )
+
+
+def test_index_reads_revisions_and_modes_by_control_id():
+    index = server.index_deployed_controls(deployment({"a": (2, "DETECTIVE"), "b": (1, "PREVENTIVE")}))
+
+    assert index == {"a": (2, "DETECTIVE"), "b": (1, "PREVENTIVE")}
+
+
+def test_diff_reports_missing_extra_and_outdated_controls():
+    deployed = {"a": (1, "DETECTIVE"), "b": (3, "DETECTIVE"), "x": (1, "DETECTIVE")}
+    baseline = {"a": (2, ""), "b": (3, ""), "c": (1, "")}
+
+    assert server.diff_deployment(deployed, baseline) == {
+        "missing_controls": ["c"],
+        "extra_controls": ["x"],
+        "outdated_controls": [{"cloud_control": "a", "deployed_revision": 1, "latest_revision": 2}],
+        "enforcement_mode_mismatches": [],
+    }
+
+
+def test_diff_checks_enforcement_modes_only_when_expected_modes_are_given():
+    deployed = {"a": (1, "DETECTIVE"), "b": (1, "PREVENTIVE")}
+    baseline = {"a": (1, ""), "b": (1, "")}
+
+    assert not any(server.diff_deployment(deployed, baseline).values())
+    delta = server.diff_deployment(deployed, baseline, {"a": "PREVENTIVE", "b": "PREVENTIVE"})
+    assert delta["enforcement_mode_mismatches"] == [
+        {"cloud_control": "a", "deployed_mode": "DETECTIVE", "expected_mode": "PREVENTIVE"}
+    ]
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=3, controls_per_framework=3
+    )
+    # The framework deploys control-00000..2 at revisions 1, 2 and 3.
+    for seeded in (
+        deployment({"control-00000": (1, "DETECTIVE"), "control-00001": (1, "DETECTIVE")}, name="drifted"),
+        deployment(
+            {"control-00000": (1, "DETECTIVE"), "control-00001": (2, "DETECTIVE"), "control-00002": (3, "DETECTIVE")},
+            name="current",
+        ),
+    ):
+        backend.framework_deployments[seeded.name] = seeded
+    return backend
+
+
+def test_detect_drift_reports_only_drifted_deployments(fake_api, backend):
+    result = fake_api(backend).run(lambda: server.detect_drift(f"organizations/{ORGANIZATION_ID}"))
+
+    assert result["summary"] == {"deployments": 2, "drifted": 1, "up_to_date": 1, "unchecked": 0}
+    [drift] = result["drift"]
+    assert drift["deployment"] == f"{PARENT}/frameworkDeployments/drifted"
+    assert drift["missing_controls"] == ["control-00002"]
+    assert drift["outdated_controls"] == [
+        {"cloud_control": "control-00001", "deployed_revision": 1, "latest_revision": 2}
+    ]
+    assert result["frameworks"]["framework-000"] == {"latest_revision": 1, "cloud_controls": 3}
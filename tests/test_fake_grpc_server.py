@@ -0,0 +1,109 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Paging and error injection of the fake gRPC backend the benchmarks run against."""
+
+import asyncio
+
+import grpc
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from fake_grpc_server import FakeComplianceBackend, FakeServerThread, make_clients
+
+ORGANIZATION_ID = "123456789012"
+
+
+def serve(backend: FakeComplianceBackend, call):
+    fake = FakeServerThread(backend)
+    address = fake.start()
+
+    async def run():
+        # Clients are created inside the loop so their channels bind to it.
+        return await call(*make_clients(address))
+
+    try:
+        return asyncio.run(run())
+    finally:
+        fake.stop()
+
+
+async def list_pages(client, parent: str, page_size: int) -> list:
+    pages, token = [], ""
+    while True:
+        response = await client.list_cloud_controls(
+            request={"parent": parent, "page_size": page_size, "page_token": token}, retry=None
+        )
+        pages.append([control.name for control in response.cloud_controls])
+        token = response.next_page_token
+        if not token:
+            return pages
+
+
+@pytest.mark.parametrize(
+    "page_size, max_page_size, sizes",
+    [(0, 0, [10, 10, 5]), (8, 0, [8, 8, 8, 1]), (50, 7, [7, 7, 7, 4])],
+)
+def test_list_pages_cover_every_item(page_size, max_page_size, sizes):
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_cloud_controls=25, num_frameworks=1,
+        default_page_size=10, max_page_size=max_page_size,
+    )
+
+    async def call(config_client, _):
+        return await list_pages(config_client, backend.parent, page_size)
+
+    pages = serve(backend, call)
+    assert [len(page) for page in pages] == sizes
+    names = [name for page in pages for name in page]
+    assert sorted(names) == sorted(backend.cloud_controls)
+
+
+def test_injected_errors_use_the_configured_code():
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_cloud_controls=3, num_frameworks=1,
+        error_rate=1.0, error_code=grpc.StatusCode.RESOURCE_EXHAUSTED,
+    )
+    name = next(iter(backend.cloud_controls))
+
+    async def call(config_client, _):
+        for _ in range(3):
+            with pytest.raises(google_exceptions.ResourceExhausted):
+                await config_client.get_cloud_control(name=name, retry=None)
+
+    serve(backend, call)
+    assert backend.rpc_count == 3
+    assert backend.injected_errors == 3
+
+
+def test_partial_error_rate_fails_some_calls():
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_cloud_controls=3, num_frameworks=1,
+        error_rate=0.5, error_code=grpc.StatusCode.RESOURCE_EXHAUSTED, seed=7,
+    )
+    name = next(iter(backend.cloud_controls))
+
+    async def call(config_client, _):
+        failures = 0
+        for _ in range(40):
+            try:
+                await config_client.get_cloud_control(name=name, retry=None)
+            except google_exceptions.ResourceExhausted:
+                failures += 1
+        return failures
+
+    failures = serve(backend, call)
+    assert failures == backend.injected_errors
+    assert 0 < failures < 40
+    assert backend.rpc_count == 40
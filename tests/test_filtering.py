@@ -0,0 +1,152 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local filters, sorting, projection and the cloud control search index."""
+
+import pytest
+from google.cloud.cloudsecuritycompliance_v1.types import ListCloudControlsRequest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+BUCKET_CONTROL = {
+    "name": "cloudControls/bucket-public",
+    "displayName": "Block public bucket access",
+    "description": "Buckets must not be readable by allUsers.",
+    "severity": "CRITICAL",
+    "categories": ["CC_CATEGORY_DATA_SECURITY"],
+    "rules": [{"celExpression": {"resourceTypesValues": {"values": ["storage.googleapis.com/Bucket"]}}}],
+}
+VM_CONTROL = {
+    "name": "cloudControls/vm-secure-boot",
+    "displayName": "Require secure boot",
+    "description": "Instances should enable secure boot; unlike a bucket they run code.",
+    "severity": "HIGH",
+    "rules": [{"celExpression": {"resourceTypesValues": {"values": ["compute.googleapis.com/Instance"]}}}],
+}
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("severity=critical", [BUCKET_CONTROL]),
+        ("severity!=CRITICAL", [VM_CONTROL]),
+        ("displayName:secure", [VM_CONTROL]),
+        ("categories:*", [BUCKET_CONTROL]),
+        ("resource_type=storage.googleapis.com/Bucket", [BUCKET_CONTROL]),
+        ('severity=HIGH AND display_name:"secure boot"', [VM_CONTROL]),
+        ("severity=HIGH AND resource_type=storage.googleapis.com/Bucket", []),
+    ],
+)
+def test_local_filters(expression, expected):
+    predicate = server.make_local_predicate(expression)
+    assert [item for item in [BUCKET_CONTROL, VM_CONTROL] if predicate(item)] == expected
+
+
+def test_empty_filters_match_everything_and_bad_terms_are_rejected():
+    assert server.make_local_predicate("  ") is None
+    with pytest.raises(ValueError):
+        server.make_local_predicate("severity HIGH")
+
+
+def test_sort_items_by_several_keys():
+    items = [
+        {"name": "a", "severity": "HIGH"},
+        {"name": "b", "severity": "CRITICAL"},
+        {"name": "c", "severity": "HIGH"},
+    ]
+    ordered = server.sort_items(items, "severity desc, name")
+    assert [item["name"] for item in ordered] == ["a", "c", "b"]
+
+
+def test_project_fields_keeps_dotted_paths():
+    projected = server.project_fields(BUCKET_CONTROL, ["name", "resource_type", "rules.description"])
+    assert projected == {
+        "name": BUCKET_CONTROL["name"],
+        "rules": [{"celExpression": {"resourceTypesValues": {"values": ["storage.googleapis.com/Bucket"]}}}],
+    }
+
+
+def test_tokenize_keeps_dotted_names_whole_and_split():
+    assert server.tokenize("storage.googleapis.com/Bucket") == [
+        "storage.googleapis.com/bucket", "storage", "googleapis", "com", "bucket",
+    ]
+
+
+def test_search_requires_every_term_and_ranks_by_field_weight():
+    index = server.CloudControlSearchIndex([VM_CONTROL, BUCKET_CONTROL])
+
+    # "bucket" is in the bucket control's display name but only in the VM control's description.
+    assert [control["name"] for _, control in index.search("bucket")] == [BUCKET_CONTROL["name"], VM_CONTROL["name"]]
+    assert [control["name"] for _, control in index.search("secure boot")] == [VM_CONTROL["name"]]
+    assert index.search("secure bucket public") == []
+    assert index.search("bucket", predicate=server.make_local_predicate("severity=HIGH"))[0][1] is VM_CONTROL
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    return FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=200
+    )
+
+
+def critical_controls(backend) -> list:
+    return [name for name, control in backend.cloud_controls.items() if control.severity.name == "CRITICAL"]
+
+
+def test_filtered_streams_request_full_pages(fake_api, backend):
+    page_sizes = []
+
+    async def stream():
+        async def list_method(request):
+            page_sizes.append(request.page_size)
+            config_client = await server.get_config_client()
+            return await config_client.list_cloud_controls(request=request)
+
+        request = ListCloudControlsRequest(parent=PARENT, page_size=40)
+        predicate = server.make_local_predicate("severity=CRITICAL")
+        stream = server.ListStream(list_method, request, "cloud_controls", 15, server.proto_message_to_dict, predicate)
+        return [item["name"] async for item in stream], stream.next_page_token
+
+    names, token = fake_api(backend).run(stream)
+
+    assert names == critical_controls(backend)[:15]
+    assert page_sizes == [40, 40]
+    assert token == f"{server.RESUME_PAGE_TOKEN_PREFIX}5:40"
+
+
+def test_filtered_listing_resumes_without_gaps_or_repeats(fake_api, backend):
+    api = fake_api(backend)
+    names, token, calls = [], "", 0
+    while True:
+        page = api.run(
+            lambda: server.list_cloud_controls(
+                ORGANIZATION_ID, page_size=40, max_results=15, filter="severity=CRITICAL", page_token=token
+            )
+        )
+        names += [control["name"] for control in page["cloud_controls"]]
+        calls += 1
+        token = page["next_page_token"]
+        if not token:
+            break
+
+    assert names == critical_controls(backend)
+    assert calls == 4
+    # Each 40-item page is read at most twice: once to fill a call and once more to resume it.
+    assert backend.rpc_count <= 2 * 200 // 40
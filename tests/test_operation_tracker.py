@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Background tracking of long-running operations and the operation tools."""
+
+import pytest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = server.OperationTracker(initial_delay=0.01, max_delay=0.02)
+    monkeypatch.setattr(server, "operation_tracker", tracker)
+    return tracker
+
+
+@pytest.fixture
+def backend():
+    return FakeComplianceBackend(latency=0.0, num_frameworks=1, num_cloud_controls=2, operation_polls=2)
+
+
+def test_operation_is_polled_until_it_succeeds(fake_api, backend, tracker):
+    name = backend._new_operation("target").name
+
+    async def track_and_wait():
+        handle = tracker.track(name, "create_framework_deployment", "target")
+        return handle, await tracker.wait(name, timeout=5)
+
+    handle, status = fake_api(backend).run(track_and_wait)
+
+    assert handle["state"] == "RUNNING"
+    assert handle["kind"] == "create_framework_deployment"
+    assert status["state"] == "SUCCEEDED"
+    assert status["polls"] == 3
+    assert status["error"] is None
+
+
+def test_wait_returns_the_running_state_on_timeout(fake_api, backend, tracker):
+    backend.operation_polls = 1000
+    name = backend._new_operation("target").name
+
+    async def wait_briefly():
+        tracker.track(name)
+        return await tracker.wait(name, timeout=0.05)
+
+    assert fake_api(backend).run(wait_briefly)["state"] == "RUNNING"
+
+
+def test_unknown_operation_fails_tracking(fake_api, backend, tracker):
+    name = f"{backend.parent}/operations/missing"
+
+    async def track_and_wait():
+        tracker.track(name)
+        return await tracker.wait(name, timeout=5)
+
+    status = fake_api(backend).run(track_and_wait)
+
+    assert status["state"] == "FAILED"
+    assert "was not found" in status["error"]
+
+
+def test_get_operation_status_rejects_malformed_names_without_tracking(fake_api, backend, tracker):
+    result = fake_api(backend).run(lambda: server.get_operation_status("bogus"))
+
+    assert result["error"] == "Invalid Argument"
+    assert tracker.status("bogus") is None
+    assert backend.rpc_count == 0
+
+
+def test_get_operation_status_reports_unknown_operations(fake_api, backend, tracker):
+    name = f"{backend.parent}/operations/missing"
+
+    result = fake_api(backend).run(lambda: server.get_operation_status(name))
+
+    assert result["error"] == "Not Found"
+    assert tracker.status(name) is None
+
+
+def test_get_operation_status_resumes_untracked_operations(fake_api, backend, tracker):
+    backend.operation_polls = 0
+    name = backend._new_operation("target").name
+
+    async def resume_and_wait():
+        first = await server.get_operation_status(name)
+        return first, await server.wait_operation(name, timeout_seconds=5)
+
+    first, waited = fake_api(backend).run(resume_and_wait)
+
+    assert first["operation"]["operation_id"] == name
+    assert waited["done"] is True
+    assert waited["operation"]["state"] == "SUCCEEDED"
+
+
+def test_wait_operation_rejects_malformed_names(fake_api, backend, tracker):
+    result = fake_api(backend).run(lambda: server.wait_operation("organizations/1/operations/2"))
+
+    assert result["error"] == "Invalid Argument"
+    assert backend.rpc_count == 0
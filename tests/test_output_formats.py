@@ -0,0 +1,162 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact and table output of the list tools, and responses cut to a size budget."""
+
+import asyncio
+import os
+
+import pytest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    # Resumed listings re-read pages; keep the default rate limit from slowing the tests down.
+    monkeypatch.setattr(server, "api_policy", server.ApiCallPolicy(default_rate=1000.0))
+    return FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=23,
+        num_framework_deployments=12,
+    )
+
+
+def list_all(api, list_tool, items_key, **kwargs) -> tuple[list, int]:
+    """Follows next_page_token to the end; returns the items and how many responses were truncated."""
+    items, truncated, page_token = [], 0, ""
+    for _ in range(100):
+        result = api.run(lambda: list_tool(page_token=page_token, **kwargs))
+        assert result["count"] >= 1 or not result["next_page_token"]
+        page = result[items_key]
+        items.extend(page["rows"] if isinstance(page, dict) else page)
+        truncated += bool(result.get("truncated"))
+        page_token = result["next_page_token"]
+        if not page_token:
+            return items, truncated
+    raise AssertionError("The listing did not terminate.")
+
+
+def list_controls(**kwargs):
+    return server.list_cloud_controls(ORGANIZATION_ID, **kwargs)
+
+
+def test_compact_and_table_output_return_the_key_fields(fake_api, backend):
+    api = fake_api(backend)
+
+    compact = api.run(lambda: list_controls(output_format="compact", max_results=2))
+    table = api.run(lambda: list_controls(output_format="table", fields=["name", "severity"], max_results=2))
+
+    assert set(compact["cloud_controls"][0]) <= set(server.COMPACT_FIELDS[
+        "google.cloud.cloudsecuritycompliance.v1.CloudControl"
+    ])
+    assert "rules" not in compact["cloud_controls"][0]
+    assert table["cloud_controls"] == {
+        "columns": ["name", "severity"],
+        "rows": [
+            [f"{PARENT}/cloudControls/control-00000", "CRITICAL"],
+            [f"{PARENT}/cloudControls/control-00001", "HIGH"],
+        ],
+    }
+    assert api.run(lambda: list_controls(output_format="xml"))["error"] == "Invalid Argument"
+
+
+@pytest.mark.parametrize("output_format", ["full", "table"])
+def test_truncated_responses_resume_without_gaps_or_repeats(fake_api, backend, output_format):
+    api = fake_api(backend)
+    fields = ["name"] if output_format == "table" else None
+
+    everything = api.run(lambda: list_controls(page_size=10, max_results=1000))["cloud_controls"]
+    pieces, truncated = list_all(
+        api, list_controls, "cloud_controls",
+        page_size=10, max_results=1000, fields=fields, output_format=output_format,
+        max_response_bytes=2000 if output_format == "full" else 600,
+    )
+
+    if output_format == "table":
+        assert pieces == [[item["name"]] for item in everything]
+    else:
+        assert pieces == everything
+    assert truncated > 1
+
+
+def test_filtered_listing_resumes_mid_page_and_after_truncation(fake_api, backend):
+    api = fake_api(backend)
+    high = [f"{PARENT}/cloudControls/control-{i:05d}" for i in range(1, 23, 4)]
+
+    # max_results stops part-way through a page (a resume cursor from the page stream); the
+    # byte budget cuts responses further. Both cursors continue where the last response ended.
+    for budget in (0, 300):
+        items, _ = list_all(
+            api, list_controls, "cloud_controls",
+            page_size=10, max_results=2, filter="severity=HIGH", fields=["name"], max_response_bytes=budget,
+        )
+        assert [item["name"] for item in items] == high
+
+
+def test_each_truncated_response_is_sorted_on_its_own(fake_api, backend):
+    api = fake_api(backend)
+
+    result = api.run(lambda: list_controls(
+        page_size=23, max_results=23, order_by="displayName desc", fields=["displayName"], max_response_bytes=200
+    ))
+
+    assert result["truncated"] and 1 < result["count"] < 23
+    # The response holds the first controls listed, sorted.
+    names = [item["displayName"] for item in result["cloud_controls"]]
+    assert sorted(names, reverse=True) == names
+    assert set(names) == {f"Control {i}" for i in range(result["count"])}
+
+
+def test_truncated_snapshot_pages_resume(monkeypatch, fake_api, backend, tmp_path):
+    store = server.CatalogSnapshotStore(os.path.join(tmp_path, "catalog.sqlite3"), max_age=3600.0)
+    asyncio.run(store.save(PARENT, "cloud_controls", list(backend.cloud_controls.values())))
+    monkeypatch.setattr(server, "catalog_snapshot", store)
+    api = fake_api(backend)
+
+    first = api.run(lambda: list_controls(page_size=10, fields=["name"], max_response_bytes=400))
+    items, _ = list_all(api, list_controls, "cloud_controls", page_size=10, fields=["name"], max_response_bytes=400)
+
+    assert first["source"] == "snapshot" and first["truncated"]
+    assert first["next_page_token"].startswith(server.RESUME_PAGE_TOKEN_PREFIX)
+    assert [item["name"] for item in items] == list(backend.cloud_controls)
+
+
+def test_truncated_deployment_listings_resume(fake_api, backend):
+    api = fake_api(backend)
+
+    def list_deployments(**kwargs):
+        return server.list_framework_deployments(f"organizations/{ORGANIZATION_ID}", **kwargs)
+
+    items, truncated = list_all(
+        api, list_deployments, "framework_deployments",
+        page_size=5, max_results=5, output_format="compact", max_response_bytes=600,
+    )
+
+    assert [item["name"] for item in items] == list(backend.framework_deployments)
+    assert truncated
+
+
+def test_a_single_item_over_the_budget_is_still_returned():
+    result = {"items": [{"name": "a" * 100}, {"name": "b"}], "count": 2, "next_page_token": "next"}
+
+    shaped = server.shape_list_response(result, "items", "full", None, "", "resume:3:page", max_response_bytes=10)
+
+    assert shaped["items"] == [{"name": "a" * 100}]
+    assert shaped["next_page_token"] == "resume:4:page" and shaped["truncated"]
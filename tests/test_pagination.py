@@ -0,0 +1,79 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Paginated list tools and the page streams behind them."""
+
+
+import pytest
+from google.cloud.cloudsecuritycompliance_v1.types import ListCloudControlsRequest
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+PARENT = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    return FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=1, num_cloud_controls=23
+    )
+
+
+def stream_names(page_token: str, page_size: int, max_results):
+    async def call():
+        request = ListCloudControlsRequest(parent=PARENT, page_size=page_size, page_token=page_token)
+        list_method = (await server.get_config_client()).list_cloud_controls
+        stream = server.ListStream(list_method, request, "cloud_controls", max_results)
+        names = [control.name async for control in stream]
+        return names, stream.next_page_token, stream.pages_fetched
+
+    return call
+
+
+def test_stream_stops_on_a_page_boundary_and_resumes(fake_api, backend):
+    api = fake_api(backend)
+
+    first, token, pages = api.run(stream_names("", 5, 7))
+    rest, end_token, _ = api.run(stream_names(token, 5, None))
+
+    assert len(first) == 7
+    assert pages == 2
+    assert token
+    assert end_token == ""
+    assert first + rest == list(backend.cloud_controls)
+
+
+def test_list_tool_pages_through_the_whole_collection(fake_api, backend):
+    api = fake_api(backend)
+    names, token, calls = [], "", 0
+    while True:
+        page = api.run(lambda: server.list_cloud_controls(ORGANIZATION_ID, page_size=10, page_token=token))
+        names += [control["name"] for control in page["cloud_controls"]]
+        calls += 1
+        token = page["next_page_token"]
+        if not token:
+            break
+
+    assert names == list(backend.cloud_controls)
+    assert calls == 3
+
+
+def test_max_results_defaults_to_one_page_and_is_capped():
+    assert server.resolve_max_results(None, 25) == 25
+    assert server.resolve_max_results(-1, 25) == 25
+    assert server.resolve_max_results(5000, 25) == server.MAX_LIST_RESULTS
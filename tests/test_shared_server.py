@@ -0,0 +1,139 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The shared streamable HTTP server and the stdio relay in front of it."""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+
+import compliance_manager_mcp as server
+from bench_stdio import SERVER, StdioSession, is_error
+from fake_grpc_server import FakeComplianceBackend, FakeServerThread
+
+ORGANIZATION_ID = "123456789012"
+
+
+def free_port() -> int:
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        return listener.getsockname()[1]
+
+
+@pytest.fixture
+def emulator():
+    thread = FakeServerThread(FakeComplianceBackend(organization_id=ORGANIZATION_ID, latency=0.0, num_cloud_controls=5))
+    yield thread.start()
+    thread.stop()
+
+
+def server_env(emulator: str, **variables: str) -> dict:
+    return dict(os.environ, COMPLIANCE_MANAGER_EMULATOR_HOST=emulator, **variables)
+
+
+@pytest.fixture
+def shared_server(emulator):
+    port = free_port()
+    env = server_env(
+        emulator, COMPLIANCE_MANAGER_TRANSPORT="streamable-http", COMPLIANCE_MANAGER_PORT=str(port)
+    )
+    daemon = subprocess.Popen([sys.executable, SERVER], env=env, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}/mcp"
+    try:
+        for _ in range(200):
+            if asyncio.run(server.server_reachable(url, timeout=0.1)):
+                break
+            assert daemon.poll() is None, "The shared server exited."
+            asyncio.run(asyncio.sleep(0.05))
+        yield url
+    finally:
+        daemon.terminate()
+        daemon.wait(10)
+
+
+async def open_session(env: dict) -> StdioSession:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, SERVER,
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL, env=env,
+    )
+    session = StdioSession(process)
+    initialize = await session.request("initialize", {
+        "protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1.0.0"},
+    })
+    assert "result" in initialize, initialize
+    await session.notify("notifications/initialized", {})
+    return session
+
+
+async def call_tool(session: StdioSession, name: str, **arguments) -> dict:
+    response = await asyncio.wait_for(session.request("tools/call", {"name": name, "arguments": arguments}), 30)
+    assert not is_error(response), response
+    return response["result"]["structuredContent"]["result"]
+
+
+def test_server_reachable():
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        assert asyncio.run(server.server_reachable(f"http://127.0.0.1:{port}/mcp"))
+    assert not asyncio.run(server.server_reachable(f"http://127.0.0.1:{free_port()}/mcp", timeout=0.5))
+
+
+def test_relayed_sessions_share_the_server(emulator, shared_server):
+    env = server_env(emulator, COMPLIANCE_MANAGER_SERVER_URL=shared_server)
+
+    async def run():
+        first, second = await open_session(env), await open_session(env)
+        try:
+            result = await call_tool(
+                first, "get_cloud_control", organization_id=ORGANIZATION_ID, cloud_control_id="control-00001"
+            )
+            stats = await call_tool(second, "get_cache_stats")
+        finally:
+            await first.close()
+            await second.close()
+        return result, stats
+
+    result, stats = asyncio.run(run())
+
+    assert result["name"] == f"organizations/{ORGANIZATION_ID}/locations/global/cloudControls/control-00001"
+    # The second session sees the cache entry the first one's call created.
+    assert stats["catalog_cache"]["size"] >= 1
+
+
+def test_stdio_falls_back_to_serving_in_process(emulator):
+    env = server_env(emulator, COMPLIANCE_MANAGER_SERVER_URL=f"http://127.0.0.1:{free_port()}/mcp")
+
+    async def run():
+        session = await open_session(env)
+        try:
+            return await call_tool(session, "list_cloud_controls", organization_id=ORGANIZATION_ID, fields=["name"])
+        finally:
+            await session.close()
+
+    assert asyncio.run(run())["count"] == 5
+
+
+def test_unsupported_transport_is_rejected():
+    env = dict(os.environ, COMPLIANCE_MANAGER_TRANSPORT="websocket")
+
+    result = subprocess.run([sys.executable, SERVER], env=env, capture_output=True, text=True, timeout=60)
+
+    assert result.returncode != 0
+    assert "Unsupported COMPLIANCE_MANAGER_TRANSPORT 'websocket'" in result.stderr
@@ -0,0 +1,185 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The on-disk catalog snapshot and the warm-start reads served from it."""
+
+import asyncio
+import os
+
+import pytest
+from google.cloud.cloudsecuritycompliance_v1.types import CloudControl
+
+import compliance_manager_mcp as server
+from fake_grpc_server import FakeComplianceBackend
+
+ORGANIZATION_ID = "123456789012"
+SCOPE = f"organizations/{ORGANIZATION_ID}/locations/global"
+
+
+def control(control_id: str, revision: int = 1) -> CloudControl:
+    return CloudControl(name=f"{SCOPE}/cloudControls/{control_id}", major_revision_id=revision)
+
+
+async def load(store, kind: str = "cloud_controls"):
+    page = await store.load_page(SCOPE, kind, 0, 1000)
+    return None if page is None else page[0]
+
+
+async def settle(store) -> None:
+    # Background refreshes are cancelled when asyncio.run returns, so tests wait for them.
+    await asyncio.gather(*store._refresh_tasks.values())
+
+
+@pytest.fixture
+def store(tmp_path):
+    return server.CatalogSnapshotStore(os.path.join(tmp_path, "catalog.sqlite3"), max_age=60.0)
+
+
+@pytest.fixture
+def snapshot(monkeypatch, store):
+    monkeypatch.setattr(server, "catalog_snapshot", store)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+    return store
+
+
+def test_load_returns_none_until_a_snapshot_is_saved(store):
+    assert asyncio.run(load(store)) is None
+
+
+def test_save_and_load_round_trip(store):
+    async def round_trip():
+        first = await store.save(SCOPE, "cloud_controls", [control("a"), control("b")])
+        loaded = await load(store)
+        return first, loaded, await store.get(SCOPE, "cloud_controls", control("b").name)
+
+    changed, loaded, single = asyncio.run(round_trip())
+
+    assert changed == 2
+    assert [item.name for item in loaded] == [control("a").name, control("b").name]
+    assert single == control("b")
+
+
+def test_save_only_rewrites_changed_items(store):
+    async def saves():
+        await store.save(SCOPE, "cloud_controls", [control("a"), control("b")])
+        return await store.save(SCOPE, "cloud_controls", [control("a"), control("b", revision=2), control("c")])
+
+    # b changed revision and c is new; a is untouched.
+    assert asyncio.run(saves()) == 2
+
+
+def test_save_drops_items_missing_from_the_listing(store):
+    async def saves():
+        await store.save(SCOPE, "cloud_controls", [control("a"), control("b")])
+        await store.save(SCOPE, "cloud_controls", [control("a")])
+        return await load(store)
+
+    assert [item.name for item in asyncio.run(saves())] == [control("a").name]
+
+
+def test_upsert_keeps_the_rest_of_the_snapshot(store):
+    async def writes():
+        await store.save(SCOPE, "cloud_controls", [control("a")])
+        await store.upsert(SCOPE, "cloud_controls", [control("b")])
+        return await load(store)
+
+    assert len(asyncio.run(writes())) == 2
+
+
+def test_stale_snapshots_are_refreshed_in_the_background(store):
+    store.max_age = 0.0
+    fetched = []
+
+    async def fetch_all():
+        fetched.append(1)
+        return [control("fresh")]
+
+    async def refresh():
+        await store.save(SCOPE, "cloud_controls", [control("old")])
+        await store.refresh_if_stale(SCOPE, "cloud_controls", fetch_all)
+        await settle(store)
+        return await load(store)
+
+    assert [item.name for item in asyncio.run(refresh())] == [control("fresh").name]
+    assert fetched == [1]
+
+
+def test_load_page_reports_the_total(store):
+    async def pages():
+        await store.save(SCOPE, "cloud_controls", [control(f"c{i}") for i in range(5)])
+        return await store.load_page(SCOPE, "cloud_controls", 3, 10)
+
+    items, total = asyncio.run(pages())
+
+    assert [item.name for item in items] == [control("c3").name, control("c4").name]
+    assert total == 5
+
+
+def list_and_settle(organization_id: str, **kwargs):
+    async def call():
+        result = await server.list_frameworks(organization_id, **kwargs)
+        await settle(server.catalog_snapshot)
+        return result
+
+    return call
+
+
+def test_new_sessions_list_from_the_snapshot(fake_api, snapshot):
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=3, num_cloud_controls=3
+    )
+    api = fake_api(backend)
+
+    first = api.run(list_and_settle(ORGANIZATION_ID))
+    rpcs = backend.rpc_count
+    server.catalog_cache.invalidate()
+    second = api.run(list_and_settle(ORGANIZATION_ID))
+
+    assert first["source"] == "api"
+    assert second["source"] == "snapshot"
+    assert second["frameworks"] == first["frameworks"]
+    assert backend.rpc_count == rpcs
+
+
+def test_snapshot_pages_resume_with_snapshot_tokens(fake_api, snapshot):
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=5, num_cloud_controls=3
+    )
+    api = fake_api(backend)
+    api.run(list_and_settle(ORGANIZATION_ID))
+
+    names, token, sources = [], "", []
+    while True:
+        page = api.run(list_and_settle(ORGANIZATION_ID, page_size=2, page_token=token))
+        names += [framework["name"] for framework in page["frameworks"]]
+        sources.append(page["source"])
+        token = page["next_page_token"]
+        if not token:
+            break
+        assert token.startswith(server.SNAPSHOT_PAGE_TOKEN_PREFIX)
+
+    assert names == sorted(backend.frameworks)
+    assert sources == ["snapshot"] * 3
+
+
+def test_snapshot_tokens_fail_once_the_snapshot_is_gone(fake_api, monkeypatch):
+    backend = FakeComplianceBackend(
+        organization_id=ORGANIZATION_ID, latency=0.0, num_frameworks=5, num_cloud_controls=3
+    )
+    monkeypatch.setattr(server, "catalog_snapshot", None)
+    monkeypatch.setattr(server, "catalog_cache", server.TTLCache())
+
+    result = fake_api(backend).run(lambda: server.list_frameworks(ORGANIZATION_ID, page_token="snapshot:2"))
+
+    assert "snapshot" in result["details"]